@@ -1,10 +1,26 @@
 # !/usr/bin/env python
 
+import mmap
 import os
-import re
+from collections import deque
+from itertools import repeat
+
+from aoc.inputs import input_source, is_splittable, iter_lines, open_input, split_file
+from aoc.optional import numpy_available
 
 # --- Day 1: Trebuchet?! ---
 
+# The input is read lazily line by line while it is parsed
+INPUT_MODE = "lines"
+
+# Input files from this size on are split into chunks that are scanned in parallel
+PARALLEL_THRESHOLD = 1 << 24
+
+# Number of chunks per worker process, so that workers finishing early can take over the rest
+CHUNKS_PER_WORKER = 4
+
+# Number of bytes of a chunk decoded at once
+BLOCK_SIZE = 1 << 20
 
 SAMPLE_INPUT_1 = """
 1abc2
@@ -22,54 +38,301 @@ zoneight234
 7pqrstsixteen
 """
 
-DIGITS = {
-    "one": "o1e",  # Keep leading and trailing characters to handle overlaps
-    "two": "t2o",
-    "three": "t3e",
-    "four": "f4r",
-    "five": "f5e",
-    "six": "s6x",
-    "seven": "s7n",
-    "eight": "e8t",
-    "nine": "n9e"
+DIGIT_WORDS = {
+    "one": 1,
+    "two": 2,
+    "three": 3,
+    "four": 4,
+    "five": 5,
+    "six": 6,
+    "seven": 7,
+    "eight": 8,
+    "nine": 9,
 }
 
-def extract_numbers(line):
-    # Search for the first and last digit number with a regex
-    first_number = re.search(r"\d", line)
-    second_number = re.search(r"\d", line[::-1])
 
-    # Combine the two digit numbers
-    line_number = int(first_number.group(0) + second_number.group(0))
+def build_automaton(patterns):
+    """
+    Builds a deterministic Aho-Corasick automaton that finds the patterns in a single pass over a text.
+
+    Args:
+    patterns (dict): Mapping of every pattern to the value it stands for.
+
+    Returns:
+    tuple: The transitions of every state as a dict from character to next state, where missing characters
+    lead back to the initial state 0, and the value of the pattern ending in every state, or None.
+    """
+    transitions, values = [{}], [None]
+    for pattern, value in patterns.items():
+        state = 0
+        for char in pattern:
+            if char not in transitions[state]:
+                transitions[state][char] = len(transitions)
+                transitions.append({})
+                values.append(None)
+            state = transitions[state][char]
+        values[state] = value
+
+    # Follow the failure links breadth first, so that the transitions of shorter prefixes are complete
+    # before they are copied into longer ones
+    failures = [0] * len(transitions)
+    queue = deque(transitions[0].values())
+    while queue:
+        state = queue.popleft()
+        failure = failures[state]
+        for char, next_state in transitions[state].items():
+            if state:
+                failures[next_state] = transitions[failure].get(char, 0)
+            queue.append(next_state)
+        if values[state] is None:
+            values[state] = values[failure]
+        for char, next_state in transitions[failure].items():
+            transitions[state].setdefault(char, next_state)
+    return transitions, values
+
+
+# The digits count in both parts, the spelled out digits only in part 2. The backward automaton matches the
+# reversed patterns while a line is read from its end.
+_DIGIT_CHARS = {str(digit): digit for digit in range(10)}
+_FORWARD = build_automaton(_DIGIT_CHARS | DIGIT_WORDS)
+_BACKWARD = build_automaton(_DIGIT_CHARS | {word[::-1]: digit for word, digit in DIGIT_WORDS.items()})
+
+
+def _scan(characters, automaton, digits):
+    # The first digit and the first digit or spelled out digit matched by the automaton, or None
+    transitions, pattern_values = automaton
+    digit = word_or_digit = None
+    state = 0
+    for char in characters:
+        state = transitions[state].get(char, 0)
+        value = pattern_values[state]
+        if value is not None:
+            if word_or_digit is None:
+                word_or_digit = value
+                if not digits:
+                    break
+            # Spelled out digits end in a letter, which sorts after every digit
+            if char <= "9":
+                digit = value
+                break
+    return digit, word_or_digit
+
+
+def scan_line(line, digits=True):
+    """
+    Finds the calibration values of a line for both parts.
+
+    The line is scanned from the start until its first digit and from the end until its last digit, so
+    every character is looked at no more than once and the line is never copied.
+
+    Args:
+    line (str): A calibration line.
+    digits (bool): Whether to find the value of part 1, otherwise the scans stop at the first digit or
+    spelled out digit from either end and the value of part 1 is None.
+
+    Returns:
+    tuple: The calibration value of the line in part 1, or None if it has no digit, and in part 2, or None if
+    it has neither digits nor spelled out digits.
+    """
+    first_digit, first_value = _scan(line, _FORWARD, digits)
+    if first_value is None:
+        return None, None
+    last_digit, last_value = _scan(reversed(line), _BACKWARD, digits)
+    if first_digit is None:
+        return None, 10 * first_value + last_value
+    return 10 * first_digit + last_digit, 10 * first_value + last_value
+
+
+def sum_calibration_values(lines, digits=True):
+    """
+    Sums the calibration values of lines for both parts.
+
+    Args:
+    lines (iterable of str): The calibration lines, empty lines are skipped.
+    digits (bool): Whether to sum the values of part 1, which is left to sum_digit_values() otherwise.
+
+    Returns:
+    tuple: The sum of the calibration values of part 1, or None if a line has no digit or digits is false,
+    and of part 2.
+    """
+    total1, total2 = (0 if digits else None), 0
+    for line in lines:
+        if not line:
+            continue
+        value1, value2 = scan_line(line, digits)
+        if value1 is None or total1 is None:
+            total1 = None
+        else:
+            total1 += value1
+        total2 += value2 or 0
+    return total1, total2
+
+
+def sum_digit_values(buffer):
+    """
+    Sums the calibration values of part 1 of complete lines with vectorized operations over their bytes.
+
+    Needs NumPy, see aoc.optional.numpy_available().
+
+    Args:
+    buffer (bytes): The lines as ASCII bytes, separated by newlines.
+
+    Returns:
+    int: The sum of the calibration values of part 1, or None if a line that is not empty has no digit.
+    """
+    import numpy  # pylint: disable=import-outside-toplevel
+
+    data = numpy.frombuffer(buffer, dtype=numpy.uint8)
+    newlines = numpy.flatnonzero(data == ord("\n"))
+    digit_positions = numpy.flatnonzero((data >= ord("0")) & (data <= ord("9")))
+
+    # Lines that are not empty, apart from a carriage return at their end
+    ends = numpy.append(newlines, len(data))
+    starts = numpy.append(0, newlines + 1)
+    lengths = ends - starts
+    lengths[lengths > 0] -= data[ends[lengths > 0] - 1] == ord("\r")
+    content_lines = numpy.count_nonzero(lengths)
+
+    # The digits are in order, so the first and last digit of every line border the runs of equal line numbers
+    digit_lines = numpy.searchsorted(newlines, digit_positions)
+    firsts = numpy.flatnonzero(numpy.diff(digit_lines, prepend=-1))
+    if len(firsts) < content_lines:
+        return None
+    if firsts.size == 0:
+        return 0
+    lasts = numpy.append(firsts[1:], len(digit_positions)) - 1
+
+    digit_values = data[digit_positions].astype(numpy.int64) - ord("0")
+    return int(10 * digit_values[firsts].sum() + digit_values[lasts].sum())
+
+
+def add_sums(sums, other_sums):
+    # Adds the calibration sums of two parts of a document, where a missing sum of part 1 stays missing
+    (total1, total2), (other_total1, other_total2) = sums, other_sums
+    total1 = None if total1 is None or other_total1 is None else total1 + other_total1
+    return total1, total2 + other_total2
+
+
+def parse_input(input_data):
+    """
+    Scans the calibration document once for the answers of both parts.
+
+    Args:
+    input_data (str or iterable of str): Multiline string or iterable of calibration lines.
+
+    Returns:
+    tuple: The sum of the calibration values of part 1, or None if a line has no digit, and of part 2.
+    """
+    return sum_calibration_values(iter_lines(input_data))
+
+
+def scan_chunk(path, start, end):
+    """
+    Sums the calibration values of the lines in a byte range of a file, mapping only that range.
+
+    Args:
+    path (str or Path): The input file.
+    start (int): Offset of the first byte of the range, at the start of a line.
+    end (int): Offset behind the last byte of the range, at the end of a line or of the file.
+
+    Returns:
+    tuple: The sums of the calibration values of the range, as returned by parse_input().
+    """
+    # Mappings have to start at a multiple of the allocation granularity
+    offset = start - start % mmap.ALLOCATIONGRANULARITY
+    with open(path, "rb") as input_file:
+        with mmap.mmap(input_file.fileno(), end - offset, access=mmap.ACCESS_READ, offset=offset) as mapped:
+            sums = (0, 0)
+            position, stop = start - offset, end - offset
+            while position < stop:
+                block_end = stop
+                if position + BLOCK_SIZE < stop:
+                    block_end = mapped.find(b"\n", position + BLOCK_SIZE, stop) + 1 or stop
+                block = mapped[position:block_end]
+                if numpy_available():
+                    # Part 1 is summed over the bytes at once, leaving only the spelled out digits to the scans
+                    _, total2 = sum_calibration_values(block.decode().splitlines(), digits=False)
+                    block_sums = (sum_digit_values(block), total2)
+                else:
+                    block_sums = sum_calibration_values(block.decode().splitlines())
+                sums = add_sums(sums, block_sums)
+                position = block_end
+    return sums
+
+
+def parse_file(source, workers=None):
+    """
+    Scans a calibration document, splitting large files into chunks that are scanned in parallel.
+
+    Every worker process maps only its own chunks of the file, and the sums of the chunks are added up
+    at the end. Standard input, compressed files and files below PARALLEL_THRESHOLD are scanned as a
+    stream by parse_input() instead.
+
+    Args:
+    source (str or Path): Path to the input file, or STDIN for standard input.
+    workers (int): Number of worker processes, defaults to the number of CPUs.
+
+    Returns:
+    tuple: The sums of the calibration values, as returned by parse_input().
+    """
+    if not is_splittable(source, PARALLEL_THRESHOLD):
+        with open_input(source, INPUT_MODE) as input_data:
+            return parse_input(input_data)
+
+    workers = workers or os.cpu_count()
+    ranges = split_file(source, workers * CHUNKS_PER_WORKER)
+    if workers == 1:
+        partial_sums = [scan_chunk(source, start, end) for start, end in ranges]
+    else:
+        # Imported here, as only large inputs are worth the start of a process pool
+        from concurrent.futures import ProcessPoolExecutor  # pylint: disable=import-outside-toplevel
+
+        starts, ends = zip(*ranges)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            partial_sums = list(executor.map(scan_chunk, repeat(source), starts, ends))
+
+    sums = (0, 0)
+    for chunk_sums in partial_sums:
+        sums = add_sums(sums, chunk_sums)
+    return sums
+
+
+def part1(calibration_sums):
+    """
+    Sums the calibration values formed by the first and last digit of each line.
+
+    Args:
+    calibration_sums (tuple): The sums of the calibration values from parse_input().
+
+    Returns:
+    int: The sum of all calibration values.
+    """
+    total, _ = calibration_sums
+    if total is None:
+        raise ValueError("Every calibration line needs a digit")
+    return total
+
+
+def part2(calibration_sums):
+    """
+    Sums the calibration values when spelled out digits also count as digits.
+
+    Args:
+    calibration_sums (tuple): The sums of the calibration values from parse_input().
 
-    return line_number
+    Returns:
+    int: The sum of all calibration values.
+    """
+    _, total = calibration_sums
+    return total
 
 
 def main():
-    # Read the input file
-    dir_path = os.path.dirname(os.path.realpath(__file__))
-    input_file = open(dir_path + "/input.txt", "r")
-    input_data = input_file.read().splitlines()
-
-    # Initialize the sums
-    sum_0 = 0
-    sum_1 = 0
-
-    # Loop through each line
-    for line in input_data:
-        # ------- First Part -------
-        sum_0 += extract_numbers(line)
-
-        # ------- Second Part -------
-        # Replace number words with digits
-        for word, digit in DIGITS.items():
-            line = line.replace(word, digit)
-
-        sum_1 += extract_numbers(line)
-
-    # Print the result of first part
-    print("Part 1:", sum_0)
-    print("Part 2:", sum_1)
+    # Scan the input file given on the command line, "-" for standard input, or input.txt once for both
+    # parts, in parallel chunks if it is large
+    calibration_sums = parse_file(input_source(__file__))
+    print("Part 1:", part1(calibration_sums))
+    print("Part 2:", part2(calibration_sums))
 
 
 if __name__ == "__main__":
@@ -2,10 +2,25 @@
 
 # --- Day 2: Cube Conundrum ---
 
-import os
-import re
 import operator
-from functools import reduce
+from array import array
+from bisect import bisect_right
+from itertools import compress, repeat
+
+from aoc.inputs import input_source, iter_lines, open_input
+
+# The input is read lazily line by line while it is parsed
+INPUT_MODE = "lines"
+
+# Columns of the game table, one value per game
+GAME_COLUMNS = ("game_id", "max_red", "max_green", "max_blue")
+
+# Number of cubes of every color in the bag of part 1, in the order of the color columns
+CUBE_LIMITS = (12, 13, 14)
+
+# Largest number of cells of the tables of a limit index, which has one cell per combination of the
+# distinct maxima of the three colors
+MAX_INDEX_CELLS = 1 << 24
 
 SAMPLE_INPUT_1 = """
 Game 1: 3 blue, 4 red; 1 red, 2 green, 6 blue; 2 green
@@ -24,46 +39,153 @@ Game 5: 6 red, 1 blue, 3 green; 2 blue, 1 red, 2 green
 """
 
 
-# Function to find the maximum number of cubes of a specific color in a game
-def get_max_color(regex, game):
-    matches = re.findall(regex, game)
-    return max(int(match) for match in matches) if matches else 0
-
-def main():
-    # Read the input file
-    dir_path = os.path.dirname(os.path.realpath(__file__))
-    input_file = open(dir_path + "/input.txt", "r")
-    input_data = input_file.read()
-
-    # Extract game information using regex
-    games_info = re.findall(r"Game (\d+): (.*)", input_data)
-
-    # Process each game to find the maximum number of each color cube shown
-    games = {
-        int(game_id): (
-            get_max_color(r"(\d+) red", game_data),
-            get_max_color(r"(\d+) green", game_data),
-            get_max_color(r"(\d+) blue", game_data),
-        )
-        for game_id, game_data in games_info
-    }
-
-    # Calculate the sum of IDs for games that are possible with the given cube limits
-    possible_game_ids_sum = sum(
-        game_id for game_id, (max_red, max_green, max_blue) in games.items()
-        if max_red <= 12 and max_green <= 13 and max_blue <= 14
-    )
-
-    print("Part 1:", possible_game_ids_sum)
+def parse_input(input_data):
+    """
+    Parses the game records once for both parts into a columnar game table.
+
+    Every record is split into its draws in a single pass, and the game ID and the maximum number of cubes
+    shown per color are appended to one typed array per column.
+
+    Args:
+    input_data (str or iterable of str): Multiline string or iterable of game records.
+
+    Returns:
+    tuple of memoryview: The read-only columns of GAME_COLUMNS, each holding one 64-bit integer per game.
+    """
+    game_ids, max_reds, max_greens, max_blues = (array("q") for _ in GAME_COLUMNS)
+    for line in iter_lines(input_data):
+        game, _, draws = line.partition(": ")
+        if not game.startswith("Game "):
+            continue
+
+        # Draws within a set are separated like the sets themselves, only the maximum per color matters
+        max_red = max_green = max_blue = 0
+        for draw in draws.replace(";", ",").split(", "):
+            count, _, color = draw.partition(" ")
+            count = int(count)
+            # Plain comparisons, as calling max() for every draw costs a fifth of the parsing time
+            # pylint: disable=consider-using-max-builtin
+            if color == "red":
+                if count > max_red:
+                    max_red = count
+            elif color == "green":
+                if count > max_green:
+                    max_green = count
+            elif color == "blue" and count > max_blue:
+                max_blue = count
+
+        game_ids.append(int(game[5:]))
+        max_reds.append(max_red)
+        max_greens.append(max_green)
+        max_blues.append(max_blue)
+
+    return tuple(memoryview(column).toreadonly() for column in (game_ids, max_reds, max_greens, max_blues))
+
+
+def part1(games):
+    """
+    Calculates the sum of IDs for games that are possible with the given cube limits.
+
+    Args:
+    games (tuple of memoryview): The game table from parse_input().
+
+    Returns:
+    int: The sum of the IDs of all possible games.
+    """
+    game_ids, *max_colors = games
+    # Compare whole columns against their limit and select the IDs of the games within all limits
+    within_limits = (map(operator.le, column, repeat(limit)) for column, limit in zip(max_colors, CUBE_LIMITS))
+    return sum(compress(game_ids, map(all, zip(*within_limits))))
+
+
+def part2(games):
+    """
+    Calculates the sum of the powers of the minimum set of cubes for each game.
+
+    Args:
+    games (tuple of memoryview): The game table from parse_input().
+
+    Returns:
+    int: The total power of all games.
+    """
+    _, max_reds, max_greens, max_blues = games
+    # The power of a game is the product of its maximum number of cubes per color
+    return sum(map(operator.mul, map(operator.mul, max_reds, max_greens), max_blues))
+
+
+def build_limit_index(games):
+    """
+    Builds an index that answers which games are possible under any cube limits without a scan.
+
+    The maxima of every color are mapped to their rank among the distinct maxima of that color, and the
+    IDs and powers of the games are added up in a three-dimensional table over the ranks. Prefix sums
+    along all three axes then turn every cell into the sum over all games whose maxima are at most the
+    maxima of the cell, so a query only has to find the cell of its limits.
+
+    Usage:
+        index = build_limit_index(parse_input(SAMPLE_INPUT_1))
+        query_limits(index, 12, 13, 14)  # (8, 96): the answer of part 1 and the total power of those games
+
+    Args:
+    games (tuple of memoryview): The game table from parse_input().
+
+    Returns:
+    tuple: The sorted distinct maxima of every color, and the prefix sums of the IDs and of the powers as
+    flat tuples in row-major order over the ranks, where rank 0 stands below the smallest maximum.
+    """
+    _, *max_colors = games
+    axes = tuple(tuple(sorted(set(column))) for column in max_colors)
+    red_size, green_size, blue_size = (len(axis) + 1 for axis in axes)
+    cells = red_size * green_size * blue_size
+    if cells > MAX_INDEX_CELLS:
+        raise ValueError(f"The games have too many distinct maxima to index, {cells} cells would be needed")
+
+    id_sums, power_sums = [0] * cells, [0] * cells
+    red_ranks, green_ranks, blue_ranks = ({value: rank for rank, value in enumerate(axis, 1)} for axis in axes)
+    for game_id, max_red, max_green, max_blue in zip(*games):
+        cell = (red_ranks[max_red] * green_size + green_ranks[max_green]) * blue_size + blue_ranks[max_blue]
+        id_sums[cell] += game_id
+        power_sums[cell] += max_red * max_green * max_blue
+
+    # Accumulate along the blue, green and red axis in turn, the distance between neighbours on each axis
+    for stride, axis_size in ((1, blue_size), (blue_size, green_size), (green_size * blue_size, red_size)):
+        for cell in range(cells):
+            if cell // stride % axis_size:
+                id_sums[cell] += id_sums[cell - stride]
+                power_sums[cell] += power_sums[cell - stride]
+
+    return axes, tuple(id_sums), tuple(power_sums)
+
+
+def query_limits(index, red, green, blue):
+    """
+    Finds the games that are possible with the given cubes in the bag.
+
+    Args:
+    index (tuple): The limit index from build_limit_index().
+    red (int): The number of red cubes in the bag.
+    green (int): The number of green cubes in the bag.
+    blue (int): The number of blue cubes in the bag.
+
+    Returns:
+    tuple: The sum of the IDs and the sum of the powers of all possible games.
+    """
+    (red_axis, green_axis, blue_axis), id_sums, power_sums = index
+    # The rank of the largest maximum within every limit, 0 if none is
+    red_rank = bisect_right(red_axis, red)
+    green_rank = bisect_right(green_axis, green)
+    blue_rank = bisect_right(blue_axis, blue)
+    cell = (red_rank * (len(green_axis) + 1) + green_rank) * (len(blue_axis) + 1) + blue_rank
+    return id_sums[cell], power_sums[cell]
 
-    # Calculate the power of the minimum set of cubes for each game
-    powers = [reduce(operator.mul, max_colors) for max_colors in games.values()]
-
-    # Sum the powers to find the total
-    total_power = sum(powers)
-
-    print("Part 2:", total_power)
 
+def main():
+    # Read the input file given on the command line, "-" for standard input, or input.txt
+    with open_input(input_source(__file__), INPUT_MODE) as input_data:
+        # Parse the input once for both parts
+        games = parse_input(input_data)
+    print("Part 1:", part1(games))
+    print("Part 2:", part2(games))
 
 
 if __name__ == "__main__":
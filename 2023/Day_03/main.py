@@ -2,10 +2,23 @@
 
 # --- Day 3: Gear Ratios ---
 
+import mmap
 import os
 import re
-from collections import defaultdict
-from math import prod
+from array import array
+from collections import deque
+from itertools import accumulate, chain, repeat
+
+from aoc.inputs import input_source, is_splittable, iter_lines, open_input, split_file
+
+# The input is read lazily row by row, and only three rows are held at a time
+INPUT_MODE = "lines"
+
+# Input files from this size on are split into bands of rows that are scanned in parallel
+PARALLEL_THRESHOLD = 1 << 24
+
+# Number of bands per worker process, so that workers finishing early can take over the rest
+BANDS_PER_WORKER = 4
 
 SAMPLE_INPUT_1 = """
 467..114..
@@ -33,83 +46,304 @@ SAMPLE_INPUT_2 = """
 .664.598..
 """
 
-# Regular expressions to find numbers and symbols in the schematic
-NUMBER_PATTERN = re.compile(r"\d+")
-SYMBOL_PATTERN = re.compile(r"[^\s\d.]")
+# Regular expression to find the numbers in the rows of the schematic
+NUMBER_PATTERN = re.compile(rb"\d+")
+
+# Translation table marking every symbol, any byte but whitespace, digits and ".", with 1 and all others with 0
+SYMBOL_BITS = bytes(0 if byte in b" \t\n\r\f\v0123456789." else 1 for byte in range(256))
+
+
+def build_symbol_index(row):
+    """
+    Indexes where the symbols of a row are, so that the symbols in a span of the row can be counted in
+    constant time.
+
+    Args:
+    row (bytes): A row of the schematic.
+
+    Returns:
+    tuple: The symbol bitmap, a 1 for every column holding a symbol and a 0 otherwise, and the number of
+    symbols before every column, with one more entry than columns. The symbols from column a up to column b
+    are counted by counts[b] - counts[a].
+    """
+    # Translating every cell to its bit and summing up the bits both run in C
+    symbol_bitmap = row.translate(SYMBOL_BITS)
+    return symbol_bitmap, array("q", accumulate(symbol_bitmap, initial=0))
+
+
+def scan_numbers(row, adjacent_rows, symbol_numbers):
+    """
+    Finds the part numbers of a row and records them with the symbols next to them.
+
+    Args:
+    row (bytes): The row whose numbers are looked at.
+    adjacent_rows (list of tuple): The row itself and the rows above and below it that exist, each as its
+    index, its symbol bitmap and its symbol counts from build_symbol_index().
+    symbol_numbers (dict): Map of row index to a map of column to the numbers next to the symbol there,
+    which the numbers of the row are added to.
+
+    Returns:
+    int: The sum of the part numbers of the row, each counted once per symbol next to it.
+    """
+    part_number_sum = 0
+    for number_match in NUMBER_PATTERN.finditer(row):
+        # The span of the number extended by the diagonal columns, clipped to the row
+        span_start = max(number_match.start() - 1, 0)
+        span_end = min(number_match.end() + 1, len(row))
+
+        symbols = 0
+        for _, _, symbol_counts in adjacent_rows:
+            symbols += symbol_counts[span_end] - symbol_counts[span_start]
+        if not symbols:
+            continue
+
+        number = int(number_match.group())
+        part_number_sum += number * symbols
+        # Only numbers next to a symbol look up which symbols they are next to
+        for y, symbol_bitmap, _ in adjacent_rows:
+            symbol = symbol_bitmap.find(1, span_start, span_end)
+            while symbol != -1:
+                symbol_numbers.setdefault(y, {}).setdefault(symbol, []).append(number)
+                symbol = symbol_bitmap.find(1, symbol + 1, span_end)
+    return part_number_sum
+
+
+def sum_gear_ratios(numbers_per_symbol):
+    """
+    Adds up the gear ratios of symbols.
+
+    Args:
+    numbers_per_symbol (iterable of list): The numbers next to every symbol.
+
+    Returns:
+    int: The total of the gear ratios of the symbols next to exactly two numbers.
+    """
+    return sum(numbers[0] * numbers[1] for numbers in numbers_per_symbol if len(numbers) == 2)
+
+
+def scan_band(rows, above=None, below=None):
+    """
+    Finds the part numbers and the gear ratios of a band of rows in one pass.
+
+    Only a window of three rows is held, so the memory needed grows with the width of the schematic but
+    not its height. The numbers of a row are looked at once the row below it has been read, and the
+    symbols of a row are complete, and dropped, once the numbers of the row below them have been.
+
+    The symbols on the rows at the borders of the band can also be next to numbers of the neighbouring
+    bands, so their numbers are returned to be merged with those of the other bands instead.
+
+    Args:
+    rows (iterable of tuple): The rows of the band from top to bottom, each as a key that identifies the
+    row across bands and its bytes.
+    above (tuple): The key and bytes of the row above the band, if any. Its numbers belong to another band.
+    below (tuple): The key and bytes of the row below the band, if any. Its numbers belong to another band.
+
+    Returns:
+    tuple: The sum of the part numbers of the band, each counted once per symbol next to it, the total of
+    the gear ratios of the symbols that are only next to numbers of the band, and a map of the key of the
+    row and the column of every other symbol next to a number of the band to those numbers.
+    """
+    part_number_sum = gear_ratio_total = 0
+    # Map of the index of a row within the band to a map of column to the numbers next to the symbol there
+    symbol_numbers = {}
+    row_keys = {}
+    # The symbol indices of the last three rows read, each with the index of its row
+    window = deque(maxlen=3)
+    numbers_row = None
+    row, in_band = None, False
+    # The symbols of the first row of the band may be next to numbers of the band above
+    first_complete_y = 2 if above is not None else 1
+
+    rows = chain(
+        [(*above, False)] if above is not None else [],
+        ((key, row, True) for key, row in rows),
+        [(*below, False)] if below is not None else [],
+    )
+    # The row after the last one is None, so that the numbers of the last row are looked at as well
+    for y, entry in enumerate(chain(rows, [None])):
+        if entry is not None:
+            row_keys[y], row, in_band = entry
+            symbol_index = build_symbol_index(row)
+            # Rows without symbols, like empty rows, are next to no number
+            if symbol_index[1][-1]:
+                window.append((y, *symbol_index))
+        if numbers_row is not None:
+            # The rows next to the previous row are complete now
+            adjacent_rows = [symbol_index for symbol_index in window if symbol_index[0] >= y - 2]
+            part_number_sum += scan_numbers(numbers_row, adjacent_rows, symbol_numbers)
+            if entry is not None and y - 2 >= first_complete_y:
+                gear_ratio_total += sum_gear_ratios(symbol_numbers.pop(y - 2, {}).values())
+                del row_keys[y - 2]
+        numbers_row = row if entry is not None and in_band else None
+
+    border_symbols = {
+        (row_keys[y], column): numbers for y, columns in symbol_numbers.items() for column, numbers in columns.items()
+    }
+    return part_number_sum, gear_ratio_total, border_symbols
+
+
+def merge_bands(band_results):
+    """
+    Merges the results of bands that together cover the schematic.
+
+    Args:
+    band_results (iterable of tuple): The results of scan_band() for every band.
+
+    Returns:
+    tuple: The sum of the part numbers and the total of the gear ratios of the schematic.
+    """
+    part_number_sum = gear_ratio_total = 0
+    border_symbols = {}
+    for band_part_number_sum, band_gear_ratio_total, band_border_symbols in band_results:
+        part_number_sum += band_part_number_sum
+        gear_ratio_total += band_gear_ratio_total
+        # Symbols on the border of two bands collect the numbers of both
+        for symbol, numbers in band_border_symbols.items():
+            border_symbols.setdefault(symbol, []).extend(numbers)
+    return part_number_sum, gear_ratio_total + sum_gear_ratios(border_symbols.values())
+
 
-def parse_engine_schematic(schematic):
+def scan_schematic(rows):
     """
-    Parses the engine schematic and yields the coordinates of the adjacent symbol and value of each number.
+    Finds the part numbers and the gear ratios of the schematic in one pass over its rows.
 
     Args:
-    schematic (str): A multiline string representing the engine schematic.
+    rows (iterable of bytes): The rows of the schematic from top to bottom.
+
+    Returns:
+    tuple: The sum of the part numbers, each counted once per symbol next to it, and the total of the gear
+    ratios.
+    """
+    return merge_bands([scan_band(enumerate(rows))])
+
+
+def parse_input(input_data):
+    """
+    Parses the engine schematic once for both parts.
+
+    Args:
+    input_data (str or iterable of str): Multiline string or iterable of the rows of the schematic.
+
+    Returns:
+    tuple: The sum of the part numbers and the total of the gear ratios from scan_schematic().
+    """
+    # Empty rows are kept, so that they still separate the rows above and below them
+    return scan_schematic(line.encode() for line in iter_lines(input_data))
+
+
+def read_rows(mapped, start, end):
+    """
+    Reads the rows in a byte range of a mapped file.
+
+    Args:
+    mapped (mmap.mmap): The mapped input file.
+    start (int): Offset of the start of a line.
+    end (int): Offset behind the last line, at a line boundary or the end of the file.
 
     Yields:
-    tuple: A tuple containing the coordinates (x, y) of the corresponding symbol and the number.
+    tuple: The offset of every row, which identifies it across bands, and its bytes.
+    """
+    position = start
+    while position < end:
+        line_end = mapped.find(b"\n", position, end)
+        if line_end == -1:
+            line_end = end
+        yield position, mapped[position:line_end].rstrip(b"\r")
+        position = line_end + 1
+
+
+def row_before(mapped, offset):
+    # The row before a line boundary, with its offset, or None at the start of the file
+    if offset == 0:
+        return None
+    start = mapped.rfind(b"\n", 0, offset - 1) + 1
+    return start, mapped[start:offset].rstrip(b"\r\n")
+
+
+def scan_file_band(path, start, end):
     """
-    # Split the schematic into lines
-    lines = schematic.splitlines()
+    Scans a band of rows of a schematic file, mapping the file to read only the band and its border rows.
+
+    Args:
+    path (str or Path): The input file.
+    start (int): Offset of the first byte of the band, at the start of a line.
+    end (int): Offset behind the last byte of the band, at a line boundary or the end of the file.
 
-    # Iterate over each line and its index (y-coordinate)
-    for line_index, line in enumerate(lines):
-        # Find each number in the line
-        for number_match in NUMBER_PATTERN.finditer(line):
-            number = int(number_match.group(0))
-            # Find indices of the number
-            number_start, number_end = number_match.span()
+    Returns:
+    tuple: The results of the band, as returned by scan_band().
+    """
+    with open(path, "rb") as input_file, mmap.mmap(input_file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        above = row_before(mapped, start)
+        below = next(read_rows(mapped, end, len(mapped)), None)
+        return scan_band(read_rows(mapped, start, end), above, below)
 
-            # Check adjacent lines and within the span of the number + 1 for symbols
-            for adjacent_line_index in range(max(line_index - 1, 0), min(line_index + 2, len(lines))):
-                for symbol_match in SYMBOL_PATTERN.finditer(lines[adjacent_line_index],
-                                                            number_start - 1,
-                                                            number_end + 1):
-                    # Yield the position and the number
-                    yield symbol_match.start(), adjacent_line_index, number
 
-def calculate_sum_of_part_numbers(schematic: str) -> int:
+def parse_file(source, workers=None):
     """
-    Calculates the sum of all part numbers in the schematic that are adjacent to a symbol.
+    Scans an engine schematic, splitting large files into bands of rows that are scanned in parallel.
+
+    Every band is scanned by a worker process together with the rows just above and below it. The numbers
+    of every row are only scanned by the band the row belongs to, and the symbols on the borders of the
+    bands are merged before their gear ratios are added up. Standard input, compressed files, files below
+    PARALLEL_THRESHOLD and single workers scan the input as a stream by parse_input() instead.
 
     Args:
-    schematic (str): A multiline string representing the engine schematic.
+    source (str or Path): Path to the input file, or STDIN for standard input.
+    workers (int): Number of worker processes, defaults to the number of CPUs.
 
     Returns:
-    int: The sum of all part numbers adjacent to a symbol.
+    tuple: The sum of the part numbers and the total of the gear ratios, as returned by parse_input().
     """
-    # Sum all numbers that are adjacent to symbols
-    return sum(number for _, _, number in parse_engine_schematic(schematic))
+    workers = workers or os.cpu_count()
+    if workers == 1 or not is_splittable(source, PARALLEL_THRESHOLD):
+        with open_input(source, INPUT_MODE) as input_data:
+            return parse_input(input_data)
+
+    # Imported here, as only large inputs are worth the start of a process pool
+    from concurrent.futures import ProcessPoolExecutor  # pylint: disable=import-outside-toplevel
+
+    starts, ends = zip(*split_file(source, workers * BANDS_PER_WORKER))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return merge_bands(executor.map(scan_file_band, repeat(source), starts, ends))
 
-def calculate_total_gear_ratios(schematic: str) -> int:
+
+def part1(schematic_sums):
     """
-    Calculates the total of gear ratios in the schematic. A gear is represented by a 
-    symbol '*' that is adjacent to exactly two part numbers. The gear ratio is 
-    the product of these two numbers.
+    Solves part 1 of the puzzle.
 
     Args:
-    schematic (str): A multiline string representing the engine schematic.
+    schematic_sums (tuple): The sums of the schematic from parse_input().
 
     Returns:
-    int: The total of all gear ratios.
+    int: The sum of all part numbers adjacent to a symbol.
     """
-    # Dictionary to store part numbers adjacent to each gear
-    gears_with_part_numbers = defaultdict(list)
-    for symbol_start_index, symbol_line_index, number in parse_engine_schematic(schematic):
-        gears_with_part_numbers[symbol_start_index, symbol_line_index].append(number)
+    part_number_sum, _ = schematic_sums
+    return part_number_sum
 
-    # Sum the product of part numbers for each gear
-    return sum(prod(part_numbers) for part_numbers in gears_with_part_numbers.values() if len(part_numbers) == 2)
 
+def part2(schematic_sums):
+    """
+    Solves part 2 of the puzzle. A gear is a symbol that is adjacent to exactly two part numbers, and its gear
+    ratio is the product of these two numbers.
+
+    Args:
+    schematic_sums (tuple): The sums of the schematic from parse_input().
+
+    Returns:
+    int: The total of all gear ratios.
+    """
+    _, gear_ratio_total = schematic_sums
+    return gear_ratio_total
 
 
 def main():
-    # Read the input file
-    dir_path = os.path.dirname(os.path.realpath(__file__))
-    input_file = open(dir_path + "/input.txt", "r")
-    input_data = input_file.read()
-
-    # Calculate the sum of part numbers and total gear ratios
-    print("Part 1:", calculate_sum_of_part_numbers(input_data))
-    print("Part 2:", calculate_total_gear_ratios(input_data))
+    # Scan the input file given on the command line, "-" for standard input, or input.txt once for both
+    # parts, in parallel bands if it is large
+    schematic_sums = parse_file(input_source(__file__))
+
+    # Report the sum of part numbers and total gear ratios
+    print("Part 1:", part1(schematic_sums))
+    print("Part 2:", part2(schematic_sums))
 
 
 if __name__ == "__main__":
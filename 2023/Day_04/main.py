@@ -1,9 +1,22 @@
 # !/usr/bin/env python
 
 # --- Day 4: Scratchcards ---
+import mmap
 
-import os
+from aoc.inputs import input_source, is_splittable, iter_lines, open_input
+from aoc.optional import numpy_available
 
+# The input is read lazily line by line while it is parsed
+INPUT_MODE = "lines"
+
+# Input files from this size on are parsed with NumPy if it is installed
+VECTORIZE_THRESHOLD = 1 << 24
+
+# Number of cards from which part 1 is summed with NumPy if it is installed
+VECTORIZE_CARDS = 1 << 20
+
+# Number of cards whose numbers are compared at once by the NumPy engine, which bounds its memory
+CARD_BLOCK_SIZE = 1 << 16
 
 SAMPLE_INPUT = """
 Card 1: 41 48 83 86 17 | 83 86  6 31 17  9 48 53
@@ -16,87 +29,219 @@ Card 6: 31 18 13 56 72 | 74 77 10 23 35 67 36 11
 
 # --- Part One ---
 
+def parse_input(data):
+    """
+    Parses the scratchcard data once for both parts.
+
+    Args:
+    data (str or iterable of str): Multiline string or iterable of lines representing scratchcard data.
+
+    Returns:
+    bytes: The number of matching numbers for each card, one byte per card.
+    """
+    return bytes(parse_scratchcard_matches(data))
+
 def parse_scratchcard_matches(data):
     """
     Parses the scratchcard data and yields the number of matching numbers for each card.
 
     Args:
-    data (str): Multiline string representing scratchcard data.
+    data (str or iterable of str): Multiline string or iterable of lines representing scratchcard data.
 
     Yields:
     int: The number of matching numbers for each scratchcard.
     """
-    for line in data.splitlines():
+    for line in iter_lines(data):
         if not line:
             continue
         # Extract the part of the line after the colon
-        line = line[line.index(":") + 1 :]
-        winning_numbers, player_numbers = line.split("|")
-
-        # Convert number strings to sets for comparison
-        winning_numbers_set = set(winning_numbers.split())
-        player_numbers_set = set(player_numbers.split())
+        _, _, numbers = line.partition(":")
+        winning_numbers, _, player_numbers = numbers.partition("|")
 
-        # Yield the number of matching numbers
-        yield len(winning_numbers_set & player_numbers_set)
+        # Only the winning numbers need a set, the player's numbers are looked up in it in C
+        yield len(set(winning_numbers.split()).intersection(player_numbers.split()))
 
-def calculate_total_points(data):
+def calculate_total_points(card_matches):
     """
     Calculates the total points for all scratchcards based on the number of matching numbers.
 
     Args:
-    data (str): Multiline string representing scratchcard data.
+    card_matches (bytes): The number of matching numbers for each card.
 
     Returns:
     int: The total points of all scratchcards.
     """
-    total_points = 0
-
-    # Iterate through each card's number of matches
-    for match_counts in parse_scratchcard_matches(data):
-        # For each card, calculate points: 1 point for first match, doubled for each subsequent match
-        if match_counts > 0:
-            card_points = 2 ** (match_counts - 1)  # Calculate points as 2^(match_counts - 1)
-        else:
-            card_points = 0
+    if len(card_matches) >= VECTORIZE_CARDS and numpy_available():
+        import numpy  # pylint: disable=import-outside-toplevel
 
-        # Add the points for this card to the total points
-        total_points += card_points
+        match_counts = numpy.frombuffer(card_matches, dtype=numpy.uint8)
+        # The points of a card fit into 64 bits for up to 62 matches, and their sum for far more cards than
+        # fit into memory as long as no card has more than 32
+        if match_counts.max() <= 32:
+            return int((numpy.left_shift(1, match_counts, dtype=numpy.int64) >> 1).sum())
 
-    return total_points
+    # 1 point for the first match, doubled for each subsequent match: 2^(matches - 1), or 0 without matches
+    return sum((1 << match_count) >> 1 for match_count in card_matches)
 
-def calculate_total_scratchcards(data):
+def calculate_total_scratchcards(card_matches):
     """
     Calculates the total number of scratchcards won, including copies of subsequent cards.
 
+    Every card adds its number of instances to the next cards it wins. Instead of adding it to each of
+    them, it is added at the first card and subtracted after the last one in a difference array, whose
+    running sum is the number of copies of the current card. This takes one step per card, however many
+    cards each one wins.
+
     Args:
-    data (str): Multiline string representing scratchcard data.
+    card_matches (bytes): The number of matching numbers for each card.
 
     Returns:
     int: The total number of scratchcards, including originals and copies.
     """
-    # List of the number of matches for each card
-    match_counts = list(parse_scratchcard_matches(data))
-    total_cards = [1 for _ in match_counts]  # Initial count of 1 for each original card
+    card_count = len(card_matches)
+    copy_changes = [0] * (card_count + 1)
+
+    total_cards = copies = 0
+    for idx, match_count in enumerate(card_matches):
+        copies += copy_changes[idx]
+        instances = 1 + copies  # The original card and its copies
+        total_cards += instances
+        if match_count:
+            # Copies are only won of cards up to the end of the table
+            copy_changes[idx + 1] += instances
+            copy_changes[min(idx + 1 + match_count, card_count)] -= instances
+
+    return total_cards
+
+
+def count_matches_vectorized(buffer):
+    """
+    Counts the matching numbers of every card with NumPy, treating the cards as a matrix of bytes.
+
+    The numbers of all cards are in the same columns of their lines, as they are padded to two characters.
+    Each number is decoded from its two columns for all cards at once, and the numbers of every block of
+    cards are marked in a table of the winning and one of the player's numbers per card, whose overlap is
+    the matches. Every number is counted once, like with the sets of the scalar parser.
+
+    Needs NumPy, see aoc.optional.numpy_available().
+
+    Args:
+    buffer (bytes or mmap.mmap): The scratchcard data.
+
+    Returns:
+    bytes: The number of matching numbers for each card, as returned by parse_input(), or None if the lines
+    do not all have the same length and layout of numbers of up to two digits.
+    """
+    import numpy  # pylint: disable=import-outside-toplevel
+
+    data = numpy.frombuffer(buffer, dtype=numpy.uint8)
+    newlines = numpy.flatnonzero(data == ord("\n"))
+    if newlines.size == 0:
+        return None
+    # A last line without a line break is parsed on its own
+    last_line = bytes(data[newlines[-1] + 1 :]).decode()
+    stride = newlines[0] + 1
+    if not numpy.array_equal(newlines, numpy.arange(stride - 1, len(newlines) * stride, stride)):
+        return None
+    lines = data[: len(newlines) * stride].reshape(len(newlines), stride)
+
+    # The layout of the first card has to be the layout of every card
+    layout = lines[0]
+    colon = numpy.flatnonzero(layout == ord(":"))
+    bar = numpy.flatnonzero(layout == ord("|"))
+    if len(colon) != 1 or len(bar) != 1:
+        return None
+    colon, bar = colon[0], bar[0]
+    is_digit = (layout >= ord("0")) & (layout <= ord("9"))
+    # Every number ends in a digit that is not followed by another digit
+    number_ends = numpy.flatnonzero(is_digit[:-1] & ~is_digit[1:])
+    winning_ends = number_ends[(number_ends > colon) & (number_ends < bar)]
+    player_ends = number_ends[number_ends > bar]
+    number_ends = numpy.concatenate([winning_ends, player_ends])
+    number_columns = numpy.zeros(stride, dtype=bool)
+    number_columns[numpy.concatenate([number_ends, number_ends - 1])] = True
+    number_columns[: colon + 1] = True  # The card IDs may have any width
+
+    match_counts = []
+    for block_start in range(0, len(lines), CARD_BLOCK_SIZE):
+        block = lines[block_start : block_start + CARD_BLOCK_SIZE]
+        block_digits = (block >= ord("0")) & (block <= ord("9"))
+        if (
+            (block[:, colon] != ord(":")).any()
+            or (block[:, bar] != ord("|")).any()
+            or not block_digits[:, number_ends].all()
+            or block_digits[:, ~number_columns].any()
+        ):
+            return None
+
+        cards = numpy.arange(len(block))[:, None]
+        tables = []
+        for ends in (winning_ends, player_ends):
+            tens, ones = block[:, ends - 1], block[:, ends]
+            numbers = numpy.where(tens == ord(" "), 0, tens.astype(numpy.int64) - ord("0")) * 10 + ones - ord("0")
+            table = numpy.zeros((len(block), 100), dtype=bool)
+            table[cards, numbers] = True
+            tables.append(table)
+        match_counts.append(numpy.count_nonzero(tables[0] & tables[1], axis=1).astype(numpy.uint8))
+
+    matches = numpy.concatenate(match_counts).tobytes() if match_counts else b""
+    return matches + bytes(parse_scratchcard_matches(last_line))
+
+
+def parse_file(source):
+    """
+    Parses the scratchcard data, with NumPy for large files if it is installed.
+
+    Standard input, compressed files, files below VECTORIZE_THRESHOLD and files whose cards are not laid
+    out the same way are parsed as a stream by parse_input() instead.
+
+    Args:
+    source (str or Path): Path to the input file, or STDIN for standard input.
+
+    Returns:
+    bytes: The number of matching numbers for each card, as returned by parse_input().
+    """
+    if numpy_available() and is_splittable(source, VECTORIZE_THRESHOLD):
+        with open(source, "rb") as input_file, mmap.mmap(input_file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            card_matches = count_matches_vectorized(mapped)
+        if card_matches is not None:
+            return card_matches
+
+    with open_input(source, INPUT_MODE) as input_data:
+        return parse_input(input_data)
+
+
+def part1(card_matches):
+    """
+    Solves part 1 of the puzzle.
 
-    # Add copies of subsequent cards based on the number of matches
-    for idx, match_count in enumerate(match_counts):
-        for counter in range(match_count):
-            if idx + counter + 1 < len(total_cards):
-                total_cards[idx + counter + 1] += total_cards[idx]
+    Args:
+    card_matches (bytes): The number of matching numbers for each card from parse_input().
+
+    Returns:
+    int: The total points of all scratchcards.
+    """
+    return calculate_total_points(card_matches)
+
+def part2(card_matches):
+    """
+    Solves part 2 of the puzzle.
+
+    Args:
+    card_matches (bytes): The number of matching numbers for each card from parse_input().
 
-    return sum(total_cards)
+    Returns:
+    int: The total number of scratchcards, including originals and copies.
+    """
+    return calculate_total_scratchcards(card_matches)
 
 
 def main():
-    # Read the input file
-    dir_path = os.path.dirname(os.path.realpath(__file__))
-    input_file = open(dir_path + "/input.txt", "r")
-    input_data = input_file.read()
-
-    # Calculate the sum of part numbers and total gear ratios
-    print("Part 1:", calculate_total_points(input_data))
-    print("Part 2:", calculate_total_scratchcards(input_data))
+    # Parse the input file given on the command line, "-" for standard input, or input.txt once for both
+    # parts, with NumPy if it is large
+    card_matches = parse_file(input_source(__file__))
+    print("Part 1:", part1(card_matches))
+    print("Part 2:", part2(card_matches))
 
 
 if __name__ == "__main__":
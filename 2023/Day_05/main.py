@@ -1,8 +1,9 @@
 import re
-import os
 from functools import reduce
 from operator import itemgetter
 
+from aoc.inputs import input_source, open_input
+
 SAMPLE_INPUT = """seeds: 79 14 55 13
 
 seed-to-soil map:
@@ -49,14 +50,14 @@ def parse_input(data):
     data (str): Input data string.
 
     Returns:
-    tuple: A tuple containing a list of seeds and a list of mappings for each category.
+    tuple: A tuple containing a tuple of seeds and a tuple of the sorted mappings of each category.
     """
     # Splitting the data into sections
     sections = data.split("\n\n")
 
     # Extracting seeds
     seed_matches = NUMBER_PATTERN.finditer(sections[0])
-    seeds = [int(match.group(0)) for match in seed_matches]
+    seeds = tuple(int(match.group(0)) for match in seed_matches)
 
     # Extracting mappings for each category
     mappings = []
@@ -69,9 +70,9 @@ def parse_input(data):
                 src_start, dest_start, length = nums
                 # Add the mapping to the list
                 category_mappings.append((dest_start, dest_start + length, src_start - dest_start))
-        mappings.append(sorted(category_mappings, key=itemgetter(0)))
+        mappings.append(tuple(sorted(category_mappings, key=itemgetter(0))))
 
-    return seeds, mappings
+    return seeds, tuple(mappings)
 
 def remap(number_ranges, category_mappings):
     """
@@ -108,20 +109,19 @@ def remap(number_ranges, category_mappings):
         if range_start < range_end:
             yield range_start, range_end
 
-def find_lowest_location(data, is_part2=False):
+def find_lowest_location(almanac, is_part2=False):
     """
     Finds the lowest location number based on the input data.
 
     Args:
-    data (str): Input data string containing seed ranges and category mappings.
+    almanac (tuple): The seeds and category mappings from parse_input().
     is_part2 (bool): Flag to determine if the function is used for Part 2.
                      In Part 2, the seeds are considered as ranges.
 
     Returns:
     int: The lowest location number obtained after applying all category mappings.
     """
-    # Parse the input data to get seeds and mappings
-    seeds, category_mappings = parse_input(data)
+    seeds, category_mappings = almanac
 
     if is_part2:
         # For Part 2, consider each pair of seeds as a range (start, end)
@@ -144,14 +144,38 @@ def find_lowest_location(data, is_part2=False):
 
 
 
-def main():
-    # Read the input file
-    dir_path = os.path.dirname(os.path.realpath(__file__))
-    input_file = open(dir_path + "/input.txt", "r")
-    input_data = input_file.read()
+def part1(almanac):
+    """
+    Solves part 1 of the puzzle, treating every seed as a single number.
+
+    Args:
+    almanac (tuple): The seeds and category mappings from parse_input().
 
-    print("Part 1:", find_lowest_location(input_data))
-    print("Part 2:", find_lowest_location(input_data, is_part2=True))
+    Returns:
+    int: The lowest location number of any initial seed.
+    """
+    return find_lowest_location(almanac)
+
+def part2(almanac):
+    """
+    Solves part 2 of the puzzle, treating the seeds as pairs of range start and length.
+
+    Args:
+    almanac (tuple): The seed ranges and category mappings from parse_input().
+
+    Returns:
+    int: The lowest location number of any seed in the seed ranges.
+    """
+    return find_lowest_location(almanac, is_part2=True)
+
+
+def main():
+    # Read the input file given on the command line, "-" for standard input, or input.txt
+    with open_input(input_source(__file__)) as input_data:
+        # Parse the input once for both parts
+        almanac = parse_input(input_data)
+    print("Part 1:", part1(almanac))
+    print("Part 2:", part2(almanac))
 
 
 if __name__ == "__main__":
@@ -1,9 +1,27 @@
-import os
+from aoc.inputs import input_source, open_input
 
 SAMPLE_INPUT = """Time:      7  15   30
 Distance:  9  40  200
 """
 
+def parse_input(input_data):
+    """
+    Parses the race sheet once for both parts.
+
+    The numbers are kept as digit strings, because part 2 joins the digits of all races.
+
+    Args:
+    input_data (str): The race sheet with a line of times and a line of distances.
+
+    Returns:
+    tuple: A tuple of time strings and a tuple of distance strings, one per race.
+    """
+    lines = input_data.splitlines()
+    times = tuple(lines[0][9:].split())
+    dists = tuple(lines[1][9:].split())
+
+    return times, dists
+
 def calculate_ways_to_win(time, record):
     """
     Calculates the number of ways to win the race by holding the button for different durations.
@@ -52,21 +70,43 @@ def calculate_ways_to_win_single_race(time, dist):
     """
     return calculate_ways_to_win(time, dist)
 
-def main():
-    # Read the input file
-    dir_path = os.path.dirname(os.path.realpath(__file__))
-    input_file = open(dir_path + "/input.txt", "r")
-    input_data = input_file.readlines()
+def part1(race_sheet):
+    """
+    Solves part 1 of the puzzle, reading the times and distances as separate races.
 
-    times = map(int, input_data[0][9:].split())
-    dists = map(int, input_data[1][9:].split())
+    Args:
+    race_sheet (tuple): The times and distances from parse_input().
 
-    print("Part 1:", multiply_ways_to_win(times, dists))
+    Returns:
+    int: The product of the number of ways to win for each race.
+    """
+    times = map(int, race_sheet[0])
+    dists = map(int, race_sheet[1])
+
+    return multiply_ways_to_win(times, dists)
+
+def part2(race_sheet):
+    """
+    Solves part 2 of the puzzle, reading the times and distances as a single race.
+
+    Args:
+    race_sheet (tuple): The times and distances from parse_input().
+
+    Returns:
+    int: The number of ways to win the single race.
+    """
+    time = int("".join(race_sheet[0]))
+    dist = int("".join(race_sheet[1]))
 
+    return calculate_ways_to_win_single_race(time, dist)
 
-    time = int(input_data[0][9:].replace(" ", ""))
-    dist = int(input_data[1][9:].replace(" ", ""))
-    print("Part 2:", calculate_ways_to_win_single_race(time, dist))
+def main():
+    # Read the input file given on the command line, "-" for standard input, or input.txt
+    with open_input(input_source(__file__)) as input_data:
+        # Parse the input once for both parts
+        race_sheet = parse_input(input_data)
+    print("Part 1:", part1(race_sheet))
+    print("Part 2:", part2(race_sheet))
 
 
 if __name__ == "__main__":
@@ -1,6 +1,7 @@
-import os
 from collections import Counter
 
+from aoc.inputs import input_source, open_input
+
 SAMPLE_INPUT = """32T3K 765
 T55J5 684
 KK677 28
@@ -9,6 +10,22 @@ QQQJA 483
 """
 
 
+def parse_input(data: str) -> tuple:
+    """
+    Parse the hands and bids once for both parts.
+
+    Args:
+    data (str): String data representing hands and bids.
+
+    Returns:
+    tuple: The (hand, bid) pair of every line, with the hand as a string of cards.
+    """
+    return tuple(
+        (words[0], int(words[1]))
+        for line in data.splitlines()
+        if len(words := line.split(maxsplit=1)) == 2
+    )
+
 def calculate_hand_rank(hand: tuple[int]) -> int:
     """
     Calculate the rank of a hand in Camel Cards.
@@ -40,38 +57,60 @@ def calculate_hand_rank(hand: tuple[int]) -> int:
         return 1
     return 0
 
-def compute_total_winnings(data: str, part_2: bool = False) -> int:
+def compute_total_winnings(hands_and_bids: tuple, part_2: bool = False) -> int:
     """
     Compute the total winnings from the Camel Card hands.
 
     Args:
-    data (str): String data representing hands and bids.
-    card_order (str): String representing the order of cards.
+    hands_and_bids (tuple): The hands and bids from parse_input().
+    part_2 (bool): Whether J is a joker instead of a jack.
 
     Returns:
     int: Total winnings calculated.
     """
     card_order = "23456789TQKA" if part_2 else "23456789TJQKA"
 
-    # Process each line in the data to calculate the hand rank and bid.
+    # Calculate the rank of each hand with the card order of this part.
     hands = [
-        (calculate_hand_rank(hand := tuple(map(card_order.find, words[0]))), hand, int(words[1]))
-        for line in data.splitlines()
-        if len(words := line.split(maxsplit=1)) == 2
+        (calculate_hand_rank(hand := tuple(map(card_order.find, cards))), hand, bid)
+        for cards, bid in hands_and_bids
     ]
     # Calculate the total winnings.
     return sum((i + 1) * bid for i, (_, _, bid) in enumerate(sorted(hands)))
 
+def part1(hands_and_bids: tuple) -> int:
+    """
+    Compute the total winnings with J as jack.
+
+    Args:
+    hands_and_bids (tuple): The hands and bids from parse_input().
+
+    Returns:
+    int: Total winnings calculated.
+    """
+    return compute_total_winnings(hands_and_bids)
+
+def part2(hands_and_bids: tuple) -> int:
+    """
+    Compute the total winnings with J as joker.
+
+    Args:
+    hands_and_bids (tuple): The hands and bids from parse_input().
+
+    Returns:
+    int: Total winnings calculated.
+    """
+    return compute_total_winnings(hands_and_bids, part_2=True)
+
 def main():
-    # Read the input file
-    dir_path = os.path.dirname(os.path.realpath(__file__))
-    input_file_path = os.path.join(dir_path, "input.txt")
-    with open(input_file_path, "r") as input_file:
-        input_data = input_file.read()
+    # Read the input file given on the command line, "-" for standard input, or input.txt
+    with open_input(input_source(__file__)) as input_data:
+        # Parse the input once for both parts
+        hands_and_bids = parse_input(input_data)
 
     # Calculate and display total winnings for both parts
-    print("Part 1:", compute_total_winnings(input_data))
-    print("Part 2:", compute_total_winnings(input_data, part_2=True))
+    print("Part 1:", part1(hands_and_bids))
+    print("Part 2:", part2(hands_and_bids))
 
 if __name__ == "__main__":
     main()
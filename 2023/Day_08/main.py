@@ -1,6 +1,8 @@
-import os
 import re
 import math
+from types import MappingProxyType
+
+from aoc.inputs import input_source, open_input
 
 SAMPLE_INPUT_1 = """RL
 
@@ -32,6 +34,18 @@ SAMPLE_INPUT_3 = """LR
 XXX = (XXX, XXX)
 """
 
+def parse_input(input_data: str) -> tuple:
+    """
+    Parse the directions and the network once for both parts.
+
+    Args:
+    input_data (str): The input data.
+
+    Returns:
+    tuple: The directions as a string of L and R, and a read-only view of the network.
+    """
+    return "".join(extract_directions(input_data)), MappingProxyType(extract_network(input_data))
+
 def extract_network(input_data: str) -> dict:
     """
     Extract the network from the input data.
@@ -133,29 +147,45 @@ def find_all_paths(directions: [str], network: dict, starting_positions: [str])
     return cycles
 
 
-def main():
-    # Read the input file
-    dir_path = os.path.dirname(os.path.realpath(__file__))
-    input_file_path = os.path.join(dir_path, "input.txt")
-    with open(input_file_path, "r") as input_file:
-        input_data = input_file.read()
+def part1(documents: tuple) -> int:
+    """
+    Count the steps needed to get from AAA to ZZZ.
 
-    directions = extract_directions(input_data)
-    network = extract_network(input_data)
+    Args:
+    documents (tuple): The directions and the network from parse_input().
 
-    # Part 1
+    Returns:
+    int: The number of steps taken to reach ZZZ.
+    """
+    directions, network = documents
 
-    print("Part 1:", find_path(directions, network))
+    return find_path(directions, network)
 
-    # Part 2
+def part2(documents: tuple) -> int:
+    """
+    Count the steps needed until all paths starting on A end on Z at the same time.
 
-    # Find all starting positions in the input text
-    matches = re.findall(r"([0-Z]+A) =", input_data)
+    Args:
+    documents (tuple): The directions and the network from parse_input().
 
-    # Convert the matches into a list
-    starting_positions = list(matches)
+    Returns:
+    int: The least common multiple of the cycle lengths of all starting positions.
+    """
+    directions, network = documents
+
+    # Find all starting positions in the order they appear in the input
+    starting_positions = [position for position in network if position.endswith("A")]
+
+    return math.lcm(*find_all_paths(directions, network, starting_positions).values())
 
-    print("Part 2:", math.lcm(*find_all_paths(directions, network, starting_positions).values()))
+
+def main():
+    # Read the input file given on the command line, "-" for standard input, or input.txt
+    with open_input(input_source(__file__)) as input_data:
+        # Parse the input once for both parts
+        documents = parse_input(input_data)
+    print("Part 1:", part1(documents))
+    print("Part 2:", part2(documents))
 
 if __name__ == "__main__":
     main()
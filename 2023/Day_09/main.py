@@ -1,4 +1,7 @@
-import os
+from aoc.inputs import input_source, iter_lines, open_input
+
+# The input is read lazily line by line while it is parsed
+INPUT_MODE = "lines"
 
 # Example input data for testing purposes
 SAMPLE_INPUT_1 = """0 3 6 9 12 15
@@ -6,6 +9,19 @@ SAMPLE_INPUT_1 = """0 3 6 9 12 15
 10 13 16 21 30 45
 """
 
+def parse_input(input_data):
+    """
+    Parse the histories once for both parts.
+
+    Args:
+    input_data (str or iterable of str): A string containing multiple lines, or an iterable of lines,
+    each representing a history.
+
+    Returns:
+    tuple: One tuple of integers per history.
+    """
+    return tuple(tuple(map(int, line.split())) for line in iter_lines(input_data) if line.strip())
+
 # -------- Part 1 --------
 
 def generate_difference_sequence(values):
@@ -44,18 +60,18 @@ def extrapolate_next_value(history):
 
     return sequences[0][-1]
 
-def sum_extrapolated_values(input_data):
+def sum_extrapolated_values(histories):
     """
     Calculate the sum of the extrapolated next values for each history.
 
     Args:
-    input_data (str): A string containing multiple lines, each representing a history.
+    histories (tuple): The histories from parse_input().
 
     Returns:
     int: The sum of extrapolated next values for each history.
     """
-    histories = [list(map(int, line.split())) for line in input_data.strip().split("\n")]
-    return sum(extrapolate_next_value(history) for history in histories)
+    # Extrapolation extends the sequences in place, so every history is copied into a list first
+    return sum(extrapolate_next_value(list(history)) for history in histories)
 
 # -------- Part 2 --------
 
@@ -86,18 +102,43 @@ def extrapolate_previous_value(history):
 
     return sequences[0][0]
 
-def sum_extrapolated_previous_values(input_data):
+def sum_extrapolated_previous_values(histories):
     """
     Calculate the sum of the extrapolated previous values for each history.
 
     Args:
-    input_data (str): A string containing multiple lines, each representing a history.
+    histories (tuple): The histories from parse_input().
+
+    Returns:
+    int: The sum of extrapolated previous values for each history.
+    """
+    # Extrapolation extends the sequences in place, so every history is copied into a list first
+    return sum(extrapolate_previous_value(list(history)) for history in histories)
+
+
+def part1(histories):
+    """
+    Solves part 1 of the puzzle.
+
+    Args:
+    histories (tuple): The histories from parse_input().
+
+    Returns:
+    int: The sum of extrapolated next values for each history.
+    """
+    return sum_extrapolated_values(histories)
+
+def part2(histories):
+    """
+    Solves part 2 of the puzzle.
+
+    Args:
+    histories (tuple): The histories from parse_input().
 
     Returns:
     int: The sum of extrapolated previous values for each history.
     """
-    histories = [list(map(int, line.split())) for line in input_data.strip().split("\n")]
-    return sum(extrapolate_previous_value(history) for history in histories)
+    return sum_extrapolated_previous_values(histories)
 
 
 # Main function
@@ -106,17 +147,17 @@ def main():
     """
     Main function to execute parts 1 and 2 of the puzzle.
     """
-    # Read the input file
-    dir_path = os.path.dirname(os.path.realpath(__file__))
-    input_file_path = os.path.join(dir_path, "input.txt")
-    with open(input_file_path, "r") as input_file:
-        input_data = input_file.read()
+    # Read the input file given on the command line, "-" for standard input, or input.txt
+
+    # Parse the input once for both parts
+    with open_input(input_source(__file__), INPUT_MODE) as input_data:
+        histories = parse_input(input_data)
 
     # Execute Part 1
-    print("Part 1:", sum_extrapolated_values(input_data))
+    print("Part 1:", part1(histories))
 
     # Execute Part 2
-    print("Part 2:", sum_extrapolated_previous_values(input_data))
+    print("Part 2:", part2(histories))
 
 if __name__ == "__main__":
     main()
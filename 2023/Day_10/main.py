@@ -1,4 +1,5 @@
-import os
+from aoc.grid import DOWN, LEFT, RIGHT, UP, Grid
+from aoc.inputs import input_source, open_input
 
 SAMPLE_INPUT = """
 ..F7.
@@ -8,134 +9,175 @@ SJ.L7
 LJ...
 """
 
+# Directions each kind of pipe connects to, the start tile connects to all of them
+PIPE_CONNECTIONS = {
+    ord("|"): (UP, DOWN),
+    ord("-"): (LEFT, RIGHT),
+    ord("L"): (UP, RIGHT),
+    ord("J"): (LEFT, UP),
+    ord("7"): (LEFT, DOWN),
+    ord("F"): (DOWN, RIGHT),
+    ord("S"): (UP, RIGHT, DOWN, LEFT),
+}
+START = ord("S")
+
 # -------- Part 1 --------
 
 def build_pipes(layout):
     """
     Construct a network of pipes from a given layout.
 
+    The start tile is replaced by the pipe that connects it to its two neighbors on the loop.
+
     Args:
     layout (str): Multiline string representing the pipe layout.
 
     Returns:
-    tuple: Starting coordinate and a dictionary representing pipe connections.
+    tuple: Flat index of the starting tile and the read-only grid of pipes.
     """
-    pipes = {}
-    for y, row in enumerate(layout.splitlines()):
-        for x, char in enumerate(row):
-            coord = (y, x)
-            if char != ".":
-                pipes[coord] = connect_pipes(char, coord)
-    start_coord = find_start(pipes)
-    pipes[start_coord] = {pos for pos in pipes[start_coord] if start_coord in pipes.get(pos, set())}
-    return start_coord, pipes
+    grid = Grid.from_text(layout)
+    start = find_start(grid)
+    start_directions = {
+        direction for direction in PIPE_CONNECTIONS[START]
+        if (neighbor := grid.neighbor(start, direction)) is not None and start in connect_pipes(grid, neighbor)
+    }
+    grid.cells[start] = next(
+        pipe for pipe, directions in PIPE_CONNECTIONS.items() if set(directions) == start_directions
+    )
+    return start, grid.frozen()
 
-def connect_pipes(char, coord):
+def parse_input(layout):
+    """
+    Parse the pipe layout once for both parts.
+
+    Args:
+    layout (str): Multiline string representing the pipe layout.
+
+    Returns:
+    tuple: Flat index of the starting tile and the read-only grid of pipes, see build_pipes().
+    """
+    return build_pipes(layout)
+
+def connect_pipes(grid, index):
     """
     Determine pipe connections based on the pipe character.
 
     Args:
-    char (str): Character representing the pipe type.
-    coord (tuple): Coordinates of the pipe.
+    grid (Grid): Grid of pipes.
+    index (int): Flat index of the pipe.
 
     Returns:
-    set: A set of tuples representing connected coordinates.
-    """
-    y, x = coord
-    connections = {
-        "|": {(y-1, x), (y+1, x)},
-        "-": {(y, x-1), (y, x+1)},
-        "L": {(y-1, x), (y, x+1)},
-        "J": {(y, x-1), (y-1, x)},
-        "7": {(y, x-1), (y+1, x)},
-        "F": {(y+1, x), (y, x+1)},
-        "S": {(y-1, x), (y+1, x), (y, x-1), (y, x+1)}
-    }
-    return connections.get(char, set())
+    list: Flat indices of the connected tiles inside the grid.
+    """
+    directions = PIPE_CONNECTIONS.get(grid.cells[index], ())
+    neighbors = (grid.neighbor(index, direction) for direction in directions)
+    return [neighbor for neighbor in neighbors if neighbor is not None]
 
-def find_start(pipe_map):
+def find_start(grid):
     """
     Find the starting position 'S' in the pipe network.
 
     Args:
-    pipe_map (dict): Dictionary representing the pipe network.
+    grid (Grid): Grid of pipes.
 
     Returns:
-    tuple: Coordinates of the starting position.
+    int: Flat index of the starting position.
     """
-    for coord, connected in pipe_map.items():
-        if len(connected) == 4:
-            return coord
+    return grid.cells.index(START)
 
-def trace_loop(start, network):
+def trace_loop(start, grid):
     """
     Trace the main loop in the pipe network starting from 'S'.
 
     Args:
-    start (tuple): Starting coordinate.
-    network (dict): Pipe network.
+    start (int): Flat index of the starting tile.
+    grid (Grid): Grid of pipes.
 
     Returns:
-    set: Set of coordinates forming the loop.
+    bytearray: One byte per tile, set to 1 for the tiles forming the loop.
     """
-    current = next(iter(network[start]))
-    loop = {start, current}
+    loop = bytearray(grid.size)
+    loop[start] = 1
+    previous, current = start, connect_pipes(grid, start)[0]
 
-    while True:
-        next_pos = network[current] - loop
-        if not next_pos:
-            break
-        current = next(iter(next_pos))
-        loop.add(current)
+    while current != start:
+        loop[current] = 1
+        first, second = connect_pipes(grid, current)
+        previous, current = current, second if first == previous else first
 
     return loop
 
 # -------- Part 2 --------
 
-def find_interior_area(pipe_network, loop):
+def count_interior_tiles(grid, loop):
     """
     Calculate the interior area enclosed by the loop.
 
+    Scanning each row, a tile is inside the loop if an odd number of loop pipes connecting north lie to
+    its left.
+
     Args:
-    pipe_network (dict): Pipe network.
-    loop (set): Set of coordinates forming the loop.
+    grid (Grid): Grid of pipes.
+    loop (bytearray): Loop membership of every tile.
 
     Returns:
-    set: Set of coordinates inside the loop.
+    int: Number of tiles inside the loop.
     """
-    max_row = max(row for row, _ in pipe_network.keys()) + 1
-    max_col = max(col for _, col in pipe_network.keys()) + 1
+    north_pipes = {pipe for pipe, directions in PIPE_CONNECTIONS.items() if UP in directions}
 
-    interior = set()
-    for row in range(max_row):
+    interior = 0
+    for row in range(grid.height):
         num_north = 0
-        for col in range(max_col):
-            if (row, col) in loop:
-                if (row - 1, col) in pipe_network[(row, col)]:
+        for index in grid.row_indices(row):
+            if loop[index]:
+                if grid.cells[index] in north_pipes:
                     num_north += 1
             elif num_north % 2 == 1:
-                interior.add((row, col))
+                interior += 1
 
     return interior
 
+def part1(pipes):
+    """
+    Solves part 1 of the puzzle: the distance to the farthest point of the main loop.
+
+    Args:
+    pipes (tuple): The starting tile and the grid of pipes from parse_input().
+
+    Returns:
+    int: Number of steps to the point farthest from the start.
+    """
+    start, grid = pipes
+    main_loop = trace_loop(start, grid)
+    return main_loop.count(1) // 2
+
+def part2(pipes):
+    """
+    Solves part 2 of the puzzle: the number of tiles enclosed by the main loop.
+
+    Args:
+    pipes (tuple): The starting tile and the grid of pipes from parse_input().
+
+    Returns:
+    int: Size of the interior area.
+    """
+    start, grid = pipes
+    main_loop = trace_loop(start, grid)
+    return count_interior_tiles(grid, main_loop)
+
 # Main function
 
 def main():
     # Reading input data
-    dir_path = os.path.dirname(os.path.realpath(__file__))
-    input_file_path = os.path.join(dir_path, "input.txt")
-    with open(input_file_path, "r") as input_file:
-        input_data = input_file.read()
-
-    start_coord, pipe_network = build_pipes(input_data)
+    with open_input(input_source(__file__)) as input_data:
+        # Parse the input once for both parts
+        pipes = parse_input(input_data)
 
     # Part 1: Loop tracing
-    main_loop = trace_loop(start_coord, pipe_network)
-    print("Part 1: Length of Main Loop:", len(main_loop)//2)
+    print("Part 1: Length of Main Loop:", part1(pipes))
 
     # Part 2: Interior area calculation
-    interior = find_interior_area(pipe_network, main_loop)
-    print("Part 2: Size of Interior Area:", len(interior))
+    print("Part 2: Size of Interior Area:", part2(pipes))
 
 if __name__ == "__main__":
     main()
@@ -1,4 +1,5 @@
-import os
+from aoc.grid import Grid
+from aoc.inputs import input_source, open_input
 
 SAMPLE_INPUT = """...#......
 .......#..
@@ -14,33 +15,39 @@ SAMPLE_INPUT = """...#......
 
 def parse_input(puzzle_input):
     """
-    Parse the cosmic data into a grid representation.
-    
+    Parse the cosmic data into the number of galaxies in each row and column.
+
+    Both parts only depend on these counts, so the grid itself is not kept.
+
     Args:
     puzzle_input (str): Multiline string representing the cosmic data.
 
     Returns:
-    list of list of str: A grid representation of the cosmic data.
+    tuple: Two tuples containing the count of galaxies in each row and column.
     """
-    return [list(line) for line in puzzle_input.splitlines()]
+    row_counts, col_counts = count_galaxies(Grid.from_text(puzzle_input))
+    return tuple(row_counts), tuple(col_counts)
 
 def count_galaxies(grid):
     """
     Count the number of galaxies in each row and column of the grid.
 
     Args:
-    grid (list of list of str): Grid representation of the cosmic data.
+    grid (Grid): Grid representation of the cosmic data.
 
     Returns:
     tuple: Two lists containing the count of galaxies in each row and column.
     """
-    row_galaxy_counts = [0] * len(grid)
-    column_galaxy_counts = [0] * len(grid[0])
-    for row_index, row in enumerate(grid):
-        for column_index, cell in enumerate(row):
-            if cell == "#":
-                row_galaxy_counts[row_index] += 1
-                column_galaxy_counts[column_index] += 1
+    row_galaxy_counts = [0] * grid.height
+    column_galaxy_counts = [0] * grid.width
+
+    # Jump from galaxy to galaxy instead of visiting every cell
+    index = grid.cells.find(b"#")
+    while index != -1:
+        row_index, column_index = grid.position(index)
+        row_galaxy_counts[row_index] += 1
+        column_galaxy_counts[column_index] += 1
+        index = grid.cells.find(b"#", index + 1)
     return row_galaxy_counts, column_galaxy_counts
 
 def adjust_counts(galaxy_counts, expansion_factor):
@@ -48,7 +55,7 @@ def adjust_counts(galaxy_counts, expansion_factor):
     Adjust the galaxy counts for rows or columns considering the expansion factor.
 
     Args:
-    galaxy_counts (list of int): Counts of galaxies in rows or columns.
+    galaxy_counts (tuple of int): Counts of galaxies in rows or columns.
     expansion_factor (int): Factor by which empty spaces are expanded.
 
     Returns:
@@ -84,8 +91,8 @@ def solve(row_counts, col_counts, expansion_factor):
     Solve the puzzle for given row and column counts and expansion factor.
 
     Args:
-    row_counts (list of int): Counts of galaxies in each row.
-    col_counts (list of int): Counts of galaxies in each column.
+    row_counts (tuple of int): Counts of galaxies in each row.
+    col_counts (tuple of int): Counts of galaxies in each column.
     expansion_factor (int): Expansion factor for empty spaces.
 
     Returns:
@@ -94,23 +101,41 @@ def solve(row_counts, col_counts, expansion_factor):
     return sum_distances(adjust_counts(row_counts, expansion_factor)) + \
            sum_distances(adjust_counts(col_counts, expansion_factor))
 
-# Main function
+def part1(galaxy_counts):
+    """
+    Sum of shortest path lengths when every empty row and column is doubled.
 
-def main():
-    # Reading input data
-    dir_path = os.path.dirname(os.path.realpath(__file__))
-    input_file_path = os.path.join(dir_path, "input.txt")
-    with open(input_file_path, "r") as input_file:
-        input_data = input_file.read()
+    Args:
+    galaxy_counts (tuple): The galaxy counts of the rows and columns from parse_input().
 
-    grid = parse_input(input_data)
-    row_counts, col_counts = count_galaxies(grid)
+    Returns:
+    int: Total sum of shortest path lengths in the expanded universe.
+    """
+    row_counts, col_counts = galaxy_counts
+    return solve(row_counts, col_counts, 2)
 
-    # Part 1: Loop tracing
-    print("Part 1:", solve(row_counts, col_counts, 2))
+def part2(galaxy_counts):
+    """
+    Sum of shortest path lengths when every empty row and column is a million times larger.
 
-    # Part 2: Interior area calculation
-    print("Part 2:", solve(row_counts, col_counts, 1000000))
+    Args:
+    galaxy_counts (tuple): The galaxy counts of the rows and columns from parse_input().
+
+    Returns:
+    int: Total sum of shortest path lengths in the expanded universe.
+    """
+    row_counts, col_counts = galaxy_counts
+    return solve(row_counts, col_counts, 1000000)
+
+# Main function
+
+def main():
+    # Reading input data
+    with open_input(input_source(__file__)) as input_data:
+        # Parse the input once for both parts
+        galaxy_counts = parse_input(input_data)
+    print("Part 1:", part1(galaxy_counts))
+    print("Part 2:", part2(galaxy_counts))
 
 if __name__ == "__main__":
     main()
@@ -1,6 +1,10 @@
-import os
 from functools import cache
 
+from aoc.inputs import input_source, iter_lines, open_input
+
+# The input is read lazily line by line while it is parsed
+INPUT_MODE = "lines"
+
 SAMPLE_INPUT = """#.#.### 1,1,3
 .#...#....###. 1,1,3
 .#.###.#.###### 1,3,1,6
@@ -9,6 +13,25 @@ SAMPLE_INPUT = """#.#.### 1,1,3
 .###.##....# 3,2,1
 """
 
+def parse_input(spring_data):
+    """
+    Parses the condition records once for both parts.
+
+    Parameters:
+    - spring_data (str or iterable of str): Multiline string or iterable of lines representing the condition of
+      springs and damage groups.
+
+    Returns:
+    tuple: The pair (spring_conditions, damage_groups) of every row, with the groups as a tuple of int.
+    """
+    rows = []
+    for line in iter_lines(spring_data):
+        if not line:
+            continue
+        records, groups = line.split()
+        rows.append((records, tuple(map(int, groups.split(',')))))
+    return tuple(rows)
+
 @cache
 def count_valid_spring_arrangements(spring_conditions, damage_groups, current_length=0):
     """
@@ -42,38 +65,34 @@ def count_valid_spring_arrangements(spring_conditions, damage_groups, current_le
 
     return arrangements
 
-def part1(spring_data):
+def part1(spring_rows):
     """
     Part 1 of the challenge: Counts the total number of valid arrangements of operational and broken springs.
 
     Parameters:
-    - spring_data: List of strings representing the condition of springs and damage groups.
+    - spring_rows (tuple): The condition records and damage groups from parse_input().
 
     Returns:
     int: Total number of valid arrangements for part 1.
     """
     total = 0
-    for line in spring_data:
-        records, groups = line.split()
-        groups = tuple(map(int, groups.split(',')))
+    for records, groups in spring_rows:
         total += count_valid_spring_arrangements(records, groups)
     return total
 
-def part2(spring_data):
+def part2(spring_rows):
     """
     Part 2 of the challenge: Counts the total number of valid arrangements of operational and broken springs
     for a modified condition where each record is quintupled and groups are quintupled.
 
     Parameters:
-    - spring_data: List of strings representing the condition of springs and damage groups.
+    - spring_rows (tuple): The condition records and damage groups from parse_input().
 
     Returns:
     int: Total number of valid arrangements for part 2.
     """
     total = 0
-    for line in spring_data:
-        records, groups = line.split()
-        groups = tuple(map(int, groups.split(',')))
+    for records, groups in spring_rows:
         modified_records = '?'.join([records] * 5)
         modified_groups = groups * 5
         total += count_valid_spring_arrangements(modified_records, modified_groups)
@@ -81,15 +100,11 @@ def part2(spring_data):
 
 
 def main():
-    dir_path = os.path.dirname(os.path.realpath(__file__))
-    input_file_path = os.path.join(dir_path, "input.txt")
-    with open(input_file_path, "r") as input_file:
-        input_data = input_file.readlines()
-    
-    spring_data = [line.strip() for line in input_data]
-
-    print("Part 1:", part1(spring_data))
-    print("Part 2:", part2(spring_data))
+    with open_input(input_source(__file__), INPUT_MODE) as input_data:
+        # Parse the input once for both parts
+        spring_rows = parse_input(input_data)
+    print("Part 1:", part1(spring_rows))
+    print("Part 2:", part2(spring_rows))
 
 
 if __name__ == "__main__":
@@ -1,4 +1,5 @@
-import os
+from aoc.grid import Grid
+from aoc.inputs import input_source, open_input
 
 SAMPLE_INPUT = """
 #...#...#
@@ -12,6 +13,18 @@ SAMPLE_INPUT = """
 ...##...#
 """
 
+def parse_input(data):
+    """
+    Parses the patterns once for both parts.
+
+    Parameters:
+    - data (str): Multiline string data representing different patterns.
+
+    Returns:
+    tuple of Grid: The patterns as read-only grids.
+    """
+    return tuple(Grid.from_text(group).frozen() for group in data.strip().split("\n\n"))
+
 # -------- Part 1 --------
 
 def find_reflection_line(pattern, comparison_function):
@@ -19,7 +32,7 @@ def find_reflection_line(pattern, comparison_function):
     Finds the line of reflection in a given pattern.
 
     Parameters:
-    - pattern (list of str or list of tuples): The pattern in which the reflection line is to be found.
+    - pattern (list of memoryview): The rows or columns of the pattern in which the reflection line is to be found.
     - comparison_function (function): A function that takes two halves of a pattern and returns
       True if they are reflected.
 
@@ -33,22 +46,21 @@ def find_reflection_line(pattern, comparison_function):
             return index
     return 0
 
-def calculate_pattern_summary(data, comparison_function):
+def calculate_pattern_summary(patterns, comparison_function):
     """
     Calculates the summary value of each pattern in the data.
 
     Parameters:
-    - data (str): Multiline string data representing different patterns.
+    - patterns (tuple of Grid): The patterns from parse_input().
     - comparison_function (function): Function to compare pattern halves for reflection.
 
     Returns:
     int: The total summary value for all patterns.
     """
     total = 0
-    for group in data.strip().split("\n\n"):
-        lines = group.splitlines()
-        horizontal_reflection = 100 * find_reflection_line(lines, comparison_function)
-        vertical_reflection = find_reflection_line(zip(*lines), comparison_function)
+    for pattern in patterns:
+        horizontal_reflection = 100 * find_reflection_line(list(pattern.rows()), comparison_function)
+        vertical_reflection = find_reflection_line(list(pattern.columns()), comparison_function)
         total += horizontal_reflection + vertical_reflection
     return total
 
@@ -57,7 +69,7 @@ def are_reflected_horizontally(x, y):
     Checks if two halves of a pattern are mirrored horizontally.
 
     Parameters:
-    - x, y (list of str): Two halves of a pattern.
+    - x, y (list of memoryview): Two halves of a pattern.
 
     Returns:
     bool: True if halves are mirrored horizontally, False otherwise.
@@ -65,18 +77,18 @@ def are_reflected_horizontally(x, y):
     length = min(len(x), len(y))
     return x[:length] == y[:length]
 
-def part1(data):
+def part1(patterns):
     """
     Part 1 of the challenge: Finds the reflection line in each pattern and calculates the summary value.
 
     Parameters:
-    - data (str): Multiline string data representing different patterns.
+    - patterns (tuple of Grid): The patterns from parse_input().
 
     Returns:
     int: Summary value calculated.
     """
 
-    return calculate_pattern_summary(data, are_reflected_horizontally)
+    return calculate_pattern_summary(patterns, are_reflected_horizontally)
 
 # -------- Part 2 --------
 
@@ -85,36 +97,34 @@ def are_reflected_with_one_smudge_corrected(x, y):
     Checks if two halves of a pattern are mirrored with one smudge corrected.
 
     Parameters:
-    - x, y (list of str or list of tuples): Two halves of a pattern.
+    - x, y (list of memoryview): Two halves of a pattern.
 
     Returns:
     bool: True if halves are mirrored with one smudge corrected, False otherwise.
     """
     return sum(c != d for a, b in zip(x, y) for c, d in zip(a, b)) == 1
 
-def part2(data):
+def part2(patterns):
     """
     Part 2 of the challenge: Finds the reflection line in each pattern with one smudge corrected
     and calculates the summary value.
 
     Parameters:
-    - data (str): Multiline string data representing different patterns.
+    - patterns (tuple of Grid): The patterns from parse_input().
 
     Returns:
     int: Summary value calculated.
     """
 
-    return calculate_pattern_summary(data, are_reflected_with_one_smudge_corrected)
+    return calculate_pattern_summary(patterns, are_reflected_with_one_smudge_corrected)
 
 
 def main():
-    dir_path = os.path.dirname(os.path.realpath(__file__))
-    input_file_path = os.path.join(dir_path, "input.txt")
-    with open(input_file_path, "r") as input_file:
-        data = input_file.read()
-
-    print("Part 1:", part1(data))
-    print("Part 2:", part2(data))
+    with open_input(input_source(__file__)) as data:
+        # Parse the input once for both parts
+        patterns = parse_input(data)
+    print("Part 1:", part1(patterns))
+    print("Part 2:", part2(patterns))
 
 
 if __name__ == "__main__":
@@ -1,7 +1,11 @@
-import os
-from operator import itemgetter
+from aoc.grid import Grid
+from aoc.inputs import input_source, open_input
 
 
+ROUNDED_ROCK = ord("O")
+CUBE_ROCK = ord("#")
+EMPTY_SPACE = ord(".")
+
 SAMPLE_INPUT = """O....#....
 O.OO#....#
 .....##...
@@ -21,46 +25,40 @@ def parse_input(input_data):
     Parse the puzzle input into a more manageable format.
 
     Parameters:
-    - input_data (list of str): The puzzle input as a list of strings, each representing a row.
+    - input_data (str): The puzzle input as a multiline string, each line representing a row.
 
     Returns:
-    list of list of str: A 2D grid representing the platform.
+    Grid: A read-only grid representing the platform, which the parts tilt copies of.
     """
-    return [list(row.strip()) for row in input_data]
+    return Grid.from_text(input_data).frozen()
 
 def tilt_platform_north(grid):
     """
     Tilts the platform to the north, causing all rounded rocks to move up.
 
+    The grid may be a rotated view of the platform, in which case the rocks roll towards the top of the view.
+
     Parameters:
-    - grid (list of list of str): The 2D grid representing the platform.
+    - grid (Grid): The grid representing the platform.
 
     Returns:
-    list of list of str: Updated grid after tilting north.
-    """
-    for column_index in range(len(grid[0])):
-        fixed_positions = set()
-        movable_positions = set()
-        for row_index in range(len(grid)):
-            if grid[row_index][column_index] == "O":
-                movable_positions.add((row_index, column_index))
-            elif grid[row_index][column_index] == "#":
-                fixed_positions.add((row_index, column_index))
-
-        # Move the rounded rocks upwards
-        new_movable_positions = fixed_positions.copy()
-        for position in sorted(movable_positions, key=itemgetter(0)):
-            row, col = position
-            row -= 1
-            while row >= 0 and (row, col) not in new_movable_positions:
-                row -= 1
-            new_movable_positions.add((row + 1, col))
-
-        # Update the grid with the new positions
-        for row, col in new_movable_positions - fixed_positions:
-            grid[row][col] = "O"
-        for row, col in movable_positions - (new_movable_positions - fixed_positions):
-            grid[row][col] = "."
+    Grid: Updated grid after tilting north.
+    """
+    cells = grid.cells
+    for column_index in range(grid.width):
+        column = grid.column_indices(column_index)
+        # Topmost row the next rounded rock can roll to
+        free_row = 0
+        for row_index, cell_index in enumerate(column):
+            cell = cells[cell_index]
+            if cell == ROUNDED_ROCK:
+                # Move the rounded rock upwards
+                if row_index != free_row:
+                    cells[column[free_row]] = ROUNDED_ROCK
+                    cells[cell_index] = EMPTY_SPACE
+                free_row += 1
+            elif cell == CUBE_ROCK:
+                free_row = row_index + 1
 
     return grid
 
@@ -69,164 +67,94 @@ def calculate_total_load(grid):
     Calculates the total load on the north support beams.
 
     Parameters:
-    - grid (list of list of str): The 2D grid representing the platform.
+    - grid (Grid): The grid representing the platform.
 
     Returns:
     int: The total load on the north support beams.
     """
     total_load = 0
-    for row_index, row in enumerate(grid):
-        load_per_row = sum(1 for cell in row if cell == "O")
-        total_load += load_per_row * (len(grid) - row_index)
+    for row_index, row in enumerate(grid.rows()):
+        load_per_row = row.tobytes().count(ROUNDED_ROCK)
+        total_load += load_per_row * (grid.height - row_index)
     return total_load
 
-def part1(input_data):
+def part1(platform):
     """
     Part 1 of the puzzle: Calculates the total load on the north support beams after tilting.
 
     Parameters:
-    - input_data (list of str): The puzzle input.
+    - platform (Grid): The platform from parse_input().
 
     Returns:
     int: Total load on the north support beams.
     """
-    grid = parse_input(input_data)
-    tilted_grid = tilt_platform_north(grid)
+    tilted_grid = tilt_platform_north(platform.copy())
     return calculate_total_load(tilted_grid)
 
 
 # ------- Part 2 -------
 
-def spin_cycle(fixed_positions, movable_positions, grid_height, grid_width, iterations):
+def spin_cycle(grid, iterations):
     """
     Performs the 'spin cycle' by tilting the platform in four directions for a given number of iterations,
     detects repeating patterns, and calculates the total load after the specified number of cycles.
 
     Parameters:
-    - fixed_positions (set of tuples): Set of coordinates for fixed objects on the grid.
-    - movable_positions (set of tuples): Set of coordinates for movable objects on the grid.
-    - grid_height (int): The height of the grid.
-    - grid_width (int): The width of the grid.
+    - grid (Grid): The grid representing the platform, which is tilted in place.
     - iterations (int): Number of iterations to perform.
 
     Returns:
     int: Total load on the north support beams after the specified number of cycles.
     """
-    seen_states = {frozenset(movable_positions): 0}
+    # Tilting the views rotated clockwise towards their top tilts the platform north, west, south and east
+    tilt_views = [grid.rotated(turns) for turns in range(4)]
 
-    # Cache to store the fixed positions after each 90-degree rotation
-    rotation_cache = [(fixed_positions, grid_height)]
-    for _ in range(3):
-        last_fixed_positions, last_height = rotation_cache[-1]
-        rotated_fixed_positions = rotate_90_degrees(last_fixed_positions, last_height)
-        rotation_cache.append((rotated_fixed_positions, grid_width))
-        grid_height, grid_width = grid_width, grid_height
+    # Every state is stored as the bytes of the grid, together with the load it puts on the beams
+    seen_states = {bytes(grid.cells): 0}
+    loads = [calculate_total_load(grid)]
 
     for current_iteration in range(1, iterations + 1):
-        for fixed, height in rotation_cache:
-            movable_positions = rotate_90_degrees(move_objects_north(fixed, movable_positions), height)
+        for view in tilt_views:
+            tilt_platform_north(view)
 
-        state_key = frozenset(movable_positions)
+        state_key = bytes(grid.cells)
         if state_key in seen_states:
             break
 
         seen_states[state_key] = current_iteration
-        seen_states[current_iteration] = state_key
+        loads.append(calculate_total_load(grid))
+    else:
+        # The platform never returned to an earlier state
+        return loads[-1]
 
     cycle_start_iteration = seen_states[state_key]
     cycle_length = current_iteration - cycle_start_iteration
     remaining_iterations = iterations - cycle_start_iteration
     final_iteration = remaining_iterations % cycle_length + cycle_start_iteration
 
-    return calculate_load_from_positions(seen_states[final_iteration], grid_height)
-
-def rotate_90_degrees(coordinates, height):
-    """
-    Rotates the set of coordinates by 90 degrees.
-
-    Parameters:
-    - coordinates (set of tuples): Set of coordinates to rotate.
-    - height (int): The height of the grid, used for rotation calculation.
-
-    Returns:
-    set of tuples: Rotated coordinates.
-    """
-    return set((col, height - row - 1) for row, col in coordinates)
-
-def calculate_load_from_positions(positions, grid_height):
-    """
-    Calculates the total load on the north support beams based on the positions of the movable objects.
-
-    Parameters:
-    - positions (set of tuples): Set of coordinates of the movable objects.
-    - grid_height (int): The height of the grid.
-
-    Returns:
-    int: Total load on the north support beams.
-    """
-    return sum(grid_height - row for row, _ in positions)
-
-def move_objects_north(fixed_positions, movable_positions):
-    """
-    Moves the movable objects (rounded rocks) north considering the positions of fixed objects (cube-shaped rocks).
-
-    Parameters:
-    - fixed_positions (set of tuples): Set of coordinates for fixed objects on the grid.
-    - movable_positions (set of tuples): Set of coordinates for movable objects on the grid.
-
-    Returns:
-    set of tuples: Updated positions of the movable objects after moving them north.
-    """
-    new_movable_positions = fixed_positions.copy()
-
-    for position in sorted(movable_positions, key=itemgetter(0)):
-        row, column = position
-        # Move each movable object north until it hits a fixed object or the edge
-        row -= 1
-        while row >= 0 and (row, column) not in new_movable_positions:
-            row -= 1
-
-        new_movable_positions.add((row + 1, column))
-
-    # Return the updated positions of movable objects, excluding the original fixed positions
-    return new_movable_positions - fixed_positions
+    return loads[final_iteration]
 
-def part2(input_data):
+def part2(platform):
     """
     Calculates the total load on the north support beams after 1,000,000,000 cycles of the spin cycle.
 
     Parameters:
-    - grid (list of str): The puzzle input represented as a list of strings, each string being a row of the grid.
+    - platform (Grid): The platform from parse_input().
 
     Returns:
     int: Total load on the north support beams after 1,000,000,000 cycles.
     """
-    grid = parse_input(input_data)
-
-    height, width = len(grid), len(grid[0])
-    fixed_positions = set()
-    movable_positions = set()
-
-    for row_index, row in enumerate(grid):
-        for col_index, char in enumerate(row):
-            if char == "#":
-                fixed_positions.add((row_index, col_index))
-            elif char == "O":
-                movable_positions.add((row_index, col_index))
-
-    return spin_cycle(fixed_positions, movable_positions, height, width, 1000000000)
+    return spin_cycle(platform.copy(), 1000000000)
 
 
 # Main Execution
 
 def main():
-    dir_path = os.path.dirname(os.path.realpath(__file__))
-    input_file_path = os.path.join(dir_path, "input.txt")
-    with open(input_file_path, "r") as input_file:
-        input_data = input_file.readlines()
-
-    print("Part 1:", part1(input_data))
-    print("Part 2:", part2(input_data))
+    with open_input(input_source(__file__)) as input_data:
+        # Parse the input once for both parts
+        platform = parse_input(input_data)
+    print("Part 1:", part1(platform))
+    print("Part 2:", part2(platform))
 
 
 if __name__ == "__main__":
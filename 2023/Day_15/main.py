@@ -1,6 +1,10 @@
-import os
+from aoc.inputs import input_source, iter_lines, open_input
 
 
+# The input is read lazily step by step while it is parsed
+INPUT_MODE = "lines"
+INPUT_SEPARATOR = ","
+
 SAMPLE_INPUT = """rn=1,cm-,qp=3,cm=2,qp-,pc=4,ot=9,ab=5,pc-,pc=6,ot=7"""
 
 # ------- Part 1 -------
@@ -10,12 +14,12 @@ def parse_input(input_data):
     Parse the puzzle input into a more manageable format.
 
     Parameters:
-    - input_data (list of str): The puzzle input as a string.
+    - input_data (str or iterable of str): The puzzle input as a string or as an iterable of steps.
 
     Returns:
-    list of str: A list of strings representing the steps.
+    tuple of str: The steps, without the line break at the end of the input.
     """
-    return input_data.split(",")
+    return tuple(iter_lines(input_data, INPUT_SEPARATOR))
 
 def hash_algorithm(step):
     """
@@ -35,17 +39,16 @@ def hash_algorithm(step):
         current_value = (current_value + ord(char)) * 17 % 256
     return current_value
     
-def part1(input_data):
+def part1(steps):
     """
     Solve for the answer to part 1.
 
     Parameters:
-    - input_data (list of str): The puzzle input as a string, representing the steps.
+    - steps (tuple of str): The steps from parse_input().
 
     Returns:
     int: The answer to part 1.
     """
-    steps = parse_input(input_data)
     return sum(hash_algorithm(step) for step in steps)
 
 # ------- Part 2 -------
@@ -106,17 +109,16 @@ def calculate_focusing_power(boxes):
     return total_power
 
 
-def part2(input_data):
+def part2(steps):
     """
     Solve for the answer to part 2.
 
     Parameters:
-    - input_data (str): The puzzle input as a string, representing the steps.
+    - steps (tuple of str): The steps from parse_input().
 
     Returns:
     int: The answer to part 2.
     """
-    steps = parse_input(input_data)
     boxes = {}
 
     for step in steps:
@@ -141,13 +143,11 @@ def part2(input_data):
 # Main Execution
 
 def main():
-    dir_path = os.path.dirname(os.path.realpath(__file__))
-    input_file_path = os.path.join(dir_path, "input.txt")
-    with open(input_file_path, "r") as input_file:
-        input_data = input_file.read()
-
-    print("Part 1:", part1(input_data))
-    print("Part 2:", part2(input_data))
+    with open_input(input_source(__file__), INPUT_MODE, INPUT_SEPARATOR) as input_data:
+        # Parse the input once for both parts
+        steps = parse_input(input_data)
+    print("Part 1:", part1(steps))
+    print("Part 2:", part2(steps))
 
 
 if __name__ == "__main__":
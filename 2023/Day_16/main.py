@@ -1,6 +1,17 @@
-import os
 from collections import deque
 
+from aoc.grid import DIRECTION_DELTAS, DOWN, LEFT, RIGHT, UP, Grid
+from aoc.inputs import input_source, open_input
+
+SLASH = ord("/")
+BACKSLASH = ord("\\")
+HORIZONTAL_SPLITTER = ord("-")
+VERTICAL_SPLITTER = ord("|")
+
+# New direction of a beam after a mirror, indexed by its current direction
+SLASH_MIRROR = (RIGHT, UP, LEFT, DOWN)
+BACKSLASH_MIRROR = (LEFT, DOWN, RIGHT, UP)
+
 # ------- Part 1 -------
 
 def parse_input(input_text):
@@ -11,53 +22,57 @@ def parse_input(input_text):
     - input_text (str): The raw input text representing the grid.
 
     Returns:
-    list of list of str: A grid representation of the puzzle input.
+    Grid: A read-only grid representation of the puzzle input.
     """
-    # Split the input text into lines and then split each line into a list of characters
-    return [list(line) for line in input_text.splitlines()]
+    return Grid.from_text(input_text).frozen()
 
 def simulate_light_beam(grid, start_position, direction):
     """
     Simulates the light beam's travel through the grid and counts the number of energized tiles.
 
     Parameters:
-    - grid (list of list of str): The grid representation of the puzzle input.
-    - start_position (tuple): The starting position of the light beam.
-    - direction (tuple): The initial direction of the light beam.
+    - grid (Grid): The grid representation of the puzzle input.
+    - start_position (tuple): The starting position (row, column) of the light beam.
+    - direction (int): The initial direction of the light beam, one of UP, RIGHT, DOWN and LEFT.
 
     Returns:
     int: The count of energized tiles.
     """
+    cells, height, width = grid.cells, grid.height, grid.width
     beam_queue = deque([(start_position, direction)])  # Queue to manage the beam's position and direction
-    visited = set()  # Set to keep track of visited positions and directions
-    energized_tiles = set()  # Set to keep track of energized tiles
+    visited = bytearray(grid.size)  # One bit per direction a beam has passed each tile in
 
     while beam_queue:
-        (row, col), (delta_row, delta_col) = beam_queue.pop()
+        (row, col), direction = beam_queue.pop()
 
         # Continue moving the beam while it's within the grid and hasn't been in this state before
-        while 0 <= row < len(grid) and 0 <= col < len(grid[0]) and ((row, col, delta_row, delta_col) not in visited):
-            visited.add((row, col, delta_row, delta_col))  # Mark the current state as visited
-            energized_tiles.add((row, col))  # Mark the current tile as energized
+        while 0 <= row < height and 0 <= col < width:
+            index = row * width + col
+            direction_bit = 1 << direction
+            if visited[index] & direction_bit:
+                break
+            visited[index] |= direction_bit  # Mark the current state as visited
 
-            current_tile = grid[row][col]
+            current_tile = cells[index]
 
             # Reflect or split the beam based on the encountered tile
-            if current_tile == "/":
-                delta_row, delta_col = -delta_col, -delta_row
-            elif current_tile == "\\":
-                delta_row, delta_col = delta_col, delta_row
-            elif current_tile == "-" and delta_row != 0:
-                delta_row, delta_col = 0, 1
-                beam_queue.append(((row, col - 1), (0, -1)))
-            elif current_tile == "|" and delta_col != 0:
-                delta_row, delta_col = 1, 0
-                beam_queue.append(((row - 1, col), (-1, 0)))
-
+            if current_tile == SLASH:
+                direction = SLASH_MIRROR[direction]
+            elif current_tile == BACKSLASH:
+                direction = BACKSLASH_MIRROR[direction]
+            elif current_tile == HORIZONTAL_SPLITTER and direction in (UP, DOWN):
+                direction = RIGHT
+                beam_queue.append(((row, col - 1), LEFT))
+            elif current_tile == VERTICAL_SPLITTER and direction in (LEFT, RIGHT):
+                direction = DOWN
+                beam_queue.append(((row - 1, col), UP))
+
+            delta_row, delta_col = DIRECTION_DELTAS[direction]
             row += delta_row
             col += delta_col
 
-    return len(energized_tiles)
+    # Every tile a beam has passed through is energized
+    return grid.size - visited.count(0)
 
 
 # ------- Part 2 -------
@@ -67,42 +82,60 @@ def find_max_energized_tiles(grid):
     Finds the maximum number of energized tiles by starting the beam from different edges of the grid.
 
     Parameters:
-    - grid (list of list of str): The grid representation of the puzzle input.
+    - grid (Grid): The grid representation of the puzzle input.
 
     Returns:
     int: The maximum count of energized tiles.
     """
     max_energized = 0  # Variable to store the maximum number of energized tiles
-    grid_height = len(grid)  # Height of the grid
-    grid_width = len(grid[0])  # Width of the grid
+    grid_height = grid.height  # Height of the grid
+    grid_width = grid.width  # Width of the grid
 
     # Check all possible starting positions on the grid's perimeter
     for row in range(grid_height):
-        max_energized = max(max_energized, simulate_light_beam(grid, start_position=(row, 0), direction=(0, 1)))
+        max_energized = max(max_energized, simulate_light_beam(grid, start_position=(row, 0), direction=RIGHT))
         max_energized = max(max_energized, simulate_light_beam(grid, start_position=(row, grid_width - 1),
-                                                                    direction=(0, -1)))
+                                                                    direction=LEFT))
 
     for col in range(grid_width):
-        max_energized = max(max_energized, simulate_light_beam(grid, start_position=(0, col), direction=(1, 0)))
+        max_energized = max(max_energized, simulate_light_beam(grid, start_position=(0, col), direction=DOWN))
         max_energized = max(max_energized, simulate_light_beam(grid, start_position=(grid_height - 1, col),
-                                                                    direction=(-1, 0)))
+                                                                    direction=UP))
 
     return max_energized
 
-# Main function
+def part1(grid):
+    """
+    Solves part 1 of the puzzle with the beam entering the top-left corner heading right.
 
-def main():
-    dir_path = os.path.dirname(os.path.realpath(__file__))
-    input_file_path = os.path.join(dir_path, "input.txt")
-    with open(input_file_path, "r") as input_file:
-        input_data = input_file.read()
-        input_data = rf"{input_data}"
+    Parameters:
+    - grid (Grid): The grid from parse_input().
+
+    Returns:
+    int: The count of energized tiles.
+    """
+    return simulate_light_beam(grid, start_position=(0, 0), direction=RIGHT)
+
+def part2(grid):
+    """
+    Solves part 2 of the puzzle by trying every edge tile as the beam's entry point.
 
-    grid = parse_input(input_data)
-    energized_tiles = simulate_light_beam(grid, start_position=(0, 0), direction=(0, 1))
+    Parameters:
+    - grid (Grid): The grid from parse_input().
 
-    print("Part 1:", energized_tiles)
-    print("Part 2:", find_max_energized_tiles(grid))
+    Returns:
+    int: The maximum count of energized tiles.
+    """
+    return find_max_energized_tiles(grid)
+
+# Main function
+
+def main():
+    with open_input(input_source(__file__)) as input_data:
+        # Parse the input once for both parts
+        grid = parse_input(input_data)
+    print("Part 1:", part1(grid))
+    print("Part 2:", part2(grid))
 
 
 if __name__ == "__main__":
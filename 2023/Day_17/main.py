@@ -1,6 +1,8 @@
-import os
 import bisect
 
+from aoc.grid import RIGHT, Grid
+from aoc.inputs import input_source, open_input
+
 SAMPLE_INPUT = """2413432311323
 3215453535623
 3255245654254
@@ -16,6 +18,22 @@ SAMPLE_INPUT = """2413432311323
 4322674655533
 """
 
+# Translation table from the digit characters of the input to their values
+DIGIT_VALUES = bytes.maketrans(b"0123456789", bytes(range(10)))
+
+def parse_input(input_data):
+    """
+    Parses the map of heat loss values once for both parts.
+
+    Parameters:
+    - input_data (str): Multiline string representation of the grid with heat loss values.
+
+    Returns:
+    Grid: A read-only grid of the heat loss of every block, as values from 0 to 9.
+    """
+    heat_loss_grid = Grid.from_text(input_data)
+    return Grid(heat_loss_grid.cells.translate(DIGIT_VALUES), heat_loss_grid.height, heat_loss_grid.width).frozen()
+
 def possible_turns(current_direction, steps_taken, min_steps=1, max_steps=3):
     """
     Returns a list of possible turns based on the current direction and steps taken.
@@ -36,54 +54,43 @@ def possible_turns(current_direction, steps_taken, min_steps=1, max_steps=3):
         turns.extend([(current_direction - 1) % 4, (current_direction + 1) % 4])
     return turns
 
-def find_least_heat_loss_path(grid, min_steps, max_steps):
+def find_least_heat_loss_path(heat_loss_grid, min_steps, max_steps):
     """
     Finds the path with the least heat loss in a grid, given constraints on movement.
 
     Parameters:
-    - grid (str): Multiline string representation of the grid with heat loss values.
+    - heat_loss_grid (Grid): The grid of heat loss values from parse_input().
     - min_steps (int): Minimum consecutive steps in the same direction before a turn is required.
     - max_steps (int): Maximum consecutive steps allowed in the same direction.
 
     Returns:
     int: The minimum heat loss incurred on the optimal path.
     """
-    # Convert the string grid into a 2D list of integers
-    heat_loss_grid = [[int(cell) for cell in row] for row in grid.splitlines() if row]
+    goal = heat_loss_grid.size - 1
     # Initialize the priority queue with the starting position and cost
-    priority_queue = [(0, (0, 0, 1, 0))]  # Format: (heat_loss, (y, x, direction, steps))
+    priority_queue = [(0, (0, RIGHT, 0))]  # Format: (heat_loss, (index, direction, steps))
     # Dictionary to keep track of the best (lowest) heat loss for each state
-    best_heat_loss = {(0, 0, 1, 0): 0}
+    best_heat_loss = {(0, RIGHT, 0): 0}
 
     while priority_queue:
         # Pop the state with the lowest heat loss
-        current_heat_loss, (y, x, direction, steps) = priority_queue.pop(0)
+        current_heat_loss, (index, direction, steps) = priority_queue.pop(0)
         # Check if the goal state has been reached
-        if y == len(heat_loss_grid) - 1 and x == len(heat_loss_grid[0]) - 1:
+        if index == goal:
             return current_heat_loss
         # Check if this state has been visited before with a lower heat loss
-        if current_heat_loss > best_heat_loss.get((y, x, direction, steps), float("inf")):
+        if current_heat_loss > best_heat_loss.get((index, direction, steps), float("inf")):
             continue
         # Explore next steps
         for new_direction in possible_turns(direction, steps, min_steps, max_steps):
-            # Calculate the new state
-            new_y, new_x = y, x
-            if new_direction == 0:  # Up
-                new_y -= 1
-            elif new_direction == 1:  # Right
-                new_x += 1
-            elif new_direction == 2:  # Down
-                new_y += 1
-            elif new_direction == 3:  # Left
-                new_x -= 1
-
-            # Check if the new state is valid
-            if not (0 <= new_y < len(heat_loss_grid) and 0 <= new_x < len(heat_loss_grid[new_y])):
+            # Calculate the new state and check if it is valid
+            new_index = heat_loss_grid.neighbor(index, new_direction)
+            if new_index is None:
                 continue
             # Calculate the new heat loss and steps
-            new_heat_loss = current_heat_loss + heat_loss_grid[new_y][new_x]
+            new_heat_loss = current_heat_loss + heat_loss_grid.cells[new_index]
             new_steps = steps + 1 if direction == new_direction else 1
-            new_state = (new_y, new_x, new_direction, new_steps)
+            new_state = (new_index, new_direction, new_steps)
             # Check if the new state has a lower heat loss
             if new_heat_loss < best_heat_loss.get(new_state, float("inf")):
                 # Update the best heat loss for the new state
@@ -95,42 +102,40 @@ def find_least_heat_loss_path(grid, min_steps, max_steps):
 
 # ------- Part 1 -------
 
-def part1(input_data):
+def part1(heat_loss_grid):
     """
     Finds the least costly path in the grid with constraints on turns.
     
     Parameters:
-    - input_data (str): Multiline string representation of the grid.
+    - heat_loss_grid (Grid): The grid of heat loss values from parse_input().
     
     Returns:
     int: Cost of the least costly path.
     """
-    return find_least_heat_loss_path(input_data, min_steps=1, max_steps=3)
+    return find_least_heat_loss_path(heat_loss_grid, min_steps=1, max_steps=3)
 
 # ------- Part 2 -------
 
-def part2(input_data):
+def part2(heat_loss_grid):
     """
     Finds the least costly path in the grid with constraints on turns.
     
     Parameters:
-    - input_data (str): Multiline string representation of the grid.
+    - heat_loss_grid (Grid): The grid of heat loss values from parse_input().
     
     Returns:
     int: Cost of the least costly path.
     """
-    return find_least_heat_loss_path(input_data, min_steps=4, max_steps=10)
+    return find_least_heat_loss_path(heat_loss_grid, min_steps=4, max_steps=10)
 
 # Main function
 
 def main():
-    dir_path = os.path.dirname(os.path.realpath(__file__))
-    input_file_path = os.path.join(dir_path, "input.txt")
-    with open(input_file_path, "r") as input_file:
-        input_data = input_file.read()
-
-    print("Part 1:", part1(input_data))
-    print("Part 2:", part2(input_data))
+    with open_input(input_source(__file__)) as input_data:
+        # Parse the input once for both parts
+        heat_loss_grid = parse_input(input_data)
+    print("Part 1:", part1(heat_loss_grid))
+    print("Part 2:", part2(heat_loss_grid))
 
 
 if __name__ == "__main__":
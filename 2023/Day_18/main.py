@@ -1,6 +1,9 @@
-import os
+from aoc.inputs import input_source, iter_lines, open_input
 
 
+# The input is read lazily line by line while it is parsed
+INPUT_MODE = "lines"
+
 SAMPLE_INPUT = """R 6 (#70c710)
 D 5 (#0dc571)
 L 2 (#5713f0)
@@ -17,30 +20,45 @@ L 2 (#015232)
 U 2 (#7a21e3)
 """
 
-def parse_data(input_data):
+def parse_input(input_data):
     """
-    Parses the dig plan into a list of directions and lengths.
+    Parses the dig plan once into the steps of both parts.
+
+    Part 1 reads the direction and length at the start of each line, part 2 reads them from the
+    hexadecimal code at its end.
 
     Parameters:
-    - input_data (str): Multiline string representing the dig plan.
+    - input_data (str or iterable of str): Multiline string or iterable of lines representing the dig plan
+      with hexadecimal codes.
 
     Returns:
-    list of tuples: Each tuple contains a direction ("R", "L", "U", "D") and a length.
+    tuple: The steps of part 1 and of part 2, each a tuple of (direction, length) tuples with the direction
+    being one of "R", "L", "U" and "D".
     """
+    dig_plan, corrected_dig_plan = [], []
+    hex_to_dir = {"0": "R", "1": "D", "2": "L", "3": "U"}
 
-    dig_plan = []
-
-    for line in input_data.splitlines():
+    for line in iter_lines(input_data):
+        if not line:
+            continue
         dig_plan.append((line[0], int(line[2:4])))
 
-    return dig_plan
+        _, _, hex_code = line.split()
+        # Remove "(", "#" and ")"
+        hex_code = hex_code[2:-1]
+        direction = hex_to_dir[hex_code[-1]]
+        # Convert hexadecimal to decimal
+        distance = int(hex_code[:-1], 16)
+        corrected_dig_plan.append((direction, distance))
+
+    return tuple(dig_plan), tuple(corrected_dig_plan)
 
 def calculate_lagoon_volume(steps):
     """
     Calculates the total volume of the lagoon based on the digger's steps.
 
     Parameters:
-    - steps (list of tuples): The digger's steps as a list of directions and lengths.
+    - steps (tuple of tuples): The digger's steps as directions and lengths.
 
     Returns:
     int: The total volume of the lagoon in cubic meters.
@@ -84,67 +102,42 @@ def calculate_lagoon_volume(steps):
 # ------- Part 1 -------
 
 
-def part1(input_data):
+def part1(dig_plans):
     """
     Solves part 1 of the puzzle.
 
     Parameters:
-    - input_data (str): Multiline string representing the dig plan.
+    - dig_plans (tuple): The steps of both parts from parse_input().
 
     Returns:
     int: The volume of lava the lagoon can hold.
     """
-    dig_plan = parse_data(input_data)
+    dig_plan, _ = dig_plans
     return calculate_lagoon_volume(dig_plan)
 
 # ------- Part 2 -------
 
-def parse_data_part2(input_data):
-    """
-    Parse input data to extract hexadecimal codes and convert them into digging instructions.
-
-    Parameters:
-    - input_data (str): Multiline string representing the dig plan with hexadecimal codes.
-
-    Returns:
-    list of tuples: Each tuple contains a direction ('R', 'L', 'U', 'D') and a length.
-    """
-    steps = []
-    hex_to_dir = {"0": "R", "1": "D", "2": "L", "3": "U"}
-
-    for line in input_data.split("\n"):
-        _, _, hex_code = line.split()
-        # Remove "(", "#" and ")"
-        hex_code = hex_code[2:-1]
-        direction = hex_to_dir[hex_code[-1]]
-        # Convert hexadecimal to decimal
-        distance = int(hex_code[:-1], 16)
-        steps.append((direction, distance))
-    return steps
-
-def part2(input_data):
+def part2(dig_plans):
     """
     Solves part 2 of the puzzle.
 
     Parameters:
-    - input_data (str): Multiline string representing the dig plan with hexadecimal codes.
+    - dig_plans (tuple): The steps of both parts from parse_input().
 
     Returns:
     int: The volume of lava the lagoon can hold after following the corrected dig plan.
     """
-    steps = parse_data_part2(input_data)
+    _, steps = dig_plans
     return calculate_lagoon_volume(steps)
 
 # Main function
 
 def main():
-    dir_path = os.path.dirname(os.path.realpath(__file__))
-    input_file_path = os.path.join(dir_path, "input.txt")
-    with open(input_file_path, "r") as input_file:
-        input_data = input_file.read()
-
-    print("Part 1:", part1(input_data))
-    print("Part 2:", part2(input_data))
+    with open_input(input_source(__file__), INPUT_MODE) as input_data:
+        # Parse the input once for both parts
+        dig_plans = parse_input(input_data)
+    print("Part 1:", part1(dig_plans))
+    print("Part 2:", part2(dig_plans))
 
 
 if __name__ == "__main__":
@@ -1,5 +1,7 @@
 from math import prod
-import os
+from types import MappingProxyType
+
+from aoc.inputs import input_source, open_input
 
 
 SAMPLE_INPUT = """px{a<2006:qkq,m>2090:A,rfg}
@@ -21,15 +23,16 @@ hdj{m>838:A,pv}
 {x=2127,m=1623,a=2188,s=1013}
 """
 
-def parse_data(input_data):
+def parse_input(input_data):
     """
-    Parses the input data into workflows and parts.
+    Parses the input data into workflows and parts once for both parts of the puzzle.
 
     Parameters:
     - input_data (str): Multiline string representing the puzzle input.
 
     Returns:
-    Tuple containing a dictionary of workflows and a list of parts.
+    Tuple containing a read-only mapping of workflow names to their rules and a tuple of read-only
+    mappings of the ratings of each part.
     """
     def parse_rules(data):
         """
@@ -41,11 +44,11 @@ def parse_data(input_data):
                 continue
             # Parse the workflow name and rules
             workflow_name = line[:line.index("{")]
-            rules = [
+            rules = tuple(
                 (rule.split(":")[1], (rule[0], rule[1], int(rule[2:rule.index(":")])))
                 if ":" in rule else (rule, None)
                 for rule in line[line.index("{") + 1 : -1].split(",")
-            ]
+            )
             yield workflow_name, rules
 
     def parse_points(data):
@@ -58,13 +61,13 @@ def parse_data(input_data):
                 continue
             # Parse the ratings
             part_ratings = {kv[0]: int(kv[2:]) for kv in line[1:-1].split(",") if kv[1] == "="}
-            yield part_ratings
+            yield MappingProxyType(part_ratings)
 
     # Split the input data into rules and parts
     rules, parts_data = input_data.split("\n\n", maxsplit=1)
     # Parse the rules and parts
-    workflows = dict(parse_rules(rules))
-    parts = list(parse_points(parts_data))
+    workflows = MappingProxyType(dict(parse_rules(rules)))
+    parts = tuple(parse_points(parts_data))
     return workflows, parts
 
 def evaluate_part(part, workflows):
@@ -72,8 +75,8 @@ def evaluate_part(part, workflows):
     Evaluates a part through the workflows.
 
     Parameters:
-    - part (dict): A dictionary representing the part's ratings.
-    - workflows (dict): A dictionary of workflows.
+    - part (Mapping): A mapping representing the part's ratings.
+    - workflows (Mapping): A mapping of workflows.
 
     Returns:
     bool: True if the part is accepted, False otherwise.
@@ -106,18 +109,18 @@ def evaluate_part(part, workflows):
 
     return False
 
-def part1(input_data):
+def part1(system):
     """
     Solves part 1 of the puzzle.
 
     Parameters:
-    - input_data (str): Multiline string representing the puzzle input.
+    - system (tuple): The workflows and parts from parse_input().
 
     Returns:
     int: Sum of the ratings for all parts that are accepted.
     """
-    workflows, parts = parse_data(input_data)
-    
+    workflows, parts = system
+
     # Evaluate each part through the workflows
     total = 0
     for part in parts:
@@ -127,18 +130,17 @@ def part1(input_data):
 
 # ------- Part 2 -------
 
-def part2(input_data):
+def part2(system):
     """
     Solves part 2 of the puzzle.
 
     Parameters:
-    - input_data (str): Multiline string representing the puzzle input.
+    - system (tuple): The workflows and parts from parse_input().
 
     Returns:
     int: The number of distinct combinations of ratings that will be accepted.
     """
-    # Parse the input data
-    workflows, _ = parse_data(input_data)
+    workflows, _ = system
 
     def evaluate_combinations(workflow_name, bounds):
         """
@@ -189,13 +191,11 @@ def part2(input_data):
 # Main function
 
 def main():
-    dir_path = os.path.dirname(os.path.realpath(__file__))
-    input_file_path = os.path.join(dir_path, "input.txt")
-    with open(input_file_path, "r") as input_file:
-        input_data = input_file.read()
-
-    print("Part 1:", part1(input_data))
-    print("Part 2:", part2(input_data))
+    with open_input(input_source(__file__)) as input_data:
+        # Parse the input once for both parts
+        system = parse_input(input_data)
+    print("Part 1:", part1(system))
+    print("Part 2:", part2(system))
 
 
 if __name__ == "__main__":
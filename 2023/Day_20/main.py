@@ -1,17 +1,23 @@
-import os
 from collections import deque
 from itertools import count
 from math import lcm
+from types import MappingProxyType
+
+from aoc.inputs import input_source, open_input
 
 def parse_input(input_data):
     """
-    Parse the input data to construct the network, flip_flops, and conjunctions.
+    Parse the input data once into the structure of the network.
+
+    The states of the modules change while signals are sent, so they are not part of the parsed
+    structure. Every part starts from fresh states created by initial_states().
 
     Args:
     - input_data: A string containing the input data.
 
     Returns:
-    A tuple containing the network, flip_flops, and conjunctions dictionaries.
+    A tuple containing the read-only network, mapping every module to a tuple of its destinations,
+    and the read-only flip_flops and conjunctions dictionaries in their initial states.
     """
     # Initialize dictionaries to store the network structure and states
     flip_flops = {}
@@ -24,7 +30,7 @@ def parse_input(input_data):
         # Split each line into source and destinations
         source, destinations = line.split("->")
         source = source.strip()
-        destinations = list(map(str.strip, destinations.split(",")))
+        destinations = tuple(map(str.strip, destinations.split(",")))
 
         # Determine the type of the source and update the respective dictionary
         if source[0] == "%":
@@ -42,7 +48,24 @@ def parse_input(input_data):
         for dest in filter(conjunctions.__contains__, destinations):
             conjunctions[dest][source] = False
 
-    return network, flip_flops, conjunctions
+    return (
+        MappingProxyType(network),
+        MappingProxyType(flip_flops),
+        MappingProxyType({name: MappingProxyType(inputs) for name, inputs in conjunctions.items()}),
+    )
+
+def initial_states(modules):
+    """
+    Create the mutable states of the modules before the first button press.
+
+    Args:
+    - modules: The network, flip_flops, and conjunctions from parse_input().
+
+    Returns:
+    A tuple containing the network and new flip_flops and conjunctions dictionaries.
+    """
+    network, flip_flops, conjunctions = modules
+    return network, dict(flip_flops), {name: dict(inputs) for name, inputs in conjunctions.items()}
 
 def transmit_signal(network, flip_flops, conjunctions, sender, receiver, signal):
     """
@@ -117,7 +140,7 @@ def detect_cycles(network, flip_flops, conjunctions):
     # Identify receivers relevant for cycle detection
     relevant_receivers = set()
     for rx_source, destinations in network.items():
-        if destinations == ["rx"]:
+        if destinations == ("rx",):
             assert rx_source in conjunctions
             break
 
@@ -144,18 +167,18 @@ def detect_cycles(network, flip_flops, conjunctions):
             queue.extend(transmit_signal(network, flip_flops, conjunctions, sender, receiver, signal))
 
 
-def part1(network, flip_flops, conjunctions):
+def part1(modules):
     """
     Calculate the result for Part 1 of the challenge.
 
     Args:
-    - network: The network graph.
-    - flip_flops: A dictionary of flip-flop states.
-    - conjunctions: A dictionary of conjunction states.
+    - modules: The structure of the network from parse_input().
 
     Returns:
     The product of the total low and high signal counts.
     """
+    network, flip_flops, conjunctions = initial_states(modules)
+
     # Simulate the network and calculate the total signal counts
     total_high_signal = total_low_signal = 0
     for _ in range(1000):
@@ -164,31 +187,28 @@ def part1(network, flip_flops, conjunctions):
         total_low_signal += low_signal
     return total_low_signal * total_high_signal
 
-def part2(network, flip_flops, conjunctions):
+def part2(modules):
     """
     Calculate the result for Part 2 of the challenge.
 
     Args:
-    - network: The network graph.
-    - flip_flops: A dictionary of flip-flop states.
-    - conjunctions: A dictionary of conjunction states.
+    - modules: The structure of the network from parse_input().
 
     Returns:
     The least common multiple of the cycle detection iterations.
     """
+    # Start from fresh states so the button presses of part 1 don't offset the cycles
+    network, flip_flops, conjunctions = initial_states(modules)
+
     # Detect cycles in the network and calculate their least common multiple
     return lcm(*detect_cycles(network, flip_flops, conjunctions))
 
 def main():
-    dir_path = os.path.dirname(os.path.realpath(__file__))
-    input_file_path = os.path.join(dir_path, "input.txt")
-
-    with open(input_file_path, "r") as input_file:
-        input_data = input_file.read()
-
-    network, flip_flops, conjunctions = parse_input(input_data)
-    print("Part 1:", part1(network, flip_flops, conjunctions))
-    print("Part 2:", part2(network, flip_flops, conjunctions))
+    with open_input(input_source(__file__)) as input_data:
+        # Parse the input once for both parts
+        modules = parse_input(input_data)
+    print("Part 1:", part1(modules))
+    print("Part 2:", part2(modules))
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,6 @@
+"""Tooling shared by the Advent of Code solutions: running, timing and benchmarking the days."""
+
+from aoc.days import install as _install_days
+
+# Make the days importable by name, e.g. "import aoc.y2023.day15"
+_install_days()
@@ -0,0 +1,181 @@
+"""
+Solves one day for many input files in a single pool of warm worker processes.
+
+Every worker imports the day's solution once when it starts, so the interpreter startup, the import and
+module level setup such as compiled regular expressions are paid once per worker instead of once per
+input. The input files are then spread over the workers, and the answers of both parts are written as
+CSV or JSON together with the time every part took on every file.
+
+Inputs are given as files, directories (all files directly inside them) or glob patterns.
+
+Usage:
+    python -m aoc.batch DAY INPUT ... [--workers N] [--output PATH] [--format csv|json]
+"""
+
+import argparse
+import csv
+import glob
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from aoc.runner import DEFAULT_SEASON_DIR, PARSE, PARTS, discover_days, load_day, solve_day
+
+# Columns of the written results, one row for parsing and one per part for every input file
+FIELDS = ("input", "part", "answer", "wall_time", "cpu_time", "error")
+
+
+def expand_inputs(patterns):
+    """
+    Resolves files, directories and glob patterns into a list of input files.
+
+    Args:
+    patterns (iterable of str): Paths of files or directories, or glob patterns.
+
+    Returns:
+    list of Path: The input files in the order given, each directory and pattern sorted, without duplicates.
+    """
+    paths = []
+    for pattern in patterns:
+        path = Path(pattern)
+        if path.is_dir():
+            matches = sorted(child for child in path.iterdir() if child.is_file() and not child.name.startswith("."))
+        elif path.is_file():
+            matches = [path]
+        else:
+            matches = sorted(Path(match) for match in glob.glob(pattern, recursive=True) if os.path.isfile(match))
+        paths.extend(matches)
+    return list(dict.fromkeys(paths))
+
+
+def solve_input(day, script_path, input_path):
+    """
+    Parses one input file of a day and solves both parts on it.
+
+    Args:
+    day (int): The day of the puzzle.
+    script_path (str or Path): Path to the day's main.py.
+    input_path (str or Path): The input file.
+
+    Returns:
+    list of dict: One row for parsing, with the part "parse", and one per part with the columns in FIELDS.
+    """
+    try:
+        results = solve_day(day, script_path, input_path)
+    except Exception as error:  # pylint: disable=broad-except
+        # A broken input must not stop the rest of the batch
+        return [
+            {
+                "input": str(input_path),
+                "part": part,
+                "answer": None,
+                "wall_time": 0.0,
+                "cpu_time": 0.0,
+                "error": f"{type(error).__name__}: {error}",
+            }
+            for part in range(1, len(PARTS) + 1)
+        ]
+
+    return [
+        {
+            "input": str(input_path),
+            "part": "parse" if result.part == PARSE else result.part,
+            "answer": result.answer,
+            "wall_time": result.wall_time,
+            "cpu_time": result.cpu_time,
+            "error": result.error,
+        }
+        for result in results
+    ]
+
+
+def run_batch(day, script_path, input_paths, workers=None):
+    """
+    Solves a day for many input files in a process pool with the day imported in every worker.
+
+    Args:
+    day (int): The day of the puzzle.
+    script_path (str or Path): Path to the day's main.py.
+    input_paths (list of Path): The input files.
+    workers (int): Number of worker processes, defaults to the number of CPUs.
+
+    Returns:
+    list of dict: The rows of every input file, in the order of the input files.
+    """
+    workers = workers or os.cpu_count()
+    # Hand out several files per task, so the workers don't wait for the parent between small inputs
+    chunk_size = max(1, len(input_paths) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers, initializer=load_day, initargs=(script_path,)) as executor:
+        results = executor.map(
+            solve_input,
+            [day] * len(input_paths),
+            [script_path] * len(input_paths),
+            input_paths,
+            chunksize=chunk_size,
+        )
+        return [row for rows in results for row in rows]
+
+
+def write_results(rows, output_file, output_format="csv"):
+    """
+    Writes the rows of a batch as CSV or JSON.
+
+    Args:
+    rows (list of dict): The rows with the columns in FIELDS.
+    output_file (file): The opened text file to write to.
+    output_format (str): Either "csv" or "json".
+    """
+    if output_format == "json":
+        # Answers that JSON cannot represent are written as strings
+        json.dump(rows, output_file, indent=2, default=str)
+        output_file.write("\n")
+        return
+
+    writer = csv.DictWriter(output_file, fieldnames=FIELDS)
+    writer.writeheader()
+    writer.writerows(rows)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Solve one day for many input files in a pool of warm workers.")
+    parser.add_argument("day", type=int, help="day to solve")
+    parser.add_argument("inputs", nargs="+", help="input files, directories of input files or glob patterns")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="number of worker processes")
+    parser.add_argument("--season-dir", type=Path, default=DEFAULT_SEASON_DIR,
+                        help="directory containing the Day_XX folders")
+    parser.add_argument("--output", type=Path, help="file to write the results to (default: standard output)")
+    parser.add_argument("--format", choices=("csv", "json"),
+                        help="format of the results (default: from the extension of --output, else csv)")
+    args = parser.parse_args(argv)
+
+    days = discover_days(args.season_dir)
+    if args.day not in days:
+        parser.error(f"no solution found for day {args.day}")
+    input_paths = expand_inputs(args.inputs)
+    if not input_paths:
+        parser.error("no input files found")
+    output_format = args.format or ("json" if args.output and args.output.suffix == ".json" else "csv")
+
+    wall_start = time.perf_counter()
+    rows = run_batch(args.day, days[args.day], input_paths, args.workers)
+    wall_time = time.perf_counter() - wall_start
+
+    if args.output:
+        with open(args.output, "w", newline="") as output_file:
+            write_results(rows, output_file, output_format)
+    else:
+        write_results(rows, sys.stdout, output_format)
+
+    failures = sum(1 for row in rows if row["error"])
+    print(
+        f"Solved {len(input_paths)} inputs of day {args.day} in {wall_time:.2f}s"
+        f" with {args.workers} workers, {failures} part(s) failed",
+        file=sys.stderr,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,245 @@
+"""
+Benchmarks the solvers on generated inputs of increasing size and estimates how they scale.
+
+For every day and part the solver is run on inputs from aoc.generators at each requested scale, each
+run in a fresh process so that caches of earlier runs cannot distort the results. The wall-clock time
+and the peak memory allocated by the solver are recorded, and an empirical complexity exponent k is
+fitted so that time ~ scale ** k.
+
+With --save the run is stored by aoc.results under the current commit and machine, so that a later commit
+can be checked for regressions against it.
+
+Usage:
+    python -m aoc.benchmark [DAY ...] [--scales 1 10 100] [--seed 0] [--max-seconds 60] [--json PATH]
+    python -m aoc.benchmark [DAY ...] [--repeat 3] --save
+"""
+
+import argparse
+import gc
+import json
+import math
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass
+from functools import partial
+from itertools import groupby
+from operator import attrgetter
+from pathlib import Path
+
+from aoc.generators import GENERATORS, generate
+from aoc.results import DEFAULT_RESULTS_DIR, save_run
+from aoc.runner import PARTS, discover_days, load_day, solve
+
+DEFAULT_SCALES = (1, 10, 100)
+
+
+@dataclass(frozen=True)
+class Measurement:
+    """
+    Cost of running one part of one day on a generated input.
+
+    Attributes:
+    day (int): The day of the puzzle.
+    part (int): The part of the puzzle (1 or 2).
+    scale (float): Size of the generated input relative to the real puzzle input.
+    input_size (int): Size of the generated input in bytes, as it would be stored in a file.
+    wall_time (float): Elapsed wall-clock time of the solver in seconds.
+    peak_memory (int): Peak memory allocated while the solver ran in bytes, or None if not traced.
+    """
+
+    day: int
+    part: int
+    scale: float
+    input_size: int
+    wall_time: float
+    peak_memory: int = None
+
+
+def measure(day, part, scale, seed, script_path, *, trace_memory=False):
+    """
+    Runs a single part of a day on a generated input, including the parsing of the input.
+
+    Tracing memory slows the solver down considerably, so time and memory are measured in separate runs.
+
+    Args:
+    day (int): The day of the puzzle.
+    part (int): The part of the puzzle (1 or 2).
+    scale (float): Size of the generated input relative to the real puzzle input.
+    seed (int): Seed of the input generator.
+    script_path (str or Path): Path to the day's main.py.
+    trace_memory (bool): Whether to trace the peak memory instead of the time.
+
+    Returns:
+    Measurement: The cost of the run, with only one of wall_time and peak_memory measured.
+    """
+    solver = partial(solve, load_day(script_path), part)
+    input_data = generate(day, scale, seed)
+    input_size = len(input_data.encode())
+    gc.collect()
+
+    if trace_memory:
+        tracemalloc.start()
+        solver(input_data)
+        _, peak_memory = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        return Measurement(day, part, scale, input_size, None, peak_memory)
+
+    start = time.perf_counter()
+    solver(input_data)
+    return Measurement(day, part, scale, input_size, time.perf_counter() - start)
+
+
+def fit_exponent(points):
+    """
+    Fits the exponent k of a power law value ~ scale ** k with least squares in log-log space.
+
+    Args:
+    points (list of tuples): Pairs of (scale, value), values that are not positive are ignored.
+
+    Returns:
+    float: The fitted exponent, or None if fewer than two distinct scales have a positive value.
+    """
+    logs = [(math.log(scale), math.log(value)) for scale, value in points if value and value > 0]
+    if len({log_scale for log_scale, _ in logs}) < 2:
+        return None
+
+    mean_x = sum(x for x, _ in logs) / len(logs)
+    mean_y = sum(y for _, y in logs) / len(logs)
+    covariance = sum((x - mean_x) * (y - mean_y) for x, y in logs)
+    variance = sum((x - mean_x) ** 2 for x, _ in logs)
+    return covariance / variance
+
+
+def run_benchmark(days, scales=DEFAULT_SCALES, seed=0, max_seconds=60.0, *, trace_memory=True, repeat=1):
+    """
+    Benchmarks every part of the given days at increasing scales.
+
+    Once a run takes longer than max_seconds, the larger scales of that part are skipped. With repetitions,
+    the fastest run is kept, as the slower ones only add the noise of other processes on the machine.
+
+    Args:
+    days (dict): Mapping of day number to the path of its main.py.
+    scales (iterable of float): Scales of the generated inputs.
+    seed (int): Seed of the input generator.
+    max_seconds (float): Time after which larger scales of a part are no longer run.
+    trace_memory (bool): Whether to also measure the peak memory of every run.
+    repeat (int): Number of timed runs of every part and scale.
+
+    Returns:
+    list of Measurement: The measurements ordered by day, part and scale.
+    """
+    measurements = []
+    # Every task gets a fresh process, so the caches of one run don't leak into the next
+    with ProcessPoolExecutor(max_workers=1, max_tasks_per_child=1) as executor:
+        for day, script_path in days.items():
+            for part in range(1, len(PARTS) + 1):
+                for scale in sorted(scales):
+                    timing = min(
+                        (executor.submit(measure, day, part, scale, seed, script_path).result() for _ in range(repeat)),
+                        key=attrgetter("wall_time"),
+                    )
+                    peak_memory = None
+                    if trace_memory:
+                        tracing = executor.submit(measure, day, part, scale, seed, script_path, trace_memory=True)
+                        peak_memory = tracing.result().peak_memory
+                    measurements.append(Measurement(day, part, scale, timing.input_size, timing.wall_time, peak_memory))
+                    if timing.wall_time > max_seconds:
+                        break
+    return measurements
+
+
+def summarize(measurements):
+    """
+    Fits the complexity exponents of time and memory for every day and part.
+
+    Args:
+    measurements (list of Measurement): The measurements to summarize.
+
+    Returns:
+    dict: Mapping of (day, part) to a tuple (time exponent, memory exponent).
+    """
+    keys = sorted({(measurement.day, measurement.part) for measurement in measurements})
+    summary = {}
+    for day, part in keys:
+        runs = [measurement for measurement in measurements if (measurement.day, measurement.part) == (day, part)]
+        summary[day, part] = (
+            fit_exponent([(run.scale, run.wall_time) for run in runs]),
+            fit_exponent([(run.scale, run.peak_memory) for run in runs]),
+        )
+    return summary
+
+
+def format_report(measurements):
+    """
+    Formats the measurements and fitted exponents as a table.
+
+    Args:
+    measurements (list of Measurement): The measurements to report.
+
+    Returns:
+    str: The report, one line per measurement and one summary line per part.
+    """
+
+    def format_exponent(exponent):
+        return "n/a" if exponent is None else f"n^{exponent:.2f}"
+
+    summary = summarize(measurements)
+    lines = [f"{'Day':>3}  {'Part':>4}  {'Scale':>8}  {'Input [B]':>12}  {'Wall [s]':>10}  {'Peak [MiB]':>10}"]
+    for (day, part), runs in groupby(measurements, key=attrgetter("day", "part")):
+        for run in runs:
+            peak_memory = "n/a" if run.peak_memory is None else f"{run.peak_memory / 2**20:.2f}"
+            lines.append(
+                f"{day:>3}  {part:>4}  {run.scale:>8g}  {run.input_size:>12}  {run.wall_time:>10.4f}  {peak_memory:>10}"
+            )
+        time_exponent, memory_exponent = summary[day, part]
+        lines.append(
+            f"{'':>11}time ~ {format_exponent(time_exponent)}, memory ~ {format_exponent(memory_exponent)}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the solvers on generated inputs of increasing size.")
+    parser.add_argument("days", nargs="*", type=int, help="days to benchmark (default: all)")
+    parser.add_argument("--scales", nargs="+", type=float, default=DEFAULT_SCALES,
+                        help="input sizes relative to the real puzzle input")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the input generators")
+    parser.add_argument("--max-seconds", type=float, default=60.0,
+                        help="skip larger scales of a part once a run takes longer than this")
+    parser.add_argument("--no-memory", action="store_true", help="don't measure the peak memory")
+    parser.add_argument("--repeat", type=int, default=1, help="time every part this often and keep the fastest run")
+    parser.add_argument("--json", help="also write the measurements to this JSON file")
+    parser.add_argument("--save", action="store_true",
+                        help="store the run for comparisons across commits with aoc.results")
+    parser.add_argument("--results-dir", type=Path, default=DEFAULT_RESULTS_DIR,
+                        help="directory of the stored benchmark runs")
+    args = parser.parse_args(argv)
+
+    days = {day: path for day, path in discover_days().items() if day in GENERATORS}
+    if args.days:
+        days = {day: path for day, path in days.items() if day in args.days}
+
+    measurements = run_benchmark(
+        days, args.scales, args.seed, args.max_seconds, trace_memory=not args.no_memory, repeat=args.repeat
+    )
+    print(format_report(measurements))
+
+    if args.save:
+        settings = {"seed": args.seed, "repeat": args.repeat, "max_seconds": args.max_seconds}
+        print(f"Stored the run in {save_run(measurements, settings, args.results_dir)}")
+
+    if args.json:
+        summary = summarize(measurements)
+        with open(args.json, "w") as output_file:
+            json.dump({
+                "measurements": [asdict(measurement) for measurement in measurements],
+                "exponents": [
+                    {"day": day, "part": part, "time": time_exponent, "memory": memory_exponent}
+                    for (day, part), (time_exponent, memory_exponent) in summary.items()
+                ],
+            }, output_file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,185 @@
+"""
+Content-addressed on-disk cache of the answers of the solvers.
+
+An answer is stored under a key derived from the bytes of the input file, the source code of the solver
+and the part that was solved. Editing the solution or the input therefore never returns a stale answer,
+while repeated runs on the same input are answered without running the solver again.
+
+The source of a solver is the day's main.py together with the modules of the aoc package it uses, such as
+aoc.grid. Every answer is kept in its own small JSON file. Reading an entry refreshes its modification
+time, and once the cache grows beyond its size limit the least recently used entries are evicted.
+
+Usage:
+    cache = ResultCache()
+    key = cache_key(input_path, module, "part1")
+    answer = cache.get(key, MISSING)
+"""
+
+import hashlib
+import json
+import os
+import sys
+import types
+from pathlib import Path
+
+# Directory of the cache unless the runner is told otherwise
+DEFAULT_CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")) / "advent-of-code"
+
+# Upper bound of the total size of all entries in bytes
+DEFAULT_MAX_BYTES = 64 * 2**20
+
+# Number of bytes hashed at once when hashing an input file
+HASH_CHUNK_SIZE = 1 << 20
+
+
+def source_files(module):
+    """
+    Lists the source files a day module depends on.
+
+    Args:
+    module (module): The imported day module.
+
+    Returns:
+    list of Path: The day's script and the files of the aoc modules it imports from, sorted.
+    """
+    paths = {Path(module.__file__)}
+    for value in vars(module).values():
+        module_name = value.__name__ if isinstance(value, types.ModuleType) else getattr(value, "__module__", None)
+        if isinstance(module_name, str) and module_name.partition(".")[0] == "aoc":
+            dependency = sys.modules.get(module_name)
+            if getattr(dependency, "__file__", None):
+                paths.add(Path(dependency.__file__))
+    return sorted(paths)
+
+
+def cache_key(input_path, module, part_name):
+    """
+    Derives the key of the answer of one part on one input.
+
+    Args:
+    input_path (str or Path): Path to the input file.
+    module (module): The imported day module.
+    part_name (str): Name of the solver function, e.g. "part1".
+
+    Returns:
+    str: Hexadecimal SHA-256 digest of the part, the solver's source and the input bytes.
+    """
+    digest = hashlib.sha256(part_name.encode())
+    for path in source_files(module):
+        digest.update(b"\0")
+        digest.update(path.read_bytes())
+
+    digest.update(b"\0")
+    with open(input_path, "rb") as input_file:
+        while chunk := input_file.read(HASH_CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class ResultCache:
+    """
+    Size-bounded cache of answers on the local disk with least recently used eviction.
+
+    Attributes:
+    directory (Path): Directory holding one JSON file per entry.
+    max_bytes (int): Total size of the entries above which the least recently used ones are evicted.
+    """
+
+    def __init__(self, directory=DEFAULT_CACHE_DIR, max_bytes=DEFAULT_MAX_BYTES):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+
+    def _entry_path(self, key):
+        return self.directory / f"{key}.json"
+
+    def get(self, key, default=None):
+        """
+        Looks up a cached answer and marks it as recently used.
+
+        Args:
+        key (str): Key from cache_key().
+        default (object): Value returned if the answer is not cached.
+
+        Returns:
+        object: The cached answer, or default.
+        """
+        entry_path = self._entry_path(key)
+        try:
+            with open(entry_path) as entry_file:
+                answer = json.load(entry_file)["answer"]
+            os.utime(entry_path)
+        except (OSError, ValueError, KeyError):
+            # Missing, concurrently evicted or corrupt entries are treated as misses
+            return default
+        return answer
+
+    def put(self, key, answer):
+        """
+        Stores an answer and evicts the least recently used entries if the cache grew too large.
+
+        Answers that do not survive a round trip through JSON unchanged are not cached.
+
+        Args:
+        key (str): Key from cache_key().
+        answer (object): The answer of the solver.
+
+        Returns:
+        bool: Whether the answer was stored.
+        """
+        try:
+            content = json.dumps({"answer": answer})
+        except (TypeError, ValueError):
+            return False
+        if json.loads(content)["answer"] != answer:
+            return False
+
+        # Imported here, as importing tempfile takes longer than most cache lookups
+        import tempfile  # pylint: disable=import-outside-toplevel
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        # Write to a temporary file first, so concurrent readers never see a partial entry
+        file_descriptor, temporary_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        with os.fdopen(file_descriptor, "w") as entry_file:
+            entry_file.write(content)
+        os.replace(temporary_path, self._entry_path(key))
+
+        self.evict()
+        return True
+
+    def evict(self):
+        """
+        Removes the least recently used entries until the cache fits into max_bytes.
+
+        Returns:
+        int: Number of removed entries.
+        """
+        entries = []
+        for entry_path in self.directory.glob("*.json"):
+            try:
+                status = entry_path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((status.st_mtime, status.st_size, entry_path))
+
+        total_size = sum(size for _, size, _ in entries)
+        removed = 0
+        for _, size, entry_path in sorted(entries):
+            if total_size <= self.max_bytes:
+                break
+            entry_path.unlink(missing_ok=True)
+            total_size -= size
+            removed += 1
+        return removed
+
+    def clear(self):
+        """
+        Removes every entry of the cache.
+
+        Returns:
+        int: Number of removed entries.
+        """
+        removed = 0
+        for entry_path in self.directory.glob("*.json"):
+            entry_path.unlink(missing_ok=True)
+            removed += 1
+        return removed
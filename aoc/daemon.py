@@ -0,0 +1,540 @@
+"""
+Long-lived daemon that keeps the days imported and their parsed inputs in memory between runs.
+
+Every run of the runner starts a new interpreter, imports the day and parses its input again, which
+dominates the time of most days. The daemon pays these costs once: it listens on a Unix socket, imports a
+day when it is first asked for it and keeps the parsed model of every input and the answers of every part.
+
+Before answering, the daemon checks the modification times of the day's sources and of the input. A
+changed day script is executed again, and a changed module of the aoc package it uses is reloaded. The
+answers are kept per part together with a fingerprint of the code the part depends on, so after an edit of
+part2() only part 2 runs again, on the model that is still parsed, while an edit of parse_input() or of the
+input parses it again and reruns both parts.
+
+The protocol is one JSON object per line in either direction. A request names its "command":
+
+- {"command": "solve", "day": 3, "parts": [1, 2], "input": null}: the results of the parts, as in the runner,
+  with the sources of the day and the input that was solved,
+- {"command": "status"}: the loaded days and the number of kept models and answers,
+- {"command": "shutdown"}: stops the daemon.
+
+In watch mode the client polls the sources and the input of a day and asks for the answers again whenever
+one of them changes.
+
+Usage:
+    python -m aoc.daemon serve [--socket PATH] [--season-dir DIR]
+    python -m aoc.daemon solve DAY ... [--input PATH] [--socket PATH]
+    python -m aoc.daemon watch DAY [--input PATH] [--interval SECONDS] [--socket PATH]
+    python -m aoc.daemon stop [--socket PATH]
+"""
+
+import argparse
+import hashlib
+import importlib
+import inspect
+import json
+import os
+import socket
+import socketserver
+import sys
+import tempfile
+import threading
+import time
+import types
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+from aoc.cache import source_files
+from aoc.inputs import day_input_options, default_input, open_input
+from aoc.runner import (
+    DEFAULT_SEASON_DIR,
+    PARSE,
+    PARSER,
+    PARTS,
+    PartResult,
+    discover_days,
+    format_report,
+    load_day,
+    parse_day_input,
+)
+
+# Socket the daemon listens on unless told otherwise
+DEFAULT_SOCKET_PATH = Path(os.environ.get("XDG_RUNTIME_DIR", tempfile.gettempdir())) / "advent-of-code.sock"
+
+# Seconds between two checks of the watched files
+DEFAULT_WATCH_INTERVAL = 0.5
+
+
+def code_fingerprint(module, name):
+    """
+    Fingerprints a function of a day together with everything in the day it depends on.
+
+    The bytecode and constants of the function, of the functions and classes of the day it refers to by
+    name and of their nested functions are hashed, as are the values of the module level constants they
+    use. Names imported from other modules are not followed, as those modules are reloaded when they change.
+    An edit of one part therefore leaves the fingerprints of the other part and of the parser unchanged.
+
+    Args:
+    module (module): The imported day module.
+    name (str): Name of the function, e.g. "part1".
+
+    Returns:
+    str: Hexadecimal SHA-256 digest of the code and constants the function depends on.
+    """
+    digest = hashlib.sha256()
+    pending, seen = [name], set()
+    while pending:
+        name = pending.pop()
+        if name in seen or name not in vars(module):
+            continue
+        seen.add(name)
+        # Look through decorators such as functools.cache
+        value = inspect.unwrap(vars(module)[name])
+        digest.update(name.encode() + b"\0")
+
+        if isinstance(value, types.FunctionType) and value.__module__ == module.__name__:
+            digest.update(repr(value.__defaults__).encode())
+            codes = [value.__code__]
+        elif isinstance(value, type) and value.__module__ == module.__name__:
+            codes = [
+                member.__code__
+                for member in map(inspect.unwrap, vars(value).values())
+                if isinstance(member, types.FunctionType)
+            ]
+        elif isinstance(value, types.ModuleType) or callable(value):
+            continue
+        else:
+            digest.update(repr(value).encode())
+            continue
+
+        while codes:
+            code = codes.pop()
+            digest.update(code.co_code)
+            for constant in code.co_consts:
+                if isinstance(constant, types.CodeType):
+                    codes.append(constant)
+                else:
+                    digest.update(repr(constant).encode())
+            pending.extend(code.co_names)
+    return digest.hexdigest()
+
+
+def _modification_time(path):
+    # Modification time of a file in nanoseconds, or None if it was removed
+    try:
+        return os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+
+@dataclass(frozen=True)
+class LoadedDay:
+    """
+    A day module as imported by the daemon.
+
+    Attributes:
+    module (module): The imported day module.
+    modification_times (dict): Mapping of every source file of the day to its modification time when loaded.
+    fingerprints (dict): Mapping of the parser and the part functions to the fingerprints of their code.
+    """
+
+    module: types.ModuleType
+    modification_times: dict
+    fingerprints: dict
+
+
+class Workspace:
+    """
+    The imported days with their parsed models and answers, refreshed when their sources or inputs change.
+
+    Only the latest model and answers of every input are kept. The workspace is safe to use from several
+    threads, which are served one after another.
+    """
+
+    def __init__(self, days):
+        """
+        Args:
+        days (dict): Mapping of day number to the path of its main.py.
+        """
+        self.days = days
+        self._lock = threading.Lock()
+        self._loaded = {}
+        self._models = {}
+        self._answers = {}
+        # Modification times of the modules of the aoc package the days use, as they were last imported
+        self._shared_times = {
+            Path(module.__file__): _modification_time(module.__file__)
+            for name, module in list(sys.modules.items())
+            if name.partition(".")[0] == "aoc" and getattr(module, "__file__", None)
+        }
+
+    def load(self, day):
+        """
+        Returns the imported module of a day, executing its script again if one of its sources changed.
+
+        Args:
+        day (int): The day of the puzzle.
+
+        Returns:
+        LoadedDay: The module with the modification times and fingerprints it was loaded with.
+        """
+        loaded = self._loaded.get(day)
+        if loaded is not None and all(
+            _modification_time(path) == modification_time
+            for path, modification_time in loaded.modification_times.items()
+        ):
+            return loaded
+
+        script_path = self.days[day]
+        module = load_day(script_path, reload=loaded is not None)
+        changed = [
+            path
+            for path in source_files(module)
+            if path != Path(module.__file__)
+            and path in self._shared_times
+            and _modification_time(path) != self._shared_times[path]
+        ]
+        if changed:
+            # Reload the changed modules first, so the day imports their new version
+            for module_name, shared_module in list(sys.modules.items()):
+                module_file = getattr(shared_module, "__file__", None)
+                if module_name.partition(".")[0] == "aoc" and module_file and Path(module_file) in changed:
+                    importlib.reload(shared_module)
+            self._shared_times.update((path, _modification_time(path)) for path in changed)
+            module = load_day(script_path, reload=True)
+
+        paths = source_files(module)
+        for path in paths:
+            if path != Path(module.__file__):
+                self._shared_times.setdefault(path, _modification_time(path))
+        # The aoc modules are not followed by the fingerprints, so their sources are part of every fingerprint
+        shared_digest = hashlib.sha256(b"".join(path.read_bytes() for path in paths if path != Path(module.__file__)))
+        loaded = LoadedDay(
+            module,
+            {path: _modification_time(path) for path in paths},
+            {
+                name: hashlib.sha256(
+                    (code_fingerprint(module, name) + shared_digest.hexdigest()).encode()
+                ).hexdigest()
+                for name in (PARSER, *PARTS)
+            },
+        )
+        self._loaded[day] = loaded
+        return loaded
+
+    def solve(self, day, parts=None, input_path=None):
+        """
+        Answers parts of a day, reusing the parsed model and the answers that are still valid.
+
+        Args:
+        day (int): The day of the puzzle.
+        parts (iterable of int): The parts to answer, defaults to all parts.
+        input_path (str or Path): Input file, defaults to the input.txt next to the script or its compressed archive.
+
+        Returns:
+        list of PartResult: The timings of parsing as part PARSE, if the input had to be parsed, followed by
+        the results of the parts, which are marked as cached if they were answered from memory.
+        """
+        with self._lock:
+            return self._solve(day, parts or range(1, len(PARTS) + 1), input_path)
+
+    def _solve(self, day, parts, input_path):
+        loaded = self.load(day)
+        input_path = self.input_path(day, input_path)
+        input_stat = input_path.stat()
+        model_version = (input_stat.st_mtime_ns, input_stat.st_size, loaded.fingerprints[PARSER])
+
+        results, pending = {}, []
+        for part in parts:
+            version, answer = self._answers.get((day, input_path, part), (None, None))
+            if version == (model_version, loaded.fingerprints[PARTS[part - 1]]):
+                results[part] = PartResult(day, part, answer, 0.0, 0.0, cached=True)
+            else:
+                pending.append(part)
+        if not pending:
+            return [results[part] for part in parts]
+
+        version, model = self._models.get((day, input_path), (None, None))
+        if version != model_version:
+            with open_input(input_path, *day_input_options(loaded.module)) as input_data:
+                wall_start, cpu_start = time.perf_counter(), time.process_time()
+                model = parse_day_input(loaded.module, input_data)
+                wall_time, cpu_time = time.perf_counter() - wall_start, time.process_time() - cpu_start
+            results[PARSE] = PartResult(day, PARSE, None, wall_time, cpu_time)
+            self._models[day, input_path] = (model_version, model)
+
+        for part in pending:
+            solver = getattr(loaded.module, PARTS[part - 1])
+            wall_start, cpu_start = time.perf_counter(), time.process_time()
+            try:
+                answer = solver(model)
+            except Exception as error:  # pylint: disable=broad-except
+                results[part] = PartResult(day, part, None, 0.0, 0.0, f"{type(error).__name__}: {error}")
+                continue
+            wall_time, cpu_time = time.perf_counter() - wall_start, time.process_time() - cpu_start
+            results[part] = PartResult(day, part, answer, wall_time, cpu_time)
+            self._answers[day, input_path, part] = ((model_version, loaded.fingerprints[PARTS[part - 1]]), answer)
+
+        return [results[part] for part in sorted(results)]
+
+    def input_path(self, day, input_path=None):
+        """
+        Resolves the input file a day is solved on.
+
+        Args:
+        day (int): The day of the puzzle.
+        input_path (str or Path): Input file, defaults to the input.txt next to the script or its compressed archive.
+
+        Returns:
+        Path: The absolute path of the input, which may not exist.
+        """
+        return Path(input_path or default_input(self.days[day])).resolve()
+
+    def sources(self, day):
+        """
+        Lists the source files of a day, which invalidate its answers when they change.
+
+        Args:
+        day (int): The day of the puzzle.
+
+        Returns:
+        list of Path: The day's script and the files of the aoc modules it uses.
+        """
+        with self._lock:
+            return list(self.load(day).modification_times)
+
+    def status(self):
+        """
+        Summarizes what the workspace keeps in memory.
+
+        Returns:
+        dict: The loaded days and the numbers of kept models and answers.
+        """
+        with self._lock:
+            return {"days": sorted(self._loaded), "models": len(self._models), "answers": len(self._answers)}
+
+
+class DaemonServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """Unix socket server answering the requests of the clients from one shared Workspace."""
+
+    daemon_threads = True
+
+    def __init__(self, socket_path, workspace):
+        """
+        Args:
+        socket_path (str or Path): Path of the Unix socket to listen on.
+        workspace (Workspace): The days to answer requests from.
+        """
+        self.workspace = workspace
+        super().__init__(str(socket_path), RequestHandler)
+        # The daemon runs code on behalf of its clients, so only the owner may connect
+        os.chmod(socket_path, 0o600)
+
+    def execute(self, request):
+        """
+        Executes one request.
+
+        Args:
+        request (dict): The decoded request with its "command".
+
+        Returns:
+        dict: The response to send back.
+        """
+        command = request.get("command")
+        if command == "solve":
+            day = request["day"]
+            if day not in self.workspace.days:
+                return {"error": f"no solution found for day {day}"}
+            # Name the input that was solved, so a client can watch it even if it did not give one
+            input_path = str(self.workspace.input_path(day, request.get("input")))
+            try:
+                results = self.workspace.solve(day, request.get("parts"), input_path)
+                sources = self.workspace.sources(day)
+            except Exception as error:  # pylint: disable=broad-except
+                # Name the script, so a client can wait for a broken day to be fixed
+                error = f"{type(error).__name__}: {error}"
+                return {"error": error, "sources": [str(self.workspace.days[day])], "input": input_path}
+            return {
+                "results": [asdict(result) for result in results],
+                "sources": [str(path) for path in sources],
+                "input": input_path,
+            }
+        if command == "status":
+            return self.workspace.status()
+        if command == "shutdown":
+            return {"stopped": True}
+        return {"error": f"unknown command {command!r}"}
+
+
+class RequestHandler(socketserver.StreamRequestHandler):
+    """Handles the requests of one connection, one JSON object per line."""
+
+    def handle(self):
+        for line in self.rfile:
+            try:
+                response = self.server.execute(json.loads(line))
+            except Exception as error:  # pylint: disable=broad-except
+                # A failing request must not bring down the daemon
+                response = {"error": f"{type(error).__name__}: {error}"}
+            # Answers that JSON cannot represent are sent as strings
+            self.wfile.write(json.dumps(response, default=str).encode() + b"\n")
+            if response.get("stopped"):
+                # shutdown() waits for serve_forever() to return, so it cannot be called from the handler itself
+                self.wfile.flush()
+                threading.Thread(target=self.server.shutdown).start()
+                return
+
+
+def serve(socket_path=DEFAULT_SOCKET_PATH, season_dir=DEFAULT_SEASON_DIR):
+    """
+    Runs the daemon until it receives a shutdown request or is interrupted.
+
+    Args:
+    socket_path (str or Path): Path of the Unix socket to listen on.
+    season_dir (str or Path): Directory containing the Day_XX folders.
+    """
+    socket_path = Path(socket_path)
+    if socket_path.exists():
+        try:
+            send_request({"command": "status"}, socket_path)
+        except OSError:
+            # Left behind by a daemon that did not stop cleanly
+            socket_path.unlink()
+        else:
+            raise RuntimeError(f"a daemon is already listening on {socket_path}")
+
+    with DaemonServer(socket_path, Workspace(discover_days(season_dir))) as server:
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            socket_path.unlink(missing_ok=True)
+
+
+def send_request(request, socket_path=DEFAULT_SOCKET_PATH):
+    """
+    Sends one request to the daemon and waits for its response.
+
+    Args:
+    request (dict): The request with its "command".
+    socket_path (str or Path): Path of the Unix socket of the daemon.
+
+    Returns:
+    dict: The response of the daemon.
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.connect(str(socket_path))
+        with client.makefile("rwb") as stream:
+            stream.write(json.dumps(request).encode() + b"\n")
+            stream.flush()
+            return json.loads(stream.readline())
+
+
+def solve_request(day, input_path=None):
+    """
+    Builds the request for the answers of both parts of a day.
+
+    Args:
+    day (int): The day of the puzzle.
+    input_path (str or Path): Input file, defaults to the input.txt of the day.
+
+    Returns:
+    dict: The request, with the input as an absolute path since the daemon may run in another directory.
+    """
+    return {"command": "solve", "day": day, "input": str(Path(input_path).resolve()) if input_path else None}
+
+
+def request_report(days, input_path=None, socket_path=DEFAULT_SOCKET_PATH):
+    """
+    Asks the daemon for the answers of some days and formats them like the runner.
+
+    Args:
+    days (list of int): The days to solve.
+    input_path (str or Path): Input file used for every day, defaults to the input.txt of each day.
+    socket_path (str or Path): Path of the Unix socket of the daemon.
+
+    Returns:
+    str: The report, one line per parsed input and per part followed by the totals.
+    """
+    wall_start = time.perf_counter()
+    results = []
+    for day in days:
+        response = send_request(solve_request(day, input_path), socket_path)
+        if "error" in response:
+            raise RuntimeError(f"day {day}: {response['error']}")
+        results.extend(PartResult(**result) for result in response["results"])
+    return format_report(results, time.perf_counter() - wall_start)
+
+
+def watch(day, input_path=None, socket_path=DEFAULT_SOCKET_PATH, interval=DEFAULT_WATCH_INTERVAL):
+    """
+    Prints the answers of a day whenever one of its sources or its input changes, until interrupted.
+
+    Args:
+    day (int): The day of the puzzle.
+    input_path (str or Path): Input file, defaults to the input.txt of the day.
+    socket_path (str or Path): Path of the Unix socket of the daemon.
+    interval (float): Seconds between two checks of the files.
+    """
+    try:
+        while True:
+            wall_start = time.perf_counter()
+            response = send_request(solve_request(day, input_path), socket_path)
+            if "error" in response:
+                print(f"Day {day} failed: {response['error']}", end="\n\n", flush=True)
+            else:
+                results = [PartResult(**result) for result in response["results"]]
+                print(format_report(results, time.perf_counter() - wall_start), end="\n\n", flush=True)
+
+            # Wait until one of the files changes, the daemon then finds out itself what has to run again
+            paths = response.get("sources", []) + ([response["input"]] if response.get("input") else [])
+            if not paths:
+                return
+            watched_times = {path: _modification_time(path) for path in paths}
+            while all(_modification_time(path) == watched for path, watched in watched_times.items()):
+                time.sleep(interval)
+    except KeyboardInterrupt:
+        pass
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Keep the days imported and their inputs parsed between runs.")
+    parser.add_argument("--socket", type=Path, default=DEFAULT_SOCKET_PATH, help="path of the daemon's Unix socket")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    serve_parser = commands.add_parser("serve", help="run the daemon")
+    serve_parser.add_argument("--season-dir", type=Path, default=DEFAULT_SEASON_DIR,
+                              help="directory containing the Day_XX folders")
+
+    solve_parser = commands.add_parser("solve", help="print the answers of some days")
+    solve_parser.add_argument("days", nargs="+", type=int, help="days to solve")
+    solve_parser.add_argument("--input", type=Path, help="input file (default: the input.txt of every day)")
+
+    watch_parser = commands.add_parser("watch", help="print the answers of a day again whenever it changes")
+    watch_parser.add_argument("day", type=int, help="day to watch")
+    watch_parser.add_argument("--input", type=Path, help="input file (default: the input.txt of the day)")
+    watch_parser.add_argument("--interval", type=float, default=DEFAULT_WATCH_INTERVAL,
+                              help="seconds between two checks of the files")
+
+    commands.add_parser("status", help="show what the daemon keeps in memory")
+    commands.add_parser("stop", help="stop the daemon")
+    args = parser.parse_args(argv)
+
+    try:
+        if args.command == "serve":
+            serve(args.socket, args.season_dir)
+        elif args.command == "solve":
+            print(request_report(args.days, args.input, args.socket))
+        elif args.command == "watch":
+            watch(args.day, args.input, args.socket, args.interval)
+        elif args.command == "status":
+            print(json.dumps(send_request({"command": "status"}, args.socket)))
+        else:
+            send_request({"command": "shutdown"}, args.socket)
+    except (OSError, RuntimeError) as error:
+        parser.exit(1, f"{parser.prog}: {error}\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+"""
+Importable, lazily loaded packages of the solutions of every season.
+
+The solutions live in ``<year>/Day_XX/main.py`` scripts, and neither the year nor "main" can be imported
+as a Python package. The finder of this module maps them to module names instead, so every day can be
+imported like any other module without listing or executing the other days:
+
+    import aoc.y2023.day15
+    from aoc.y2023 import day15
+
+Nothing is imported before it is used. ``aoc.y2023`` is an empty package whose days are loaded on first
+access, and importing one day executes only its own script and the aoc modules it imports. A day is
+imported only once however it is reached, by name or by the path of its script through
+aoc.runner.load_day().
+"""
+
+import importlib
+import importlib.util
+import re
+import sys
+from pathlib import Path
+
+# Directory holding one directory per season, each with Day_XX folders
+SEASONS_ROOT = Path(__file__).resolve().parent.parent
+
+_SEASON_NAME = re.compile(r"aoc\.y(\d{4})")
+_DAY_NAME = re.compile(r"aoc\.y(\d{4})\.day(\d{2})")
+
+
+def day_module_name(year, day):
+    """
+    Names the module of a day.
+
+    Args:
+    year (int): The year of the season.
+    day (int): The day of the puzzle.
+
+    Returns:
+    str: The importable name of the day, e.g. "aoc.y2023.day05".
+    """
+    return f"aoc.y{year}.day{day:02d}"
+
+
+def day_script(year, day):
+    """
+    Finds the script of a day.
+
+    Args:
+    year (int): The year of the season.
+    day (int): The day of the puzzle.
+
+    Returns:
+    Path: The day's main.py, which may not exist.
+    """
+    return SEASONS_ROOT / str(year) / f"Day_{day:02d}" / "main.py"
+
+
+def module_name_of(script_path):
+    """
+    Finds the importable name of a day's script.
+
+    Args:
+    script_path (str or Path): Path to a day's main.py.
+
+    Returns:
+    str: The name of the module, or None if the script is not part of a season in this repository.
+    """
+    script_path = Path(script_path).resolve()
+    day_dir, season_dir = script_path.parent, script_path.parent.parent
+    if script_path.name != "main.py" or season_dir.parent != SEASONS_ROOT or not season_dir.name.isdigit():
+        return None
+    match = re.fullmatch(r"Day_(\d+)", day_dir.name)
+    return day_module_name(int(season_dir.name), int(match.group(1))) if match else None
+
+
+def import_day(year, day):
+    """
+    Imports the module of a day, executing its script only the first time.
+
+    Args:
+    year (int): The year of the season.
+    day (int): The day of the puzzle.
+
+    Returns:
+    module: The imported day module.
+    """
+    return importlib.import_module(day_module_name(year, day))
+
+
+class _SeasonLoader:
+    """
+    Creates the empty package of a season, whose days are imported on first access.
+
+    The import system only needs the two methods, and importing importlib.abc for the base class would slow
+    down every day.
+    """
+
+    def create_module(self, spec):  # pylint: disable=unused-argument
+        return None
+
+    def exec_module(self, module):
+        year = int(_SEASON_NAME.fullmatch(module.__name__).group(1))
+        module.__doc__ = f"Solutions of the {year} season, imported on first access."
+
+        def __getattr__(name):  # pylint: disable=invalid-name
+            if re.fullmatch(r"day\d{2}", name):
+                try:
+                    return importlib.import_module(f"{module.__name__}.{name}")
+                except ModuleNotFoundError as error:
+                    raise AttributeError(f"module {module.__name__!r} has no attribute {name!r}") from error
+            raise AttributeError(f"module {module.__name__!r} has no attribute {name!r}")
+
+        def __dir__():  # pylint: disable=invalid-name
+            season_dir = SEASONS_ROOT / str(year)
+            return sorted(f"day{int(path.parent.name[4:]):02d}" for path in season_dir.glob("Day_[0-9]*/main.py"))
+
+        module.__getattr__ = __getattr__
+        module.__dir__ = __dir__
+
+
+class DayFinder:
+    """Finds the packages of the seasons and the modules of their days by name, as a meta path finder."""
+
+    def find_spec(self, fullname, path=None, target=None):  # pylint: disable=unused-argument
+        """
+        Finds the spec of a season package or a day module.
+
+        Args:
+        fullname (str): The name of the module, e.g. "aoc.y2023" or "aoc.y2023.day15".
+        path (list): Unused, the location of a day only depends on its name.
+        target (module): Unused.
+
+        Returns:
+        ModuleSpec: The spec, or None if the name is not a season or day that exists.
+        """
+        season = _SEASON_NAME.fullmatch(fullname)
+        if season:
+            if not (SEASONS_ROOT / season.group(1)).is_dir():
+                return None
+            return importlib.util.spec_from_loader(fullname, _SeasonLoader(), is_package=True)
+
+        match = _DAY_NAME.fullmatch(fullname)
+        if match:
+            script_path = day_script(int(match.group(1)), int(match.group(2)))
+            if script_path.is_file():
+                return importlib.util.spec_from_file_location(fullname, script_path)
+        return None
+
+
+def install():
+    """Registers the finder of the days, once."""
+    if not any(isinstance(finder, DayFinder) for finder in sys.meta_path):
+        sys.meta_path.append(DayFinder())
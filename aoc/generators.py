@@ -0,0 +1,539 @@
+"""
+Deterministic generators of large, valid puzzle inputs for every day.
+
+Each generator takes a scale and a random number generator and returns the input as a string. A scale of
+1 produces an input of roughly the size of the real puzzle input, a scale of 10 one that is ten times as
+large, and so on, so that the solvers can be benchmarked far beyond the size of the real puzzles.
+
+Usage:
+    from aoc.generators import generate
+    input_data = generate(day=16, scale=10, seed=0)
+
+    python -m aoc.generators 12 --scale 100 | python 2023/Day_12/main.py -
+"""
+
+import argparse
+import math
+import random
+import string
+import sys
+
+DIGIT_WORDS = ("one", "two", "three", "four", "five", "six", "seven", "eight", "nine")
+CARD_LABELS = "23456789TJQKA"
+SCHEMATIC_SYMBOLS = "*#+$/@=%&-"
+
+
+def _scaled(base, scale, minimum=1):
+    """
+    Scales a count from the real puzzle size.
+
+    Args:
+    base (int): The count in an input of the real puzzle size.
+    scale (float): Factor by which the input is enlarged.
+    minimum (int): Lower bound of the result.
+
+    Returns:
+    int: The scaled count.
+    """
+    return max(minimum, round(base * scale))
+
+
+def _scaled_side(base, scale, minimum=3):
+    """
+    Scales the side length of a square grid so that its number of cells grows linearly with the scale.
+
+    Args:
+    base (int): The side length of the grid in the real puzzle.
+    scale (float): Factor by which the number of cells is enlarged.
+    minimum (int): Lower bound of the result.
+
+    Returns:
+    int: The scaled side length.
+    """
+    return max(minimum, round(base * math.sqrt(scale)))
+
+
+def _unique_names(count, rng, length, alphabet=string.ascii_lowercase, reserved=()):
+    """
+    Draws distinct random names.
+
+    Args:
+    count (int): Number of names to draw.
+    rng (random.Random): Source of randomness.
+    length (int): Minimum length of the names, grown automatically when the name space gets crowded.
+    alphabet (str): Characters the names consist of.
+    reserved (iterable of str): Names that must not be drawn.
+
+    Returns:
+    list of str: The names, in the order they were drawn.
+    """
+    while len(alphabet) ** length < 2 * count:
+        length += 1
+    names = set(reserved)
+    result = []
+    while len(result) < count:
+        name = "".join(rng.choices(alphabet, k=length))
+        if name not in names:
+            names.add(name)
+            result.append(name)
+    return result
+
+
+def _random_polyomino_boundary(height, width, rng, fill=0.45):
+    """
+    Grows a random simply connected polyomino and returns its boundary as a closed lattice path.
+
+    Cells are only added if they neither enclose a hole nor touch the region at a corner only, so the
+    boundary never touches itself.
+
+    Args:
+    height (int): Number of cell rows available to the polyomino.
+    width (int): Number of cell columns available to the polyomino.
+    rng (random.Random): Source of randomness.
+    fill (float): Fraction of the available cells the polyomino should cover.
+
+    Returns:
+    list of tuples: The corners (y, x) of the boundary in order, one per unit step, without repeating
+    the first corner at the end.
+    """
+    ring = ((-1, 0), (-1, 1), (0, 1), (1, 1), (1, 0), (1, -1), (0, -1), (-1, -1))
+    region = {(height // 2, width // 2)}
+    frontier = [(height // 2 + dy, width // 2 + dx) for dy, dx in ring[::2]]
+    target = max(1, int(height * width * fill))
+    attempts = 0
+
+    while len(region) < target and frontier and attempts < 20 * target:
+        attempts += 1
+        index = rng.randrange(len(frontier))
+        frontier[index], frontier[-1] = frontier[-1], frontier[index]
+        y, x = frontier.pop()
+        if (y, x) in region or not (0 <= y < height and 0 <= x < width):
+            continue
+
+        occupied = [(y + dy, x + dx) in region for dy, dx in ring]
+        # A diagonal neighbor must be connected through one of the shared edge neighbors
+        if any(occupied[i] and not occupied[i - 1] and not occupied[(i + 1) % 8] for i in range(1, 8, 2)):
+            continue
+        # The occupied neighbors must form a single run around the cell, otherwise a hole is enclosed
+        if sum(occupied[i] and not occupied[i - 1] for i in range(8)) != 1:
+            continue
+
+        region.add((y, x))
+        frontier.extend((y + dy, x + dx) for dy, dx in ring[::2] if (y + dy, x + dx) not in region)
+
+    # Collect the boundary edges, oriented clockwise around the region, as a successor map of corners
+    successors = {}
+    for y, x in region:
+        if (y - 1, x) not in region:
+            successors[y, x] = (y, x + 1)
+        if (y, x + 1) not in region:
+            successors[y, x + 1] = (y + 1, x + 1)
+        if (y + 1, x) not in region:
+            successors[y + 1, x + 1] = (y + 1, x)
+        if (y, x - 1) not in region:
+            successors[y + 1, x] = (y, x)
+
+    start = min(successors)
+    path = [start]
+    corner = successors[start]
+    while corner != start:
+        path.append(corner)
+        corner = successors[corner]
+    return path
+
+
+def generate_day01(scale, rng):
+    lines = []
+    for _ in range(_scaled(1000, scale)):
+        tokens = [rng.choice(string.digits[1:])]
+        for _ in range(rng.randint(2, 8)):
+            kind = rng.random()
+            if kind < 0.3:
+                tokens.append(rng.choice(string.digits[1:]))
+            elif kind < 0.6:
+                tokens.append(rng.choice(DIGIT_WORDS))
+            else:
+                tokens.append("".join(rng.choices(string.ascii_lowercase, k=rng.randint(1, 5))))
+        rng.shuffle(tokens)
+        lines.append("".join(tokens))
+    return "\n".join(lines) + "\n"
+
+
+def generate_day02(scale, rng):
+    lines = []
+    for game_id in range(1, _scaled(100, scale) + 1):
+        draws = []
+        for _ in range(rng.randint(1, 6)):
+            colors = rng.sample(("red", "green", "blue"), rng.randint(1, 3))
+            draws.append(", ".join(f"{rng.randint(1, 16)} {color}" for color in colors))
+        lines.append(f"Game {game_id}: {'; '.join(draws)}")
+    return "\n".join(lines) + "\n"
+
+
+def generate_day03(scale, rng):
+    side = _scaled_side(140, scale)
+    rows = []
+    for _ in range(side):
+        row = []
+        while len(row) < side:
+            kind = rng.random()
+            if kind < 0.1:
+                row.extend(str(rng.randint(1, 999)))
+                row.append(".")
+            elif kind < 0.15:
+                row.append(rng.choice(SCHEMATIC_SYMBOLS))
+            else:
+                row.append(".")
+        row = row[:side]
+        # Cutting the row may drop the last digits of a number, which still leaves a valid number
+        rows.append("".join(row))
+    return "\n".join(rows) + "\n"
+
+
+def generate_day04(scale, rng):
+    count = _scaled(200, scale)
+    width = len(str(count))
+    lines = []
+    for card in range(1, count + 1):
+        numbers = rng.sample(range(1, 100), 35)
+        winning = numbers[:10]
+        # Most cards win nothing, otherwise the copies of part 2 grow exponentially with the card count
+        matches = 0 if rng.random() < 0.6 else rng.randint(1, 10)
+        player = winning[:matches] + numbers[10 + matches : 35]
+        rng.shuffle(player)
+        lines.append(
+            f"Card {card:>{width}}: {' '.join(f'{n:>2}' for n in winning)} | {' '.join(f'{n:>2}' for n in player)}"
+        )
+    return "\n".join(lines) + "\n"
+
+
+def generate_day05(scale, rng):
+    categories = ("seed", "soil", "fertilizer", "water", "light", "temperature", "humidity", "location")
+    upper = 2**32
+    seeds = []
+    for _ in range(_scaled(10, scale)):
+        start = rng.randrange(upper)
+        seeds.extend((start, rng.randint(1, upper // 20)))
+
+    sections = ["seeds: " + " ".join(map(str, seeds))]
+    for source, destination in zip(categories, categories[1:]):
+        cuts = sorted(rng.sample(range(1, upper), _scaled(40, scale)))
+        lines = []
+        for range_start, range_end in zip(cuts, cuts[1:]):
+            if rng.random() < 0.9:
+                length = range_end - range_start
+                lines.append(f"{rng.randrange(upper - length)} {range_start} {length}")
+        rng.shuffle(lines)
+        sections.append("\n".join([f"{source}-to-{destination} map:"] + lines))
+    return "\n\n".join(sections) + "\n"
+
+
+def generate_day06(scale, rng):
+    # Both parts iterate over every millisecond of a race, so the scale enlarges the race durations
+    digit_count = len(str(_scaled(1_000_000, scale, minimum=1000)))
+    times = [
+        rng.randrange(10 ** (digits - 1), 10**digits)
+        for digits in (digit_count // 4 + (race < digit_count % 4) for race in range(4))
+    ]
+    records = [rng.randint(0, max(0, time * time // 4 - 1)) for time in times]
+
+    width = max(len(str(value)) for value in times + records) + 1
+    return (
+        "Time:    " + "".join(f"{time:>{width}}" for time in times) + "\n"
+        + "Distance:" + "".join(f"{record:>{width}}" for record in records) + "\n"
+    )
+
+
+def generate_day07(scale, rng):
+    lines = ["".join(rng.choices(CARD_LABELS, k=5)) + f" {rng.randint(1, 1000)}" for _ in range(_scaled(1000, scale))]
+    return "\n".join(lines) + "\n"
+
+
+def generate_day08(scale, rng):
+    directions = "".join(rng.choices("LR", k=_scaled(280, scale)))
+    ghosts = 6
+    layers = _scaled(60, scale, minimum=2)
+    if 2 * layers * ghosts > 34 * 36 * 36:
+        raise ValueError("Scale too large for three character node names")
+
+    # The third character of a node name marks start (A) and end (Z) nodes, so all other nodes avoid them
+    alphabet = string.ascii_uppercase + string.digits
+    middle = alphabet.replace("A", "").replace("Z", "")
+    taken = {"AAA", "ZZZ"}
+
+    def new_name(last):
+        while True:
+            name = "".join(rng.choices(alphabet, k=2)) + last
+            if name not in taken:
+                taken.add(name)
+                return name
+
+    lines = []
+    for ghost in range(ghosts):
+        start = "AAA" if ghost == 0 else new_name("A")
+        end = "ZZZ" if ghost == 0 else new_name("Z")
+        # Every ghost walks a chain of layers with two interchangeable nodes each, whatever the direction
+        chain = [
+            (new_name(rng.choice(middle)), new_name(rng.choice(middle))) for _ in range(rng.randint(layers, 2 * layers))
+        ]
+        lines.append(f"{start} = ({chain[0][0]}, {chain[0][1]})")
+        for (left, right), following in zip(chain, chain[1:] + [(end, end)]):
+            lines.append(f"{left} = ({following[0]}, {following[1]})")
+            lines.append(f"{right} = ({following[0]}, {following[1]})")
+        lines.append(f"{end} = ({chain[0][1]}, {chain[0][0]})")
+
+    rng.shuffle(lines)
+    return directions + "\n\n" + "\n".join(lines) + "\n"
+
+
+def generate_day09(scale, rng):
+    lines = []
+    for _ in range(_scaled(200, scale)):
+        coefficients = [rng.randint(-5, 5) for _ in range(rng.randint(1, 7))]
+        values = [sum(c * x**power for power, c in enumerate(coefficients)) for x in range(21)]
+        lines.append(" ".join(map(str, values)))
+    return "\n".join(lines) + "\n"
+
+
+def generate_day10(scale, rng):
+    side = _scaled_side(140, scale, minimum=5)
+    cells = (side - 1) // 2
+    # Scaling the boundary corners of a polyomino by two puts every loop tile on its own grid cell
+    corners = _random_polyomino_boundary(cells, cells, rng)
+    loop = []
+    for (y, x), (next_y, next_x) in zip(corners, corners[1:] + corners[:1]):
+        loop.append((2 * y, 2 * x))
+        loop.append((y + next_y, x + next_x))
+
+    pipe_for_connections = {
+        frozenset({(-1, 0), (1, 0)}): "|",
+        frozenset({(0, -1), (0, 1)}): "-",
+        frozenset({(-1, 0), (0, 1)}): "L",
+        frozenset({(-1, 0), (0, -1)}): "J",
+        frozenset({(1, 0), (0, -1)}): "7",
+        frozenset({(1, 0), (0, 1)}): "F",
+    }
+    grid = [[rng.choice("|-LJ7F..") for _ in range(side)] for _ in range(side)]
+    for index, (y, x) in enumerate(loop):
+        previous_y, previous_x = loop[index - 1]
+        next_y, next_x = loop[(index + 1) % len(loop)]
+        grid[y][x] = pipe_for_connections[frozenset({(previous_y - y, previous_x - x), (next_y - y, next_x - x)})]
+
+    start_y, start_x = rng.choice(loop)
+    grid[start_y][start_x] = "S"
+    # Clear the tiles next to the start that are not on the loop, so no stray pipe connects to it
+    loop_tiles = set(loop)
+    for delta_y, delta_x in ((-1, 0), (1, 0), (0, -1), (0, 1)):
+        y, x = start_y + delta_y, start_x + delta_x
+        if 0 <= y < side and 0 <= x < side and (y, x) not in loop_tiles:
+            grid[y][x] = "."
+    return "\n".join("".join(row) for row in grid) + "\n"
+
+
+def generate_day11(scale, rng):
+    side = _scaled_side(140, scale)
+    empty_rows = set(rng.sample(range(side), side // 20))
+    empty_columns = set(rng.sample(range(side), side // 20))
+    rows = []
+    for row in range(side):
+        rows.append("".join(
+            "#" if row not in empty_rows and column not in empty_columns and rng.random() < 0.02 else "."
+            for column in range(side)
+        ))
+    return "\n".join(rows) + "\n"
+
+
+def generate_day12(scale, rng):
+    lines = []
+    for _ in range(_scaled(1000, scale)):
+        # Start from a fully known row of springs and hide some of them
+        springs = "".join(rng.choices("#.", k=rng.randint(5, 20)))
+        if "#" not in springs:
+            springs = "#" + springs[1:]
+        groups = [len(group) for group in springs.split(".") if group]
+        records = "".join("?" if rng.random() < 0.4 else spring for spring in springs)
+        lines.append(f"{records} {','.join(map(str, groups))}")
+    return "\n".join(lines) + "\n"
+
+
+def generate_day13(scale, rng):
+    patterns = []
+    for _ in range(_scaled(100, scale)):
+        height, width = rng.randint(5, 17), rng.randint(5, 17)
+        rows = [[rng.choice("#.") for _ in range(width)] for _ in range(height)]
+
+        # Mirror the rows or columns on one side of a random reflection line onto the other side
+        if rng.random() < 0.5:
+            line = rng.randint(1, height - 1)
+            for offset in range(min(line, height - line)):
+                rows[line + offset] = rows[line - 1 - offset][:]
+        else:
+            line = rng.randint(1, width - 1)
+            for row in rows:
+                for offset in range(min(line, width - line)):
+                    row[line + offset] = row[line - 1 - offset]
+
+        # Put a smudge on the pattern, which moves the reflection line of part 2 elsewhere
+        y, x = rng.randrange(height), rng.randrange(width)
+        rows[y][x] = "#" if rows[y][x] == "." else "."
+        patterns.append("\n".join("".join(row) for row in rows))
+    return "\n\n".join(patterns) + "\n"
+
+
+def generate_day14(scale, rng):
+    side = _scaled_side(100, scale)
+    rows = ["".join(rng.choices("O#.", weights=(20, 10, 70), k=side)) for _ in range(side)]
+    return "\n".join(rows) + "\n"
+
+
+def generate_day15(scale, rng):
+    labels = _unique_names(_scaled(500, scale), rng, 2)
+    steps = [
+        f"{label}={rng.randint(1, 9)}" if rng.random() < 0.6 else f"{label}-"
+        for label in rng.choices(labels, k=_scaled(4000, scale))
+    ]
+    return ",".join(steps)
+
+
+def generate_day16(scale, rng):
+    side = _scaled_side(110, scale)
+    rows = ["".join(rng.choices(".|-/\\", weights=(90, 2.5, 2.5, 2.5, 2.5), k=side)) for _ in range(side)]
+    return "\n".join(rows) + "\n"
+
+
+def generate_day17(scale, rng):
+    side = _scaled_side(141, scale)
+    rows = ["".join(rng.choices("123456789", k=side)) for _ in range(side)]
+    return "\n".join(rows) + "\n"
+
+
+def generate_day18(scale, rng):
+    cells = _scaled_side(60, scale, minimum=2)
+    corners = _random_polyomino_boundary(cells, cells, rng)
+    direction_names = {(0, 1): "R", (1, 0): "D", (0, -1): "L", (-1, 0): "U"}
+    hex_directions = {"R": "0", "D": "1", "L": "2", "U": "3"}
+    cell_size = rng.randint(2, 9)
+    hex_cell_size = rng.randint(1000, 9999)
+
+    # Merge the unit steps of the boundary into straight runs
+    runs = []
+    for (y, x), (next_y, next_x) in zip(corners, corners[1:] + corners[:1]):
+        direction = direction_names[next_y - y, next_x - x]
+        if runs and runs[-1][0] == direction:
+            runs[-1][1] += 1
+        else:
+            runs.append([direction, 1])
+
+    lines = []
+    for direction, length in runs:
+        # Part 1 reads two digits at most, so long runs are split into several instructions
+        while length:
+            step = min(length, 99 // cell_size)
+            length -= step
+            lines.append(f"{direction} {step * cell_size} (#{step * hex_cell_size:05x}{hex_directions[direction]})")
+    return "\n".join(lines)
+
+
+def generate_day19(scale, rng):
+    workflow_count = _scaled(550, scale)
+    names = ["in"] + _unique_names(workflow_count - 1, rng, 2, reserved=("in",))
+    next_name = iter(names[1:])
+    pending = ["in"]
+    lines = []
+
+    # Build the workflows as a tree, so every part ends up in A or R
+    while pending:
+        name = pending.pop(rng.randrange(len(pending)))
+        targets = []
+        for index in range(rng.randint(2, 4)):
+            # Keep the tree growing until every workflow name is used
+            grow = rng.random() < 0.6 or (index == 0 and not pending)
+            target = next(next_name, None) if grow else None
+            if target is None:
+                target = rng.choice("AR")
+            else:
+                pending.append(target)
+            targets.append(target)
+
+        rules = [
+            f"{rng.choice('xmas')}{rng.choice('<>')}{rng.randint(1, 4000)}:{target}" for target in targets[:-1]
+        ]
+        lines.append(f"{name}{{{','.join(rules + targets[-1:])}}}")
+
+    parts = [
+        "{" + ",".join(f"{category}={rng.randint(1, 4000)}" for category in "xmas") + "}"
+        for _ in range(_scaled(200, scale))
+    ]
+    rng.shuffle(lines)
+    return "\n".join(lines) + "\n\n" + "\n".join(parts) + "\n"
+
+
+def generate_day20(scale, rng):
+    counters = _scaled(4, scale)
+    counter_bits = 12
+    names = iter(_unique_names(counters * (counter_bits + 2) + 1, rng, 2, reserved=("rx", "broadcaster")))
+    final = next(names)
+    lines = []
+    first_flip_flops = []
+
+    # Every counter is a chain of flip-flops that fires its hub whenever it reaches its period
+    for _ in range(counters):
+        period = rng.randint(3 * 2 ** (counter_bits - 2), 2**counter_bits - 1) | 1
+        flip_flops = [next(names) for _ in range(counter_bits)]
+        hub, inverter = next(names), next(names)
+        hub_targets = [flip_flops[0]]
+
+        for bit, flip_flop in enumerate(flip_flops):
+            targets = flip_flops[bit + 1 : bit + 2]
+            if period >> bit & 1:
+                targets.append(hub)
+            else:
+                hub_targets.append(flip_flop)
+            if targets:
+                lines.append(f"%{flip_flop} -> {', '.join(targets)}")
+        lines.append(f"&{hub} -> {', '.join(hub_targets + [inverter])}")
+        lines.append(f"&{inverter} -> {final}")
+        first_flip_flops.append(flip_flops[0])
+
+    lines.append(f"&{final} -> rx")
+    lines.append(f"broadcaster -> {', '.join(first_flip_flops)}")
+    rng.shuffle(lines)
+    return "\n".join(lines) + "\n"
+
+
+GENERATORS = {
+    int(name.removeprefix("generate_day")): function
+    for name, function in sorted(globals().items())
+    if name.startswith("generate_day")
+}
+
+
+def generate(day, scale=1, seed=0):
+    """
+    Generates a valid input for a day.
+
+    Args:
+    day (int): The day of the puzzle.
+    scale (float): Size of the input relative to the real puzzle input.
+    seed (int): Seed of the random number generator, the same seed always yields the same input.
+
+    Returns:
+    str: The generated puzzle input.
+    """
+    if day not in GENERATORS:
+        raise ValueError(f"No input generator for day {day}")
+    return GENERATORS[day](scale, random.Random(f"{day}:{seed}"))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Write a generated puzzle input to standard output.")
+    parser.add_argument("day", type=int, choices=sorted(GENERATORS), help="day to generate an input for")
+    parser.add_argument("--scale", type=float, default=1, help="input size relative to the real puzzle input")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the input generator")
+    args = parser.parse_args(argv)
+
+    sys.stdout.write(generate(args.day, args.scale, args.seed))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,322 @@
+"""
+Compact grid of single-byte cells shared by the grid puzzles.
+
+All cells are stored row by row in one flat bytearray, so a cell costs a single byte instead of a string
+or a coordinate tuple in a dict or set, and moving between cells is index arithmetic. Transposed and
+rotated grids are views that share the cells of the grid they were created from: they only change how
+(y, x) positions map onto the flat storage, and writes through a view change the original grid.
+
+A grid that is shared, like the parsed input both parts of a puzzle work on, can be frozen into read-only
+bytes storage, so a solver cannot change it by accident. Solvers that need to modify it work on a copy.
+
+Cells are addressed either by a (y, x) position or by a flat index y * width + x. For a grid created from
+text or with copy(), the flat index is also the index into cells, so hot loops can access grid.cells
+directly.
+
+Usage:
+    grid = Grid.from_text("#..\\n.#.\\n")
+    grid[1, 1] == ord("#")
+    grid.rotated().row(0)  # the first column, read bottom up
+"""
+
+# Directions in clockwise order, usable as indices into DIRECTION_DELTAS
+UP, RIGHT, DOWN, LEFT = range(4)
+DIRECTION_DELTAS = ((-1, 0), (0, 1), (1, 0), (0, -1))
+
+
+class Grid:
+    """
+    A rectangular grid of single-byte cells stored in a flat bytearray.
+
+    Attributes:
+    cells (bytearray): The storage of the cells, possibly shared with other grids.
+    height (int): Number of rows.
+    width (int): Number of columns.
+    offset (int): Index into cells of the cell at (0, 0).
+    row_stride (int): Distance in cells between (y, x) and (y + 1, x).
+    column_stride (int): Distance in cells between (y, x) and (y, x + 1).
+    """
+
+    __slots__ = ("cells", "height", "width", "offset", "row_stride", "column_stride")
+
+    def __init__(self, cells, height, width, *, offset=0, row_stride=None, column_stride=1):
+        self.cells = cells
+        self.height = height
+        self.width = width
+        self.offset = offset
+        # Resolved here so that views get an int, a stride of 0 only occurs in grids without columns
+        self.row_stride = row_stride or width
+        self.column_stride = column_stride
+
+    @classmethod
+    def from_text(cls, text):
+        """
+        Creates a grid from text, one row per line. Blank lines are ignored.
+
+        Args:
+        text (str or bytes): The rows of the grid.
+
+        Returns:
+        Grid: A new grid with its own storage.
+        """
+        if isinstance(text, str):
+            text = text.encode()
+        rows = [row for row in text.splitlines() if row]
+        width = len(rows[0]) if rows else 0
+        if any(len(row) != width for row in rows):
+            raise ValueError("All rows of a grid must have the same length")
+        return cls(bytearray().join(rows), len(rows), width)
+
+    @classmethod
+    def filled(cls, height, width, value=0):
+        """
+        Creates a grid with every cell set to the same value.
+
+        Args:
+        height (int): Number of rows.
+        width (int): Number of columns.
+        value (int): The byte every cell is set to.
+
+        Returns:
+        Grid: A new grid with its own storage.
+        """
+        return cls(bytearray([value]) * (height * width), height, width)
+
+    @property
+    def size(self):
+        """int: The number of cells."""
+        return self.height * self.width
+
+    @property
+    def is_contiguous(self):
+        """bool: Whether flat indices are also the indices into cells."""
+        return self.offset == 0 and self.row_stride == self.width and self.column_stride == 1
+
+    def index(self, y, x):
+        """
+        Converts a position into a flat index.
+
+        Args:
+        y (int): The row.
+        x (int): The column.
+
+        Returns:
+        int: The flat index y * width + x.
+        """
+        return y * self.width + x
+
+    def position(self, index):
+        """
+        Converts a flat index into a position.
+
+        Args:
+        index (int): The flat index.
+
+        Returns:
+        tuple: The position (y, x).
+        """
+        return divmod(index, self.width)
+
+    def storage_index(self, y, x):
+        """
+        Finds where the cell at a position is stored.
+
+        Args:
+        y (int): The row.
+        x (int): The column.
+
+        Returns:
+        int: The index into cells.
+        """
+        return self.offset + y * self.row_stride + x * self.column_stride
+
+    def _resolve(self, key):
+        if isinstance(key, tuple):
+            y, x = key
+        else:
+            y, x = divmod(key, self.width)
+        if not (0 <= y < self.height and 0 <= x < self.width):
+            raise IndexError(f"Position {(y, x)} is outside of the {self.height}x{self.width} grid")
+        return self.offset + y * self.row_stride + x * self.column_stride
+
+    def __getitem__(self, key):
+        return self.cells[self._resolve(key)]
+
+    def __setitem__(self, key, value):
+        self.cells[self._resolve(key)] = value
+
+    def __len__(self):
+        return self.size
+
+    def __str__(self):
+        return "\n".join(bytes(row).decode() for row in self.rows())
+
+    def row_indices(self, y):
+        """
+        Lists where the cells of a row are stored.
+
+        Args:
+        y (int): The row.
+
+        Returns:
+        range: The indices into cells from the first to the last column.
+        """
+        start = self.storage_index(y, 0)
+        return range(start, start + self.width * self.column_stride, self.column_stride)
+
+    def column_indices(self, x):
+        """
+        Lists where the cells of a column are stored.
+
+        Args:
+        x (int): The column.
+
+        Returns:
+        range: The indices into cells from the first to the last row.
+        """
+        start = self.storage_index(0, x)
+        return range(start, start + self.height * self.row_stride, self.row_stride)
+
+    def _view(self, indices):
+        # Slice from the start in the direction of the step first, so negative steps never wrap around
+        return memoryview(self.cells)[indices.start :: indices.step][: len(indices)]
+
+    def row(self, y):
+        """
+        Returns a row without copying it.
+
+        Args:
+        y (int): The row.
+
+        Returns:
+        memoryview: The bytes of the row, sharing the storage of the grid.
+        """
+        return self._view(self.row_indices(y))
+
+    def column(self, x):
+        """
+        Returns a column without copying it.
+
+        Args:
+        x (int): The column.
+
+        Returns:
+        memoryview: The bytes of the column from top to bottom, sharing the storage of the grid.
+        """
+        return self._view(self.column_indices(x))
+
+    def rows(self):
+        """
+        Iterates over the rows without copying them.
+
+        Yields:
+        memoryview: The bytes of each row from top to bottom.
+        """
+        for y in range(self.height):
+            yield self.row(y)
+
+    def columns(self):
+        """
+        Iterates over the columns without copying them.
+
+        Yields:
+        memoryview: The bytes of each column from left to right.
+        """
+        for x in range(self.width):
+            yield self.column(x)
+
+    def neighbor(self, index, direction):
+        """
+        Finds the neighbor of a cell in a direction.
+
+        Args:
+        index (int): The flat index of the cell.
+        direction (int): One of UP, RIGHT, DOWN and LEFT.
+
+        Returns:
+        int: The flat index of the neighbor, or None if it would lie outside of the grid.
+        """
+        if direction == UP:
+            return index - self.width if index >= self.width else None
+        if direction == DOWN:
+            return index + self.width if index + self.width < self.size else None
+        if direction == LEFT:
+            return index - 1 if index % self.width else None
+        return index + 1 if (index + 1) % self.width else None
+
+    def neighbors(self, index):
+        """
+        Finds the orthogonal neighbors of a cell.
+
+        Args:
+        index (int): The flat index of the cell.
+
+        Returns:
+        list of int: The flat indices of the neighbors inside the grid, in clockwise order from up.
+        """
+        return [
+            neighbor for neighbor in (self.neighbor(index, direction) for direction in range(4)) if neighbor is not None
+        ]
+
+    def transposed(self):
+        """
+        Swaps rows and columns without copying the cells.
+
+        Returns:
+        Grid: A view on the same cells where the cell at (y, x) is the cell at (x, y) of this grid.
+        """
+        return Grid(
+            self.cells,
+            self.width,
+            self.height,
+            offset=self.offset,
+            row_stride=self.column_stride,
+            column_stride=self.row_stride,
+        )
+
+    def rotated(self, turns=1):
+        """
+        Rotates the grid clockwise by quarter turns without copying the cells.
+
+        Args:
+        turns (int): Number of clockwise quarter turns, negative numbers rotate counterclockwise.
+
+        Returns:
+        Grid: A view on the same cells. After one turn, the first row of the view is the first column of
+        this grid read from bottom to top.
+        """
+        grid = self
+        for _ in range(turns % 4):
+            grid = Grid(
+                grid.cells,
+                grid.width,
+                grid.height,
+                offset=grid.offset + (grid.height - 1) * grid.row_stride,
+                row_stride=grid.column_stride,
+                column_stride=-grid.row_stride,
+            )
+        return grid
+
+    def _contiguous_cells(self):
+        # The cells in row order, copied into new bytes
+        if self.is_contiguous:
+            return memoryview(self.cells)[: self.size].tobytes()
+        return b"".join(row.tobytes() for row in self.rows())
+
+    def copy(self):
+        """
+        Copies the cells into new, writable storage.
+
+        Returns:
+        Grid: A contiguous grid with the same contents as this grid.
+        """
+        return Grid(bytearray(self._contiguous_cells()), self.height, self.width)
+
+    def frozen(self):
+        """
+        Copies the cells into new, read-only storage.
+
+        Returns:
+        Grid: A contiguous grid with the same contents as this grid, whose cells are bytes.
+        """
+        return Grid(self._contiguous_cells(), self.height, self.width)
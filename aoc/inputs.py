@@ -0,0 +1,335 @@
+"""
+Shared loading of puzzle inputs.
+
+An input can be loaded in one of three modes, which every day selects with its INPUT_MODE constant:
+
+- "text": the whole file as a single string, for puzzles that need random access to the input.
+- "mmap": the file memory-mapped as read-only bytes, without copying it into the process.
+- "lines": a lazy iterator over the records of the file, so processing starts before the file has been
+  read completely and at most one record is held in memory at a time. Records are separated by newlines
+  unless the day sets INPUT_SEPARATOR.
+
+Instead of a file, an input can also come from standard input or any readable text or binary stream, such
+as a pipe from a generator or a decompressor. Streams cannot be mapped into memory, but in the "lines" mode
+they are read incrementally just like files, so an input never has to be written to disk first.
+
+Files and streams compressed with gzip, xz or zstd are recognized by their first bytes, whatever they are
+named, and decompressed while they are read. The "lines" mode then holds no more of the decompressed input
+than the record being processed, and a compressed input is read into memory instead of being mapped.
+Reading zstd needs the zstandard package, or the compression.zstd module of Python 3.14.
+
+Usage:
+    with open_input(path, mode="lines") as lines:
+        for line in lines:
+            ...
+
+    python 2023/Day_12/main.py - < input.txt
+    python 2023/Day_12/main.py input.txt.gz
+"""
+
+import io
+import mmap
+import os
+import sys
+from contextlib import contextmanager
+from pathlib import Path
+
+INPUT_MODES = ("text", "mmap", "lines")
+
+# Source of an input that is read from standard input
+STDIN = "-"
+
+# Names of the default input of a day, uncompressed or archived, in the order they are looked for
+DEFAULT_INPUT_NAMES = ("input.txt", "input.txt.gz", "input.txt.xz", "input.txt.zst")
+
+# Magic bytes at the start of the data of every supported compression format
+COMPRESSION_MAGIC = {
+    "gzip": b"\x1f\x8b",
+    "xz": b"\xfd7zXZ\x00",
+    "zstd": b"\x28\xb5\x2f\xfd",
+}
+
+# Number of bytes needed to recognize every compression format
+MAGIC_SIZE = max(len(magic) for magic in COMPRESSION_MAGIC.values())
+
+# Number of characters read at once when splitting records on a separator other than a newline
+CHUNK_SIZE = 1 << 16
+
+
+def iter_lines(source, separator="\n"):
+    """
+    Iterates over the records of an input that is either a string or already an iterable of records.
+
+    This lets the solvers of line based days accept both the sample inputs, which are strings, and the
+    lazy iterators of the "lines" mode.
+
+    Args:
+    source (str or iterable of str): The input data.
+    separator (str): Separator between the records.
+
+    Returns:
+    iterator of str: The records without their separator.
+    """
+    if isinstance(source, str):
+        if separator == "\n":
+            return iter(source.splitlines())
+        return iter(source.strip("\r\n").split(separator))
+    return iter(source)
+
+
+def read_records(input_file, separator="\n"):
+    """
+    Lazily reads the records of an opened text file.
+
+    Args:
+    input_file (file): The opened text file.
+    separator (str): Separator between the records.
+
+    Yields:
+    str: Each record without its separator and without line breaks around it.
+    """
+    if separator == "\n":
+        for line in input_file:
+            yield line.rstrip("\r\n")
+        return
+
+    pending = ""
+    while chunk := input_file.read(CHUNK_SIZE):
+        records = (pending + chunk).split(separator)
+        # The last record may continue in the next chunk
+        pending = records.pop()
+        for record in records:
+            yield record.strip("\r\n")
+    if pending.strip("\r\n"):
+        yield pending.strip("\r\n")
+
+
+@contextmanager
+def open_input(source, mode="text", separator="\n"):
+    """
+    Opens a puzzle input in the given mode.
+
+    Args:
+    source (str, Path or file): Path to the input file, STDIN for standard input, or a readable text or
+    binary stream, which is left open.
+    mode (str): One of "text", "mmap" or "lines".
+    separator (str): Separator between the records in "lines" mode.
+
+    Yields:
+    str, bytes, mmap.mmap or iterator of str: The input as a string, as memory-mapped bytes of a file or
+    the bytes of a stream, or as a lazy iterator over its records, valid until the context is left.
+    """
+    if mode not in INPUT_MODES:
+        raise ValueError(f"Unknown input mode {mode!r}, expected one of {', '.join(INPUT_MODES)}")
+
+    if not isinstance(source, (str, os.PathLike)) or source == STDIN:
+        with _stream_input(sys.stdin if source == STDIN else source, mode, separator) as input_data:
+            yield input_data
+        return
+
+    with open(source, "rb") as input_file:
+        if mode != "mmap" or detect_compression(input_file.peek(MAGIC_SIZE)) is not None:
+            with _stream_input(input_file, mode, separator) as input_data:
+                yield input_data
+            return
+        try:
+            mapped_input = mmap.mmap(input_file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty files cannot be mapped
+            yield b""
+            return
+        with mapped_input:
+            yield mapped_input
+
+
+def detect_compression(head):
+    """
+    Recognizes the compression format of data by its magic bytes.
+
+    Args:
+    head (bytes): The first bytes of the data, at least the first six to recognize every format.
+
+    Returns:
+    str: One of "gzip", "xz" or "zstd", or None if the data is not compressed in a supported format.
+    """
+    for compression, magic in COMPRESSION_MAGIC.items():
+        if head.startswith(magic):
+            return compression
+    return None
+
+
+@contextmanager
+def _stream_input(stream, mode, separator):
+    # Loads an input from a stream in the given mode, decompressing it if needed
+    if isinstance(stream.read(0), str):
+        stream = getattr(stream, "buffer", stream)
+        if isinstance(stream, io.TextIOBase):
+            # A text stream without an underlying binary stream cannot be compressed
+            if mode == "mmap":
+                yield stream.read().encode()
+            else:
+                yield stream.read() if mode == "text" else read_records(stream, separator)
+            return
+
+    with _decompressed(stream) as binary_stream:
+        if mode == "mmap":
+            yield binary_stream.read()
+            return
+        with _text_stream(binary_stream) as input_file:
+            yield input_file.read() if mode == "text" else read_records(input_file, separator)
+
+
+@contextmanager
+def _decompressed(stream):
+    # Views a binary stream decompressed if it starts with the magic bytes of a supported format, leaving the
+    # stream itself open
+    if hasattr(stream, "peek"):
+        head = stream.peek(MAGIC_SIZE)[:MAGIC_SIZE]
+    elif stream.seekable():
+        position = stream.tell()
+        head = stream.read(MAGIC_SIZE)
+        stream.seek(position)
+    else:
+        # Buffer the stream to look ahead without consuming the magic bytes
+        buffered_stream = io.BufferedReader(stream)
+        try:
+            with _decompressed(buffered_stream) as decompressed_stream:
+                yield decompressed_stream
+        finally:
+            buffered_stream.detach()
+        return
+
+    compression = detect_compression(head)
+    if compression is None:
+        yield stream
+        return
+    # The decompressors are imported on demand, as most inputs are not compressed
+    if compression == "gzip":
+        import gzip  # pylint: disable=import-outside-toplevel
+
+        decompressed_stream = gzip.GzipFile(fileobj=stream, mode="rb")
+    elif compression == "xz":
+        import lzma  # pylint: disable=import-outside-toplevel
+
+        decompressed_stream = lzma.LZMAFile(stream)
+    else:
+        decompressed_stream = _zstd_reader(stream)
+    with decompressed_stream:
+        yield decompressed_stream
+
+
+def _zstd_reader(stream):
+    # Opens a decompressing view of a zstd stream with whichever implementation is available
+    try:
+        import zstandard  # pylint: disable=import-outside-toplevel
+    except ImportError:
+        try:
+            from compression import zstd  # pylint: disable=import-outside-toplevel
+        except ImportError:
+            raise ValueError("Reading zstd inputs needs the zstandard package (poetry install -E zstd)") from None
+        return zstd.ZstdFile(stream)
+    return zstandard.ZstdDecompressor().stream_reader(stream, read_across_frames=True, closefd=False)
+
+
+@contextmanager
+def _text_stream(stream):
+    # Views a binary stream as text, without closing it when the view is no longer needed
+    if isinstance(stream.read(0), str):
+        yield stream
+        return
+    text_stream = io.TextIOWrapper(stream, encoding="utf-8")
+    try:
+        yield text_stream
+    finally:
+        text_stream.detach()
+
+
+def input_source(script_path, argv=None):
+    """
+    Picks the input of a day's script from its command line.
+
+    Args:
+    script_path (str or Path): Path to the day's main.py, usually __file__.
+    argv (list of str): The command line arguments, defaults to sys.argv[1:].
+
+    Returns:
+    str: The path given as the first argument, STDIN if it is "-", or the default input of the script.
+    """
+    argv = sys.argv[1:] if argv is None else argv
+    if argv:
+        return argv[0]
+    return str(default_input(os.path.realpath(script_path)))
+
+
+def is_splittable(source, min_size):
+    """
+    Checks whether an input is a file that can be split into byte ranges, to be read in parallel.
+
+    Args:
+    source (str or Path): Path to the input file, or STDIN for standard input.
+    min_size (int): The size in bytes from which splitting the file is worth it.
+
+    Returns:
+    bool: Whether the source is an uncompressed file of at least min_size bytes. Standard input and
+    compressed files can only be read as a stream.
+    """
+    if source == STDIN or os.path.getsize(source) < max(min_size, 1):
+        return False
+    with open(source, "rb") as input_file:
+        return detect_compression(input_file.read(MAGIC_SIZE)) is None
+
+
+def split_file(path, chunks):
+    """
+    Splits a file into byte ranges that start and end at line boundaries.
+
+    Args:
+    path (str or Path): The input file, which must not be empty.
+    chunks (int): The number of ranges to aim for.
+
+    Returns:
+    list of tuple: The start and end offsets of the non-empty ranges, covering the whole file in order.
+    """
+    with open(path, "rb") as input_file, mmap.mmap(input_file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        size = len(mapped)
+        ranges, start = [], 0
+        for chunk in range(1, chunks + 1):
+            end = size
+            if chunk < chunks:
+                # Move the boundary behind the next line break
+                end = mapped.find(b"\n", max(start, size * chunk // chunks)) + 1 or size
+            if end > start:
+                ranges.append((start, end))
+                start = end
+    return ranges
+
+
+def default_input(script_path):
+    """
+    Finds the input of a day that is used when no other input is given.
+
+    Args:
+    script_path (str or Path): Path to the day's main.py.
+
+    Returns:
+    Path: The input.txt next to the script, or its compressed archive if only that exists. The path of the
+    input.txt is returned when neither exists.
+    """
+    day_dir = Path(script_path).parent
+    for name in DEFAULT_INPUT_NAMES:
+        if (day_dir / name).is_file():
+            return day_dir / name
+    return day_dir / DEFAULT_INPUT_NAMES[0]
+
+
+def day_input_options(module):
+    """
+    Looks up how a day wants its input to be loaded.
+
+    Args:
+    module (module): The imported day module.
+
+    Returns:
+    tuple: The input mode and record separator of the day.
+    """
+    return getattr(module, "INPUT_MODE", "text"), getattr(module, "INPUT_SEPARATOR", "\n")
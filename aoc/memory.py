@@ -0,0 +1,196 @@
+"""
+Memory instrumentation of single solver calls with tracemalloc.
+
+For a call, four figures are collected:
+
+- the peak memory allocated while the solver ran,
+- the source lines holding the most memory at the peak, such as a dict of seen states local to the solver,
+- the retained memory, which is still allocated after the solver returned and the garbage collector ran,
+  such as unbounded caches or module level state,
+- the source lines holding the most of the retained memory.
+
+tracemalloc can only take snapshots of the allocations alive at one point in time, not at the peak. A
+background thread therefore samples the traced memory at a fixed interval, and takes a new snapshot
+whenever the memory grew by PEAK_SNAPSHOT_GROWTH over the last one. The peak lines come from the last of
+these snapshots, so they miss allocations made after it that are shorter than the interval.
+
+Usage:
+    answer, peak_memory, retained_memory, top_lines, peak_lines = trace_solver(solver, input_data)
+"""
+
+import gc
+import sys
+import threading
+import tracemalloc
+from dataclasses import dataclass
+
+# Factor the traced memory has to grow by over the last snapshot before the next one is taken. Smaller
+# factors take the peak lines closer to the peak, but every snapshot takes time in proportion to the
+# number of allocations.
+PEAK_SNAPSHOT_GROWTH = 1.1
+
+
+@dataclass(frozen=True)
+class AllocationSite:
+    """
+    Memory held by the allocations of one source line.
+
+    Attributes:
+    filename (str): File containing the line.
+    line (int): Line number.
+    size (int): Total size of the allocations in bytes.
+    count (int): Number of allocated memory blocks.
+    """
+
+    filename: str
+    line: int
+    size: int
+    count: int
+
+
+@dataclass(frozen=True)
+class MemoryReport:
+    """
+    Memory use of one part of one day.
+
+    Attributes:
+    day (int): The day of the puzzle.
+    part (int): The part of the puzzle (1 or 2).
+    answer (object): The value returned by the solver, or None if it failed.
+    peak_memory (int): Peak memory allocated while the solver ran in bytes.
+    retained_memory (int): Memory still allocated after the solver returned in bytes.
+    top_lines (list of AllocationSite): The lines holding the most retained memory.
+    peak_lines (list of AllocationSite): The lines holding the most memory at the peak.
+    error (str): Description of the exception raised by the solver, if any.
+    """
+
+    day: int
+    part: int
+    answer: object
+    peak_memory: int
+    retained_memory: int
+    top_lines: list
+    peak_lines: list
+    error: str = None
+
+
+def _solver_traces(snapshot):
+    # Leaves out the allocations of the tracing itself, like the snapshots and the peak lines
+    return snapshot.filter_traces([
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, __file__),
+    ])
+
+
+def _top_lines(snapshot, top):
+    # The lines holding the most memory in a snapshot filtered by _solver_traces
+    return [
+        AllocationSite(statistic.traceback[0].filename, statistic.traceback[0].lineno, statistic.size, statistic.count)
+        for statistic in snapshot.statistics("lineno")[:top]
+    ]
+
+
+class _PeakSampler:
+    """
+    Keeps the top lines of a snapshot taken close to the peak of the traced memory.
+
+    Taking a snapshot allocates memory for its traces, which tracemalloc traces as well. The sampler
+    therefore keeps only the top lines of a snapshot, and resets the peak of tracemalloc after every
+    snapshot, remembering the peak before it instead. A peak the solver reaches and leaves again while a
+    snapshot is taken is missed.
+
+    Attributes:
+    top (int): Number of source lines to keep.
+    peak_memory (int): Peak memory traced outside of the snapshots in bytes.
+    snapshot_memory (int): Memory traced when the last snapshot was taken in bytes.
+    peak_lines (list of AllocationSite): The top lines of the last snapshot.
+    """
+
+    def __init__(self, top):
+        self.top = top
+        self.peak_memory = self.snapshot_memory = 0
+        self.peak_lines = []
+
+    def sample(self):
+        """
+        Takes a snapshot if the traced memory grew enough since the last one.
+        """
+        current_memory, peak_memory = tracemalloc.get_traced_memory()
+        if current_memory > self.snapshot_memory * PEAK_SNAPSHOT_GROWTH:
+            self.peak_memory = max(self.peak_memory, peak_memory)
+            self.peak_lines = _top_lines(_solver_traces(tracemalloc.take_snapshot()), self.top)
+            self.snapshot_memory = current_memory
+            tracemalloc.reset_peak()
+
+    def finish(self):
+        """
+        Takes the peak of the memory traced since the last snapshot into account.
+
+        Returns:
+        int: Peak memory traced outside of the snapshots in bytes.
+        """
+        _, peak_memory = tracemalloc.get_traced_memory()
+        self.peak_memory = max(self.peak_memory, peak_memory)
+        return self.peak_memory
+
+
+def trace_solver(solver, input_data, top=10, interval=0.001):
+    """
+    Calls a solver while tracing its memory allocations.
+
+    Only allocations made during the call are traced, so an input that is already loaded is not counted.
+    As in aoc.profiling.sample_call, the switch interval is lowered to the sampling interval for the
+    duration of the call, so that the sampling thread gets to run.
+
+    Args:
+    solver (callable): The solver to trace.
+    input_data (object): The input of the solver.
+    top (int): Number of source lines to report.
+    interval (float): Time between two samples of the traced memory in seconds.
+
+    Returns:
+    tuple: The answer, the peak and retained memory in bytes, and the top lines of the retained memory and
+    of the memory at the peak as AllocationSites.
+    """
+    # Filtering a snapshot fills caches, like the compiled patterns of the filters, which must not be
+    # counted as memory of the solver. The patterns are only compiled for a snapshot with traces.
+    tracemalloc.start()
+    traced_object = [None]
+    _solver_traces(tracemalloc.take_snapshot())
+    tracemalloc.stop()
+    del traced_object
+
+    # The sampling thread is started before the tracing, so that its own state is not traced
+    sampler = _PeakSampler(top)
+    started = threading.Event()
+    done = threading.Event()
+
+    def sample():
+        started.wait()
+        while not done.wait(interval):
+            sampler.sample()
+
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(min(switch_interval, interval))
+    sampling_thread = threading.Thread(target=sample, daemon=True)
+    sampling_thread.start()
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        started.set()
+        try:
+            answer = solver(input_data)
+        finally:
+            done.set()
+            sampling_thread.join()
+            sys.setswitchinterval(switch_interval)
+        peak_memory = sampler.finish()
+        # Only count memory that is really retained, not garbage waiting for a collection
+        gc.collect()
+        snapshot = _solver_traces(tracemalloc.take_snapshot())
+        retained_memory = sum(trace.size for trace in snapshot.traces)
+        top_lines = _top_lines(snapshot, top)
+    finally:
+        tracemalloc.stop()
+    return answer, peak_memory, retained_memory, top_lines, sampler.peak_lines
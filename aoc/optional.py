@@ -0,0 +1,25 @@
+"""
+Optional dependencies of the solutions, which are only imported where they pay off.
+
+NumPy speeds up some days on large inputs, but importing it takes longer than solving a real puzzle input.
+The days therefore check whether it is installed without importing it, and import it only once an input
+is large enough. Install it with "poetry install -E numpy".
+
+Usage:
+    if numpy_available():
+        import numpy
+"""
+
+import functools
+import importlib.util
+
+
+@functools.cache
+def numpy_available():
+    """
+    Checks whether NumPy is installed, without importing it.
+
+    Returns:
+    bool: Whether NumPy can be imported.
+    """
+    return importlib.util.find_spec("numpy") is not None
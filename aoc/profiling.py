@@ -0,0 +1,309 @@
+"""
+Profiling of single solver calls, with reports of the hot functions and files for flame graph tools.
+
+A call is profiled deterministically with cProfile, whose statistics are written as a pstats file that
+can be opened with ``python -m pstats`` or snakeviz. The same statistics are also written as collapsed
+stacks, one ``frame;frame;frame weight`` line per stack, which flamegraph.pl, speedscope and inferno read
+directly. cProfile only records which function called which, so these stacks are reconstructed by
+splitting the time of every function over its callers in proportion to the time spent in each call.
+
+Exact stacks come from the optional sampling profiler instead, which runs the call again while a
+background thread records the stack of the solver at a fixed interval. Sampling adds almost no overhead,
+but it cannot resolve calls that are shorter than the interval.
+
+Usage:
+    answer, stats = profile_call(solver, input_data)
+    write_collapsed(collapse_stats(stats), "day17_part1.folded")
+"""
+
+import cProfile
+import pstats
+import sys
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass
+from pathlib import Path
+
+# Stacks reconstructed from cProfile are cut off below this weight in microseconds and at this depth
+MIN_STACK_WEIGHT = 1
+MAX_STACK_DEPTH = 64
+
+
+@dataclass(frozen=True)
+class FunctionStats:
+    """
+    Aggregated cost of one function in a profile.
+
+    Attributes:
+    function (str): Label of the function with the file and line it is defined in.
+    calls (int): Total number of calls, including recursive ones.
+    total_time (float): Time spent in the function itself in seconds.
+    cumulative_time (float): Time spent in the function and everything it called in seconds.
+    """
+
+    function: str
+    calls: int
+    total_time: float
+    cumulative_time: float
+
+
+@dataclass(frozen=True)
+class PartProfile:
+    """
+    Profile of one part of one day.
+
+    Attributes:
+    day (int): The day of the puzzle.
+    part (int): The part of the puzzle (1 or 2).
+    answer (object): The value returned by the solver.
+    wall_time (float): Elapsed wall-clock time of the profiled run in seconds.
+    top_functions (list of FunctionStats): The most expensive functions by cumulative time.
+    files (list of Path): The written pstats and collapsed stack files.
+    error (str): Description of the exception raised by the solver, if any.
+    """
+
+    day: int
+    part: int
+    answer: object
+    wall_time: float
+    top_functions: list
+    files: list
+    error: str = None
+
+
+def frame_label(filename, line, function):
+    """
+    Names a function in a report or a collapsed stack.
+
+    Args:
+    filename (str): File the function is defined in, "~" for built-in functions.
+    line (int): Line the function is defined on.
+    function (str): Name of the function.
+
+    Returns:
+    str: The function name followed by its file and line, without semicolons.
+    """
+    if filename == "~":
+        # Built-in functions like "<built-in method _bisect.insort>" have no file
+        label = function
+    else:
+        path = Path(filename)
+        label = f"{function} ({path.parent.name}/{path.name}:{line})"
+    return label.replace(";", ",")
+
+
+def profile_call(function, argument):
+    """
+    Calls a function under cProfile.
+
+    Args:
+    function (callable): The function to profile.
+    argument (object): The only argument of the function.
+
+    Returns:
+    tuple: The return value of the function and its pstats.Stats.
+    """
+    profiler = cProfile.Profile()
+    result = profiler.runcall(function, argument)
+    return result, pstats.Stats(profiler)
+
+
+def sample_call(function, argument, interval=0.001):
+    """
+    Calls a function while sampling its stack from a background thread.
+
+    The sampler can only run when the interpreter switches threads, so the switch interval is lowered to
+    the sampling interval for the duration of the call.
+
+    Args:
+    function (callable): The function to profile.
+    argument (object): The only argument of the function.
+    interval (float): Time between two samples in seconds.
+
+    Returns:
+    tuple: The return value of the function and a Counter of collapsed stacks to the number of samples.
+    """
+    stacks = Counter()
+    target_thread = threading.get_ident()
+    # Frame of the call below, only the frames it calls are part of the stacks
+    call_frames = []
+    done = threading.Event()
+
+    def call():
+        call_frames.append(sys._getframe())  # pylint: disable=protected-access
+        return function(argument)
+
+    def sample():
+        while not done.wait(interval):
+            frame = sys._current_frames().get(target_thread)  # pylint: disable=protected-access
+            stack = _stack(frame, call_frames[0]) if call_frames else []
+            if stack:
+                stacks[";".join(stack)] += 1
+
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(min(switch_interval, interval))
+    sampler = threading.Thread(target=sample, daemon=True)
+    sampler.start()
+    try:
+        result = call()
+    finally:
+        done.set()
+        sampler.join()
+        sys.setswitchinterval(switch_interval)
+
+    return result, stacks
+
+
+def _stack(frame, caller_frame):
+    # Labels of the frames called by caller_frame from the outermost to the innermost call, or an empty
+    # list if the sampled thread is not inside caller_frame at all
+    labels = []
+    while frame is not None and frame is not caller_frame:
+        code = frame.f_code
+        labels.append(frame_label(code.co_filename, code.co_firstlineno, code.co_name))
+        frame = frame.f_back
+    return labels[::-1] if frame is caller_frame else []
+
+
+def collapse_stats(stats):
+    """
+    Reconstructs collapsed stacks from the caller graph of a cProfile run.
+
+    The own time of every function is split over its callers in proportion to the cumulative time of
+    each call edge, and so on up to the functions without callers. Recursive calls are not followed.
+
+    Args:
+    stats (pstats.Stats): The profile.
+
+    Returns:
+    Counter: Mapping of collapsed stack to its own time in microseconds.
+    """
+    profile = _solver_stats(stats)
+    stacks = Counter()
+
+    def expand(function, weight, path):
+        callers = {caller: edge[3] for caller, edge in profile[function][4].items() if caller not in path}
+        total = sum(callers.values())
+        if not callers or total <= 0 or len(path) >= MAX_STACK_DEPTH:
+            stacks[";".join(frame_label(*frame) for frame in reversed(path))] += weight
+            return
+        for caller, edge_time in callers.items():
+            caller_weight = weight * edge_time / total
+            if caller_weight >= MIN_STACK_WEIGHT:
+                expand(caller, caller_weight, path + [caller])
+            else:
+                # Too little time to be visible in a flame graph, keep it at the current depth
+                stacks[";".join(frame_label(*frame) for frame in reversed(path))] += caller_weight
+
+    for function, (_, _, total_time, _, _) in profile.items():
+        if total_time > 0:
+            expand(function, total_time * 1e6, [function])
+
+    return Counter({stack: round(weight) for stack, weight in stacks.items() if round(weight) > 0})
+
+
+def _solver_stats(stats):
+    # The raw statistics without the call that stops the profiler, which is not part of the solver
+    return {
+        function: function_stats
+        for function, function_stats in stats.stats.items()  # pylint: disable=no-member
+        if "_lsprof.Profiler" not in function[2]
+    }
+
+
+def write_collapsed(stacks, path):
+    """
+    Writes collapsed stacks in the format of flamegraph.pl.
+
+    Args:
+    stacks (Counter): Mapping of collapsed stack to its weight.
+    path (str or Path): The file to write.
+    """
+    with open(path, "w") as output_file:
+        for stack, weight in sorted(stacks.items()):
+            output_file.write(f"{stack} {weight}\n")
+
+
+def top_functions(stats, limit=20):
+    """
+    Finds the functions with the highest cumulative time.
+
+    Args:
+    stats (pstats.Stats): The profile.
+    limit (int): Maximum number of functions.
+
+    Returns:
+    list of FunctionStats: The functions ordered by decreasing cumulative time.
+    """
+    functions = [
+        FunctionStats(frame_label(*function), calls, total_time, cumulative_time)
+        for function, (_, calls, total_time, cumulative_time, _) in _solver_stats(stats).items()
+    ]
+    functions.sort(key=lambda function: function.cumulative_time, reverse=True)
+    return functions[:limit]
+
+
+def profile_solver(solver, open_data, output_prefix, top=20, sample_interval=None):
+    """
+    Profiles a solver and writes its pstats and collapsed stack files.
+
+    Args:
+    solver (callable): The solver to profile.
+    open_data (callable): Returns a context manager yielding a fresh input for the solver.
+    output_prefix (str or Path): Path of the output files without extension.
+    top (int): Number of functions to report.
+    sample_interval (float): Interval of the sampling profiler in seconds, or None to skip sampling.
+
+    Returns:
+    tuple: The answer, the wall-clock time of the profiled run, the top functions and the written files.
+    """
+    output_prefix = Path(output_prefix)
+    output_prefix.parent.mkdir(parents=True, exist_ok=True)
+
+    with open_data() as input_data:
+        wall_start = time.perf_counter()
+        answer, stats = profile_call(solver, input_data)
+        wall_time = time.perf_counter() - wall_start
+
+    files = [output_prefix.with_suffix(".pstats"), output_prefix.with_suffix(".folded")]
+    stats.dump_stats(files[0])
+    write_collapsed(collapse_stats(stats), files[1])
+
+    if sample_interval:
+        # Sample a second run, so the overhead of cProfile does not distort the samples
+        with open_data() as input_data:
+            _, stacks = sample_call(solver, input_data, sample_interval)
+        files.append(output_prefix.with_suffix(".sampled.folded"))
+        write_collapsed(stacks, files[-1])
+
+    return answer, wall_time, top_functions(stats, top), files
+
+
+def format_profile_report(profiles):
+    """
+    Formats the hot functions of every profiled part as tables.
+
+    Args:
+    profiles (list of PartProfile): The profiles to report.
+
+    Returns:
+    str: The report, one section per part.
+    """
+    sections = []
+    for profile in profiles:
+        if profile.error:
+            sections.append(f"Day {profile.day} part {profile.part}: failed: {profile.error}")
+            continue
+        lines = [
+            f"Day {profile.day} part {profile.part}: {profile.answer} in {profile.wall_time:.4f}s (profiled)",
+            f"  {'Calls':>10}  {'Own [s]':>10}  {'Cum. [s]':>10}  Function",
+        ]
+        for function in profile.top_functions:
+            lines.append(
+                f"  {function.calls:>10}  {function.total_time:>10.4f}  {function.cumulative_time:>10.4f}"
+                f"  {function.function}"
+            )
+        lines.extend(f"  -> {path}" for path in profile.files)
+        sections.append("\n".join(lines))
+    return "\n\n".join(sections)
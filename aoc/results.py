@@ -0,0 +1,293 @@
+"""
+Store of benchmark runs and a gate that compares them across commits.
+
+Every run of aoc.benchmark with --save is written as one JSON file under a directory per machine, named
+after the commit it measured and the time it was taken. The machine is identified by a fingerprint of its
+processor, operating system and Python version, since timings are only comparable on the same machine
+and interpreter.
+
+Comparing two commits matches their measurements by day, part and input scale and flags every one whose
+wall-clock time or peak memory grew by more than a threshold. Timings below a noise floor are ignored, as
+they are dominated by the resolution of the clock. The command exits with status 1 if anything regressed,
+so it can block a change in CI.
+
+Usage:
+    python -m aoc.benchmark 12 17 --scales 1 10 --repeat 3 --save
+    python -m aoc.results BASELINE [CANDIDATE] [--time-threshold 0.25] [--memory-threshold 0.25]
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import platform
+import subprocess
+import sys
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+
+# Directory of the stored runs unless told otherwise
+DEFAULT_RESULTS_DIR = Path(__file__).resolve().parent.parent / "benchmarks"
+
+# Relative growth of the time or peak memory of a measurement that counts as a regression
+DEFAULT_TIME_THRESHOLD = 0.25
+DEFAULT_MEMORY_THRESHOLD = 0.25
+
+# Timings in seconds below which a measurement is too noisy to compare
+DEFAULT_MIN_TIME = 0.005
+
+
+@dataclass(frozen=True)
+class Regression:
+    """
+    A measurement that got worse between two runs.
+
+    Attributes:
+    day (int): The day of the puzzle.
+    part (int): The part of the puzzle (1 or 2).
+    scale (float): Size of the generated input relative to the real puzzle input.
+    metric (str): Either "wall_time" or "peak_memory".
+    baseline (float): The value in the baseline run.
+    candidate (float): The value in the compared run.
+    """
+
+    day: int
+    part: int
+    scale: float
+    metric: str
+    baseline: float
+    candidate: float
+
+    @property
+    def ratio(self):
+        """float: How many times larger the value of the compared run is."""
+        return self.candidate / self.baseline
+
+
+def machine_info():
+    """
+    Describes the machine and interpreter the benchmarks run on.
+
+    Returns:
+    dict: The processor, operating system, number of CPUs and Python implementation and version.
+    """
+    return {
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "system": platform.system(),
+        "release": platform.release(),
+        "cpus": os.cpu_count(),
+        "python": f"{platform.python_implementation()} {platform.python_version()}",
+    }
+
+
+def machine_fingerprint(info=None):
+    """
+    Derives the identifier of a machine from its description.
+
+    Args:
+    info (dict): The description from machine_info(), defaults to the current machine.
+
+    Returns:
+    str: The first 12 hexadecimal digits of the SHA-256 digest of the description.
+    """
+    info = machine_info() if info is None else info
+    return hashlib.sha256(json.dumps(info, sort_keys=True).encode()).hexdigest()[:12]
+
+
+def resolve_commit(revision="HEAD", repository=DEFAULT_RESULTS_DIR.parent):
+    """
+    Resolves a git revision to the hash of its commit.
+
+    Args:
+    revision (str): Any revision git understands, such as "HEAD~1", a branch or an abbreviated hash.
+    repository (str or Path): Directory inside the git repository.
+
+    Returns:
+    str: The full hash, with "-dirty" appended for HEAD if the working tree has uncommitted changes, or the
+    revision itself if git cannot resolve it.
+    """
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--verify", "--quiet", f"{revision}^{{commit}}"],
+            cwd=repository, capture_output=True, text=True, check=True,
+        ).stdout.strip()
+        if revision == "HEAD":
+            changes = subprocess.run(
+                ["git", "status", "--porcelain", "--untracked-files=no"],
+                cwd=repository, capture_output=True, text=True, check=True,
+            ).stdout
+            if changes.strip():
+                commit += "-dirty"
+    except (OSError, subprocess.CalledProcessError):
+        return revision
+    return commit
+
+
+def save_run(measurements, settings, directory=DEFAULT_RESULTS_DIR, commit=None):
+    """
+    Stores the measurements of a benchmark run.
+
+    Args:
+    measurements (list of Measurement): The measurements of the run.
+    settings (dict): The settings of the run, such as the seed and the number of repetitions.
+    directory (str or Path): Directory of the stored runs.
+    commit (str): Commit that was measured, defaults to the current one.
+
+    Returns:
+    Path: The written file.
+    """
+    info = machine_info()
+    created = datetime.now(timezone.utc)
+    run = {
+        "commit": commit or resolve_commit(),
+        "machine": machine_fingerprint(info),
+        "machine_info": info,
+        "created": created.isoformat(timespec="seconds"),
+        "settings": settings,
+        "measurements": [asdict(measurement) for measurement in measurements],
+    }
+
+    path = Path(directory) / run["machine"] / f"{run['commit']}-{created:%Y%m%dT%H%M%S}.json"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(run, indent=2) + "\n")
+    return path
+
+
+def load_run(commit, directory=DEFAULT_RESULTS_DIR, machine=None):
+    """
+    Loads the latest stored run of a commit on a machine.
+
+    Args:
+    commit (str): The commit hash or a prefix of it.
+    directory (str or Path): Directory of the stored runs.
+    machine (str): Fingerprint of the machine, defaults to the current one.
+
+    Returns:
+    dict: The stored run, or None if the commit was not benchmarked on the machine.
+    """
+    machine_dir = Path(directory) / (machine or machine_fingerprint())
+    # Runs of uncommitted changes only count when they are asked for
+    paths = [
+        path
+        for path in machine_dir.glob(f"{commit}*.json")
+        if commit.endswith("-dirty") or "-dirty-" not in path.name
+    ]
+    # Sort by the timestamp at the end of the file names
+    paths.sort(key=lambda path: path.stem.rpartition("-")[2])
+    return json.loads(paths[-1].read_text()) if paths else None
+
+
+def compare_runs(
+    baseline,
+    candidate,
+    time_threshold=DEFAULT_TIME_THRESHOLD,
+    memory_threshold=DEFAULT_MEMORY_THRESHOLD,
+    min_time=DEFAULT_MIN_TIME,
+):
+    """
+    Finds the measurements that regressed between two runs.
+
+    Only the day, part and scale combinations measured in both runs are compared.
+
+    Args:
+    baseline (dict): The stored run to compare against.
+    candidate (dict): The stored run to check.
+    time_threshold (float): Relative growth of the wall-clock time that counts as a regression.
+    memory_threshold (float): Relative growth of the peak memory that counts as a regression.
+    min_time (float): Timings in seconds below which both runs are considered equally fast.
+
+    Returns:
+    list of Regression: The regressions ordered by day, part, scale and metric.
+    """
+    baseline_measurements = {
+        (measurement["day"], measurement["part"], measurement["scale"]): measurement
+        for measurement in baseline["measurements"]
+    }
+
+    regressions = []
+    for measurement in candidate["measurements"]:
+        key = (measurement["day"], measurement["part"], measurement["scale"])
+        previous = baseline_measurements.get(key)
+        if previous is None:
+            continue
+
+        if (
+            previous["wall_time"] is not None
+            and measurement["wall_time"] is not None
+            and measurement["wall_time"] >= min_time
+            and measurement["wall_time"] > max(previous["wall_time"], min_time) * (1 + time_threshold)
+        ):
+            baseline_time = max(previous["wall_time"], min_time)
+            regressions.append(Regression(*key, "wall_time", baseline_time, measurement["wall_time"]))
+
+        if (
+            previous["peak_memory"]
+            and measurement["peak_memory"] is not None
+            and measurement["peak_memory"] > previous["peak_memory"] * (1 + memory_threshold)
+        ):
+            regressions.append(Regression(*key, "peak_memory", previous["peak_memory"], measurement["peak_memory"]))
+
+    return sorted(regressions, key=lambda regression: (regression.day, regression.part, regression.scale))
+
+
+def format_regressions(regressions):
+    """
+    Formats the regressions of a comparison as a table.
+
+    Args:
+    regressions (list of Regression): The regressions to report.
+
+    Returns:
+    str: The report, one line per regression.
+    """
+    lines = [
+        f"{'Day':>3}  {'Part':>4}  {'Scale':>8}  {'Metric':<11}  {'Baseline':>12}  {'Candidate':>12}  {'Ratio':>7}"
+    ]
+    for regression in regressions:
+        if regression.metric == "wall_time":
+            baseline, candidate = f"{regression.baseline:.4f}s", f"{regression.candidate:.4f}s"
+        else:
+            baseline, candidate = f"{regression.baseline / 2**20:.2f}MiB", f"{regression.candidate / 2**20:.2f}MiB"
+        lines.append(
+            f"{regression.day:>3}  {regression.part:>4}  {regression.scale:>8g}  {regression.metric:<11}"
+            f"  {baseline:>12}  {candidate:>12}  {regression.ratio:>6.2f}x"
+        )
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compare the stored benchmark runs of two commits.")
+    parser.add_argument("baseline", help="commit to compare against, e.g. main or HEAD~1")
+    parser.add_argument("candidate", nargs="?", default="HEAD", help="commit to check (default: HEAD)")
+    parser.add_argument("--results-dir", type=Path, default=DEFAULT_RESULTS_DIR,
+                        help="directory of the stored benchmark runs")
+    parser.add_argument("--machine", help="fingerprint of the machine the runs were taken on (default: this one)")
+    parser.add_argument("--time-threshold", type=float, default=DEFAULT_TIME_THRESHOLD,
+                        help="relative growth of the time that counts as a regression")
+    parser.add_argument("--memory-threshold", type=float, default=DEFAULT_MEMORY_THRESHOLD,
+                        help="relative growth of the peak memory that counts as a regression")
+    parser.add_argument("--min-time", type=float, default=DEFAULT_MIN_TIME,
+                        help="timings in seconds below which measurements are not compared")
+    args = parser.parse_args(argv)
+
+    def load(revision):
+        run = load_run(resolve_commit(revision), args.results_dir, args.machine)
+        if run is None:
+            parser.error(f"no benchmark run of {revision} stored for machine {args.machine or machine_fingerprint()}")
+        return run
+
+    baseline, candidate = load(args.baseline), load(args.candidate)
+
+    regressions = compare_runs(baseline, candidate, args.time_threshold, args.memory_threshold, args.min_time)
+    print(f"Comparing {candidate['commit']} against {baseline['commit']} on machine {candidate['machine']}")
+    if not regressions:
+        print("No regressions")
+        return
+    print(format_regressions(regressions))
+    sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
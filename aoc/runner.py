@@ -0,0 +1,625 @@
+"""
+Runs the solutions of a whole season in a single process pool and reports how long every part took.
+
+Every day lives in its own ``Day_XX/main.py`` script that exposes ``parse_input(input_data)``, which turns
+the raw input into an immutable model, and ``part1(model)`` and ``part2(model)``, which solve the parts on
+that model. The runner discovers these scripts and executes each day as a separate task in a process pool:
+the input is parsed once, both parts are solved on the result, and the wall-clock and CPU time of parsing
+and of every part are reported separately.
+
+Answers are cached on disk by aoc.cache, keyed by the input, the solver's source and the part, so
+repeated runs with unchanged code and input return immediately. Cached answers are marked in the report,
+and --no-cache bypasses the cache completely.
+
+With --profile, every part is profiled instead by aoc.profiling: the runner prints the functions with the
+highest cumulative time and writes pstats and collapsed stack files for flame graph tools. With --memory,
+aoc.memory traces the allocations of every part in a fresh process and the runner emits the peak and
+retained memory and the lines holding the most memory at the peak and after the part as JSON.
+
+The days that took longest in the previous run are started first. With --time-budget or --memory-budget,
+every day runs in a supervised worker of aoc.scheduler instead, where parsing or a part that runs over its
+budget is stopped and reported as failed without holding up the rest of the season.
+
+Usage:
+    python -m aoc.runner [DAY ...] [--workers N] [--season-dir DIR] [--no-cache]
+    python -m aoc.runner [DAY ...] [--time-budget SECONDS] [--memory-budget MIB]
+    python -m aoc.runner DAY ... --profile [--top N] [--sample-interval MS] [--profile-dir DIR]
+    python -m aoc.runner DAY ... --memory [--top N] [--json PATH]
+"""
+
+import argparse
+import importlib
+import importlib.util
+import json
+import os
+import time
+from collections import deque
+from dataclasses import asdict, dataclass, replace
+from functools import partial
+from operator import attrgetter
+from pathlib import Path
+
+from aoc.cache import DEFAULT_CACHE_DIR, DEFAULT_MAX_BYTES, ResultCache, cache_key
+from aoc.days import module_name_of
+from aoc.inputs import STDIN, day_input_options, default_input, open_input
+from aoc.scheduler import load_timings, longest_first, save_timings
+
+# The process pools, the supervised workers, the profilers and tracemalloc are imported by the functions
+# using them, so that solving a single day doesn't pay for importing them
+
+# Directory holding the Day_XX folders of the season solved in this repository
+DEFAULT_SEASON_DIR = Path(__file__).resolve().parent.parent / "2023"
+
+# Name of the function parsing the input of a day into the model both parts are solved on
+PARSER = "parse_input"
+
+# Names of the functions every day exposes, in the order they are run
+PARTS = ("part1", "part2")
+
+# Part number of the results that time the parsing of an input
+PARSE = 0
+
+# File in the cache directory with the time every day took in the last run
+TIMINGS_FILE = "timings.json"
+
+# Modules already imported by this process, keyed by the path of their script
+_loaded_days = {}
+
+# Marks a cache miss, since None is a valid answer
+_NOT_CACHED = object()
+
+
+@dataclass(frozen=True)
+class PartResult:
+    """
+    Outcome of running one part of one day.
+
+    Attributes:
+    day (int): The day of the puzzle.
+    part (int): The part of the puzzle (1 or 2), or PARSE for the parsing of the input.
+    answer (object): The value returned by the solver, or None if it failed or for parsing.
+    wall_time (float): Elapsed wall-clock time of the solver in seconds.
+    cpu_time (float): CPU time consumed by the solver in seconds.
+    error (str): Description of the exception raised by the solver, if any.
+    cached (bool): Whether the answer was taken from the result cache, timings then cover the lookup.
+    """
+
+    day: int
+    part: int
+    answer: object
+    wall_time: float
+    cpu_time: float
+    error: str = None
+    cached: bool = False
+
+
+def discover_days(season_dir=DEFAULT_SEASON_DIR):
+    """
+    Finds the solution script of every day in a season directory.
+
+    Args:
+    season_dir (str or Path): Directory containing the Day_XX folders.
+
+    Returns:
+    dict: Mapping of day number to the path of its main.py, sorted by day.
+    """
+    return {
+        int(path.parent.name.removeprefix("Day_")): path
+        for path in sorted(Path(season_dir).glob("Day_[0-9]*/main.py"))
+    }
+
+
+def load_day(script_path, reload=False):
+    """
+    Imports the solution script of a day, reusing the module if it was imported before.
+
+    Days of the seasons in this repository are imported by their name from aoc.days, so they are shared
+    with the code importing them by name. Scripts elsewhere are executed by path.
+
+    Args:
+    script_path (str or Path): Path to the day's main.py.
+    reload (bool): Whether to execute the script again even if it was imported before.
+
+    Returns:
+    module: The imported day module.
+    """
+    module_name = module_name_of(script_path)
+    if module_name is not None:
+        module = importlib.import_module(module_name)
+        return importlib.reload(module) if reload else module
+
+    script_path = Path(script_path)
+    module = _loaded_days.get(script_path)
+    if module is None or reload:
+        module_name = script_path.parent.name.lower()
+        spec = importlib.util.spec_from_file_location(module_name, script_path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        _loaded_days[script_path] = module
+    return module
+
+
+def parse_day_input(module, input_data):
+    """
+    Parses an input into the model both parts of a day are solved on.
+
+    Days without a parse_input() are solved on the raw input, which only works for the "text" input mode.
+
+    Args:
+    module (module): The imported day module.
+    input_data (object): The input as loaded in the mode of the day.
+
+    Returns:
+    object: The model returned by the day's parse_input().
+    """
+    parser = getattr(module, PARSER, None)
+    return input_data if parser is None else parser(input_data)
+
+
+def solve(module, part, input_data):
+    """
+    Parses an input and solves a single part on it.
+
+    Args:
+    module (module): The imported day module.
+    part (int): The part of the puzzle (1 or 2).
+    input_data (object): The input as loaded in the mode of the day.
+
+    Returns:
+    object: The answer of the part.
+    """
+    return getattr(module, PARTS[part - 1])(parse_day_input(module, input_data))
+
+
+def solve_day(day, script_path, input_path=None, cache=None, *, parts=None, progress=None):
+    """
+    Parses the input of a day once, solves both parts on it and measures the wall-clock and CPU time of each.
+
+    The input is loaded in the mode the day selects. Reading a whole file is not included in the measured
+    time, while days that consume their input lazily read it while parsing it. With a cache, stored answers
+    are returned without running their solver, the input is only parsed if an answer is missing, and new
+    answers are stored.
+
+    Args:
+    day (int): The day of the puzzle.
+    script_path (str or Path): Path to the day's main.py.
+    input_path (str or Path): Input file or STDIN, defaults to the input.txt next to the script or its
+    compressed archive.
+    cache (ResultCache): Cache of the answers, or None to always run the solvers.
+    parts (iterable of int): The parts to solve, defaults to all parts.
+    progress (callable): Called with ("start", part) before parsing, as part PARSE, and before solving a
+    part, and with ("result", PartResult) once it is done.
+
+    Returns:
+    list of PartResult: The timings of parsing as part PARSE, unless every answer was cached, followed by
+    the answers and timings of the parts.
+    """
+    module = load_day(script_path)
+    input_path = input_path or default_input(script_path)
+    parts = range(1, len(PARTS) + 1) if parts is None else sorted(parts)
+    progress = progress or (lambda message: None)
+    if input_path == STDIN:
+        # Standard input can only be read once, so it cannot be hashed for the cache before it is parsed
+        cache = None
+
+    results, keys = {}, {}
+    if cache is not None:
+        for part in parts:
+            wall_start, cpu_start = time.perf_counter(), time.process_time()
+            keys[part] = cache_key(input_path, module, PARTS[part - 1])
+            answer = cache.get(keys[part], _NOT_CACHED)
+            if answer is not _NOT_CACHED:
+                wall_time, cpu_time = time.perf_counter() - wall_start, time.process_time() - cpu_start
+                results[part] = PartResult(day, part, answer, wall_time, cpu_time, cached=True)
+                progress(("result", results[part]))
+        if len(results) == len(parts):
+            return [results[part] for part in parts]
+
+    with open_input(input_path, *day_input_options(module)) as input_data:
+        progress(("start", PARSE))
+        wall_start, cpu_start = time.perf_counter(), time.process_time()
+        model = parse_day_input(module, input_data)
+        wall_time, cpu_time = time.perf_counter() - wall_start, time.process_time() - cpu_start
+        parse_result = PartResult(day, PARSE, None, wall_time, cpu_time)
+        progress(("result", parse_result))
+
+        # The parts run while the input is still open, in case the model refers to the loaded input
+        for part in parts:
+            if part in results:
+                continue
+            solver = getattr(module, PARTS[part - 1])
+            progress(("start", part))
+            wall_start, cpu_start = time.perf_counter(), time.process_time()
+            try:
+                answer = solver(model)
+            except Exception as error:  # pylint: disable=broad-except
+                # Keep the result of the other part
+                results[part] = PartResult(day, part, None, 0.0, 0.0, f"{type(error).__name__}: {error}")
+                progress(("result", results[part]))
+                continue
+            wall_time, cpu_time = time.perf_counter() - wall_start, time.process_time() - cpu_start
+            results[part] = PartResult(day, part, answer, wall_time, cpu_time)
+            progress(("result", results[part]))
+            if cache is not None:
+                cache.put(keys[part], answer)
+
+    return [parse_result] + [results[part] for part in parts]
+
+
+def run_season(days, workers=None, cache=None, input_path=None):
+    """
+    Runs every day in a process pool, parsing its input once for both parts.
+
+    A single day, or a single worker, runs in this process instead, as starting a pool would take longer
+    than the parallelism saves.
+
+    Args:
+    days (dict): Mapping of day number to the path of its main.py.
+    workers (int): Number of worker processes, defaults to the number of CPUs.
+    cache (ResultCache): Cache of the answers, or None to always run the solvers.
+    input_path (str or Path): Input file of every day, defaults to the input.txt of each day. Standard input
+    can only be read by a day that runs in this process.
+
+    Returns:
+    list of PartResult: The results ordered by day, with the parsing of each day before its parts.
+    """
+
+    def collect(day, solve_once):
+        try:
+            return solve_once()
+        except Exception as error:  # pylint: disable=broad-except
+            # Report the failure of one day without losing the results of the others
+            error_message = f"{type(error).__name__}: {error}"
+            return [PartResult(day, part, None, 0.0, 0.0, error_message) for part in range(1, len(PARTS) + 1)]
+
+    if len(days) == 1 or workers == 1:
+        return [
+            result
+            for day, script_path in days.items()
+            for result in collect(day, partial(solve_day, day, script_path, input_path, cache))
+        ]
+
+    from concurrent.futures import ProcessPoolExecutor  # pylint: disable=import-outside-toplevel
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            day: executor.submit(solve_day, day, script_path, input_path, cache) for day, script_path in days.items()
+        }
+        return [result for day, future in futures.items() for result in collect(day, future.result)]
+
+
+def _solve_supervised(report, day, script_path, parts, *, cache=None, input_path=None):
+    # Task of run_budgeted(), reporting the start and result of parsing and of every part to the supervisor
+    solve_day(day, script_path, input_path, cache, parts=parts, progress=report)
+
+
+def _memory_budget_error(memory_budget):
+    # Reports a phase that was stopped or failed for running over the memory budget
+    return f"exceeded the memory budget of {memory_budget / 2**20:g} MiB"
+
+
+def _budget_error(error, memory_budget):
+    # Explains a MemoryError raised because the memory budget was exhausted
+    if memory_budget is not None and error and error.startswith("MemoryError"):
+        return _memory_budget_error(memory_budget)
+    return error
+
+
+def run_budgeted(days, workers=None, cache=None, *, time_budget=None, memory_budget=None, input_path=None):
+    """
+    Runs every day in supervised worker processes, stopping the parsing or a part that runs over its budget.
+
+    Parsing and every part get the whole budget each. A part that runs over a budget is killed and reported
+    as failed, and the remaining parts of its day are run again in a new worker. If parsing runs over a
+    budget, no part of the day can be solved.
+
+    Args:
+    days (dict): Mapping of day number to the path of its main.py, in the order to start them.
+    workers (int): Number of worker processes, defaults to the number of CPUs.
+    cache (ResultCache): Cache of the answers, or None to always run the solvers.
+    time_budget (float): Seconds parsing and every part may take, or None for no limit.
+    memory_budget (int): Bytes the resident memory of parsing and every part may grow by, or None for no limit.
+    input_path (str or Path): Input file of every day, defaults to the input.txt of each day.
+
+    Returns:
+    list of PartResult: The results ordered by day, with the parsing of each day before its parts.
+    """
+    from aoc.scheduler import supervise  # pylint: disable=import-outside-toplevel
+
+    all_parts = tuple(range(1, len(PARTS) + 1))
+    tasks = deque((day, script_path, all_parts) for day, script_path in days.items())
+    results, solved, phases = [], set(), {}
+
+    solve_task = partial(_solve_supervised, cache=cache, input_path=input_path)
+    for event in supervise(solve_task, tasks, workers, time_budget, memory_budget):
+        day, script_path, parts = event.task
+        if event.kind == "message":
+            kind, value = event.message
+            if kind == "start":
+                phases[day] = value
+            else:
+                results.append(replace(value, error=_budget_error(value.error, memory_budget)))
+                solved.add((day, value.part))
+            continue
+
+        phase = phases.pop(day, None)
+        if event.kind == "done":
+            continue
+
+        # The worker was stopped in the middle of the task
+        if event.kind == "timeout":
+            error = f"exceeded the time budget of {time_budget:g}s"
+        elif event.kind == "memory":
+            error = _memory_budget_error(memory_budget)
+        else:
+            error = _budget_error(event.message, memory_budget)
+        remaining = [part for part in parts if (day, part) not in solved]
+        if phase in remaining:
+            results.append(PartResult(day, phase, None, event.elapsed, 0.0, error))
+            remaining.remove(phase)
+            if remaining:
+                tasks.append((day, script_path, tuple(remaining)))
+        else:
+            # Parsing or loading the day failed, so none of the remaining parts can be solved
+            if phase == PARSE:
+                error = f"parsing {error}"
+            results.extend(PartResult(day, part, None, 0.0, 0.0, error) for part in remaining)
+
+    return sorted(results, key=attrgetter("day", "part"))
+
+
+def profile_part(day, part, script_path, output_dir, *, top=20, sample_interval=None, input_path=None):
+    """
+    Profiles a single part of a day and writes its pstats and collapsed stack files.
+
+    Args:
+    day (int): The day of the puzzle.
+    part (int): The part of the puzzle (1 or 2).
+    script_path (str or Path): Path to the day's main.py.
+    output_dir (str or Path): Directory of the profile files, which are named dayXX_partY.*.
+    top (int): Number of functions to report.
+    sample_interval (float): Interval of the sampling profiler in seconds, or None to skip sampling.
+    input_path (str or Path): Input file, defaults to the input.txt next to the script or its compressed archive.
+
+    Returns:
+    PartProfile: The answer, the hot functions and the written files of the part.
+    """
+    from aoc.profiling import PartProfile, profile_solver  # pylint: disable=import-outside-toplevel
+
+    module = load_day(script_path)
+    input_path = input_path or default_input(script_path)
+
+    # Parsing is profiled together with the part, as its cost is part of solving the puzzle
+    answer, wall_time, functions, files = profile_solver(
+        partial(solve, module, part),
+        partial(open_input, input_path, *day_input_options(module)),
+        Path(output_dir) / f"day{day:02d}_part{part}",
+        top,
+        sample_interval,
+    )
+    return PartProfile(day, part, answer, wall_time, functions, files)
+
+
+def run_profiles(days, output_dir, top=20, sample_interval=None, workers=None):
+    """
+    Profiles every part of the given days in a process pool.
+
+    Args:
+    days (dict): Mapping of day number to the path of its main.py.
+    output_dir (str or Path): Directory of the profile files.
+    top (int): Number of functions to report per part.
+    sample_interval (float): Interval of the sampling profiler in seconds, or None to skip sampling.
+    workers (int): Number of worker processes, defaults to the number of CPUs.
+
+    Returns:
+    list of PartProfile: The profiles ordered by day and part.
+    """
+    from concurrent.futures import ProcessPoolExecutor  # pylint: disable=import-outside-toplevel
+
+    from aoc.profiling import PartProfile  # pylint: disable=import-outside-toplevel
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            (day, part): executor.submit(
+                profile_part, day, part, script_path, output_dir, top=top, sample_interval=sample_interval
+            )
+            for day, script_path in days.items()
+            for part in range(1, len(PARTS) + 1)
+        }
+
+        profiles = []
+        for (day, part), future in futures.items():
+            try:
+                profiles.append(future.result())
+            except Exception as error:  # pylint: disable=broad-except
+                profiles.append(PartProfile(day, part, None, 0.0, [], [], f"{type(error).__name__}: {error}"))
+    return profiles
+
+
+def trace_part(day, part, script_path, top=10, input_path=None):
+    """
+    Traces the memory allocations of a single part of a day.
+
+    Args:
+    day (int): The day of the puzzle.
+    part (int): The part of the puzzle (1 or 2).
+    script_path (str or Path): Path to the day's main.py.
+    top (int): Number of source lines to report.
+    input_path (str or Path): Input file, defaults to the input.txt next to the script or its compressed archive.
+
+    Returns:
+    MemoryReport: The answer and the memory use of the part.
+    """
+    from aoc.memory import MemoryReport, trace_solver  # pylint: disable=import-outside-toplevel
+
+    module = load_day(script_path)
+    input_path = input_path or default_input(script_path)
+
+    with open_input(input_path, *day_input_options(module)) as input_data:
+        answer, *memory_use = trace_solver(partial(solve, module, part), input_data, top)
+    return MemoryReport(day, part, answer, *memory_use)
+
+
+def run_memory_traces(days, top=10, workers=None):
+    """
+    Traces the memory allocations of every part of the given days in a process pool.
+
+    Every part runs in a fresh process, so the memory retained by one part is not attributed to another.
+
+    Args:
+    days (dict): Mapping of day number to the path of its main.py.
+    top (int): Number of source lines to report per part.
+    workers (int): Number of worker processes, defaults to the number of CPUs.
+
+    Returns:
+    list of MemoryReport: The reports ordered by day and part.
+    """
+    from concurrent.futures import ProcessPoolExecutor  # pylint: disable=import-outside-toplevel
+
+    from aoc.memory import MemoryReport  # pylint: disable=import-outside-toplevel
+
+    with ProcessPoolExecutor(max_workers=workers, max_tasks_per_child=1) as executor:
+        futures = {
+            (day, part): executor.submit(trace_part, day, part, script_path, top)
+            for day, script_path in days.items()
+            for part in range(1, len(PARTS) + 1)
+        }
+
+        reports = []
+        for (day, part), future in futures.items():
+            try:
+                reports.append(future.result())
+            except Exception as error:  # pylint: disable=broad-except
+                reports.append(MemoryReport(day, part, None, 0, 0, [], [], f"{type(error).__name__}: {error}"))
+    return reports
+
+
+def format_report(results, total_wall_time):
+    """
+    Formats the results of a run as a table.
+
+    Args:
+    results (list of PartResult): The results to report.
+    total_wall_time (float): Elapsed wall-clock time of the whole run in seconds.
+
+    Returns:
+    str: The report, one line per parsed input and per part followed by the totals.
+    """
+    lines = [f"{'Day':>3}  {'Part':>5}  {'Answer':<20}  {'Wall [s]':>10}  {'CPU [s]':>10}"]
+    for result in results:
+        if result.part == PARSE:
+            lines.append(
+                f"{result.day:>3}  {'parse':>5}  {'':<20}  {result.wall_time:>10.4f}  {result.cpu_time:>10.4f}"
+            )
+            continue
+        if result.error:
+            lines.append(f"{result.day:>3}  {result.part:>5}  failed: {result.error}")
+            continue
+        lines.append(
+            f"{result.day:>3}  {result.part:>5}  {str(result.answer):<20}"
+            f"  {result.wall_time:>10.4f}  {result.cpu_time:>10.4f}{'  (cached)' if result.cached else ''}"
+        )
+    lines.append(
+        f"{'Total':<32}  {total_wall_time:>10.4f}  {sum(result.cpu_time for result in results):>10.4f}"
+    )
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run the solutions of a season and time every part.")
+    parser.add_argument("days", nargs="*", type=int, help="days to run (default: all)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="number of worker processes")
+    parser.add_argument("--season-dir", type=Path, default=DEFAULT_SEASON_DIR,
+                        help="directory containing the Day_XX folders")
+    parser.add_argument("--input", help='input file of a single day, "-" for standard input (default: input.txt)')
+    parser.add_argument("--no-cache", action="store_true", help="run every solver, bypassing the result cache")
+    parser.add_argument("--cache-dir", type=Path, default=DEFAULT_CACHE_DIR, help="directory of the result cache")
+    parser.add_argument("--cache-size", type=float, default=DEFAULT_MAX_BYTES / 2**20,
+                        help="size of the result cache in MiB before old answers are evicted")
+    parser.add_argument("--clear-cache", action="store_true", help="remove all cached answers before running")
+    parser.add_argument("--profile", action="store_true", help="profile every part and report its hot functions")
+    parser.add_argument("--profile-dir", type=Path, default=Path("profiles"),
+                        help="directory of the pstats and collapsed stack files")
+    parser.add_argument("--memory", action="store_true",
+                        help="trace the peak and retained memory of every part and emit them as JSON")
+    parser.add_argument("--json", type=Path, help="write the memory report to this file instead of printing it")
+    parser.add_argument("--top", type=int, default=20,
+                        help="number of functions or source lines reported per profiled or traced part")
+    parser.add_argument("--sample-interval", type=float, default=0.0,
+                        help="also run a sampling profiler with this interval in milliseconds")
+    parser.add_argument("--time-budget", type=float,
+                        help="seconds parsing and every part may take before their worker is killed")
+    parser.add_argument("--memory-budget", type=float,
+                        help="MiB parsing and every part may grow their memory by before it is killed (Linux only)")
+    args = parser.parse_args(argv)
+
+    days = discover_days(args.season_dir)
+    if args.days:
+        unknown_days = set(args.days) - days.keys()
+        if unknown_days:
+            parser.error(f"no solution found for day(s) {', '.join(map(str, sorted(unknown_days)))}")
+        days = {day: days[day] for day in sorted(args.days)}
+    if args.input and len(days) != 1:
+        parser.error("--input needs exactly one day")
+    if args.input and (args.profile or args.memory):
+        parser.error("--input cannot be combined with --profile or --memory")
+    budgeted = args.time_budget is not None or args.memory_budget is not None
+    if args.input == STDIN and budgeted:
+        parser.error("standard input cannot be passed to the supervised workers of --time-budget and --memory-budget")
+
+    if args.profile:
+        sample_interval = args.sample_interval / 1000 if args.sample_interval > 0 else None
+        profiles = run_profiles(days, args.profile_dir, args.top, sample_interval, args.workers)
+        from aoc.profiling import format_profile_report  # pylint: disable=import-outside-toplevel
+
+        print(format_profile_report(profiles))
+        return
+
+    if args.memory:
+        reports = run_memory_traces(days, args.top, args.workers)
+        # Answers that JSON cannot represent are written as strings
+        report = json.dumps([asdict(report) for report in reports], indent=2, default=str)
+        if args.json:
+            args.json.write_text(report + "\n")
+        else:
+            print(report)
+        return
+
+    cache = ResultCache(args.cache_dir, int(args.cache_size * 2**20))
+    if args.clear_cache:
+        cache.clear()
+
+    # Start the days that took longest before, so no worker is left with a long day at the end
+    timings_path = args.cache_dir / TIMINGS_FILE
+    days = longest_first(days, load_timings(timings_path))
+
+    wall_start = time.perf_counter()
+    if budgeted:
+        memory_budget = None if args.memory_budget is None else int(args.memory_budget * 2**20)
+        results = run_budgeted(
+            days,
+            args.workers,
+            None if args.no_cache else cache,
+            time_budget=args.time_budget,
+            memory_budget=memory_budget,
+            input_path=args.input,
+        )
+    else:
+        results = run_season(days, args.workers, None if args.no_cache else cache, args.input)
+    wall_time = time.perf_counter() - wall_start
+    # The results of a day stay together with the parsing first
+    results.sort(key=attrgetter("day"))
+    print(format_report(results, wall_time))
+
+    if args.input:
+        # The timings are only comparable on the inputs of the days
+        return
+    timings = {}
+    for result in results:
+        if not result.cached:
+            timings[result.day] = timings.get(result.day, 0.0) + result.wall_time
+    save_timings(timings_path, timings)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,310 @@
+"""
+Supervised worker processes with time and memory budgets, and the historic timings to order work by.
+
+A ProcessPoolExecutor cannot stop a task that runs too long, so the supervised pool keeps its own worker
+processes, each connected to the parent by a pipe. A task reports its progress through that pipe, and
+every report starts a new phase with a fresh budget: the worker is killed once a phase takes longer than
+the time budget or once its resident memory grew by more than the memory budget, and a new worker takes
+its place. The parent polls the resident memory of the workers, so that a task running out of memory is
+stopped before the interpreter is. As a backstop against allocations faster than the polling, the address
+space of a worker is limited to its size at the start of the phase plus twice the budget. Reading the
+resident memory and limiting the address space need /proc and the resource module, so the memory budget
+is only enforced on Linux.
+
+To keep all workers busy until the end, the longest tasks should start first. The time every day took in
+earlier runs is kept in a small JSON file for that purpose.
+
+Usage:
+    for event in supervise(function, deque(tasks), workers=4, time_budget=10.0):
+        ...
+"""
+
+import json
+import os
+import signal
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+try:
+    import resource
+except ImportError:
+    # The resource module is not available on Windows
+    resource = None
+
+# Seconds between two checks of the resident memory of the workers
+MEMORY_POLL_INTERVAL = 0.01
+
+# Multiple of the memory budget a worker may grow its address space by, before allocations fail in the worker
+ADDRESS_SPACE_FACTOR = 2
+
+# Signals a worker dies of when it runs out of memory: SIGABRT if the interpreter cannot recover from a
+# MemoryError, SIGKILL from the kernel's out-of-memory killer
+_OUT_OF_MEMORY_SIGNALS = tuple(-getattr(signal, name) for name in ("SIGABRT", "SIGKILL") if hasattr(signal, name))
+
+
+@dataclass(frozen=True)
+class WorkerEvent:
+    """
+    Something that happened to a task in the supervised pool.
+
+    Attributes:
+    kind (str): "message" for a report of the task, "done" once it returned, "error" if it raised,
+    "timeout" or "memory" if its worker was stopped for running over the time or memory budget, and "crash"
+    if its worker died for another reason.
+    task (tuple): The arguments of the task.
+    message (object): The report for "message" events, the description of the exception for "error" and
+    "crash" events, and the last report before the worker was stopped for "timeout" and "memory" events.
+    elapsed (float): Seconds since the last report of the task.
+    """
+
+    kind: str
+    task: tuple
+    message: object = None
+    elapsed: float = 0.0
+
+
+def _memory_size(pid="self", field=0):
+    # Size of the address space (field 0) or the resident memory (field 1) of a process in bytes, or None if
+    # it cannot be determined
+    try:
+        with open(f"/proc/{pid}/statm") as statm:
+            return int(statm.read().split()[field]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def limit_memory(budget):
+    """
+    Limits the address space of the current process to its current size plus a budget.
+
+    Args:
+    budget (int): Number of bytes the process may still allocate, or None to lift the limit.
+
+    Returns:
+    bool: Whether the limit could be set on this platform.
+    """
+    if resource is None:
+        return False
+    _, hard_limit = resource.getrlimit(resource.RLIMIT_AS)
+    if budget is None:
+        resource.setrlimit(resource.RLIMIT_AS, (hard_limit, hard_limit))
+        return True
+
+    size = _memory_size()
+    if size is None:
+        return False
+    limit = size + budget
+    if hard_limit != resource.RLIM_INFINITY:
+        limit = min(limit, hard_limit)
+    resource.setrlimit(resource.RLIMIT_AS, (limit, hard_limit))
+    return True
+
+
+def _worker(connection, function, memory_budget):
+    # Runs the tasks sent by the parent until it sends None or closes the pipe. The parent enforces the memory
+    # budget, the limit of the address space only stops allocations it would be too late for.
+    if memory_budget is not None:
+        memory_budget *= ADDRESS_SPACE_FACTOR
+
+    def report(message):
+        # Every report starts a new phase, which gets the whole memory budget again
+        limit_memory(None)
+        connection.send(("message", message))
+        limit_memory(memory_budget)
+
+    while True:
+        try:
+            task = connection.recv()
+        except EOFError:
+            return
+        if task is None:
+            return
+        try:
+            limit_memory(memory_budget)
+            function(report, *task)
+        except Exception as error:  # pylint: disable=broad-except
+            limit_memory(None)
+            connection.send(("error", f"{type(error).__name__}: {error}"))
+        else:
+            limit_memory(None)
+            connection.send(("done", None))
+
+
+class _Worker:
+    """One supervised worker process, with the task it is running and the start of the task's current phase."""
+
+    def __init__(self, function, memory_budget):
+        import multiprocessing  # pylint: disable=import-outside-toplevel
+
+        self.connection, child_connection = multiprocessing.Pipe()
+        self.process = multiprocessing.Process(
+            target=_worker, args=(child_connection, function, memory_budget), daemon=True
+        )
+        self.process.start()
+        child_connection.close()
+        self.task = None
+        self.last_message = None
+        self.last_report = 0.0
+        self.resident_size = None
+
+    def start(self, task):
+        self.task, self.last_message = task, None
+        self.connection.send(task)
+        self.start_phase()
+
+    def start_phase(self):
+        # Both budgets start afresh with every phase
+        self.last_report = time.perf_counter()
+        self.resident_size = _memory_size(self.process.pid, 1)
+
+    def memory_growth(self):
+        # Bytes the resident memory grew by in the current phase, or None if it cannot be determined
+        size = _memory_size(self.process.pid, 1)
+        if size is None or self.resident_size is None:
+            return None
+        return size - self.resident_size
+
+    def stop(self):
+        if self.process.is_alive():
+            try:
+                self.connection.send(None)
+            except OSError:
+                pass
+            self.process.join(1.0)
+        if self.process.is_alive():
+            self.process.kill()
+        self.process.join()
+        self.connection.close()
+
+    def kill(self):
+        self.process.kill()
+        self.process.join()
+        self.connection.close()
+
+
+def supervise(function, tasks, workers=None, time_budget=None, memory_budget=None):
+    """
+    Runs tasks in supervised worker processes, stopping every phase of a task that runs over its budgets.
+
+    The function is called in a worker as function(report, *task). Calling report(message) sends the
+    message to the parent and starts a new phase of the task, which gets the whole time and memory budget
+    again. When a phase runs over a budget, its worker is killed and replaced by a new one. A worker that
+    dies of SIGABRT or SIGKILL while there is a memory budget ran out of memory, and is reported as running
+    over the memory budget as well.
+
+    Args:
+    function (callable): The function running a task, which must be picklable.
+    tasks (collections.deque): The argument tuples of the tasks in the order to run them. Tasks appended
+    while the events are consumed are run as well.
+    workers (int): Number of worker processes, defaults to the number of CPUs.
+    time_budget (float): Seconds every phase may take, or None for no limit.
+    memory_budget (int): Bytes every phase may grow the resident memory of its worker by, or None for no
+    limit.
+
+    Yields:
+    WorkerEvent: The reports and the outcome of every task, as they happen.
+    """
+    # Imported here, as the timings of this module are needed by every run but supervision is not
+    from multiprocessing.connection import wait  # pylint: disable=import-outside-toplevel
+
+    workers = workers or os.cpu_count()
+    pool = []
+    try:
+        while tasks or any(worker.task is not None for worker in pool):
+            # Hand out tasks to idle workers, starting new ones as long as there are fewer than allowed
+            for worker in pool:
+                if tasks and worker.task is None:
+                    worker.start(tasks.popleft())
+            while tasks and len(pool) < workers:
+                pool.append(_Worker(function, memory_budget))
+                pool[-1].start(tasks.popleft())
+
+            busy = [worker for worker in pool if worker.task is not None]
+            timeout = None
+            if time_budget is not None:
+                now = time.perf_counter()
+                timeout = max(0.0, min(worker.last_report + time_budget - now for worker in busy))
+            if memory_budget is not None:
+                timeout = MEMORY_POLL_INTERVAL if timeout is None else min(timeout, MEMORY_POLL_INTERVAL)
+
+            ready = wait([worker.connection for worker in busy], timeout)
+            now = time.perf_counter()
+            for worker in busy:
+                task, elapsed = worker.task, now - worker.last_report
+                if worker.connection in ready:
+                    try:
+                        kind, message = worker.connection.recv()
+                    except EOFError:
+                        worker.kill()
+                        pool[pool.index(worker)] = _Worker(function, memory_budget)
+                        exit_code = worker.process.exitcode
+                        if memory_budget is not None and exit_code in _OUT_OF_MEMORY_SIGNALS:
+                            yield WorkerEvent("memory", task, worker.last_message, elapsed)
+                        else:
+                            yield WorkerEvent("crash", task, f"worker exited with code {exit_code}", elapsed)
+                        continue
+                    if kind == "message":
+                        worker.last_message = message
+                        worker.start_phase()
+                    else:
+                        worker.task = None
+                    yield WorkerEvent(kind, task, message, elapsed)
+                elif time_budget is not None and elapsed >= time_budget:
+                    worker.kill()
+                    pool[pool.index(worker)] = _Worker(function, memory_budget)
+                    yield WorkerEvent("timeout", task, worker.last_message, elapsed)
+                elif memory_budget is not None and (worker.memory_growth() or 0) > memory_budget:
+                    worker.kill()
+                    pool[pool.index(worker)] = _Worker(function, memory_budget)
+                    yield WorkerEvent("memory", task, worker.last_message, elapsed)
+    finally:
+        for worker in pool:
+            worker.stop()
+
+
+def load_timings(path):
+    """
+    Reads the time every day took in earlier runs.
+
+    Args:
+    path (str or Path): The JSON file of the timings.
+
+    Returns:
+    dict: Mapping of day number to seconds, empty if there were no earlier runs.
+    """
+    try:
+        return {int(day): seconds for day, seconds in json.loads(Path(path).read_text()).items()}
+    except (OSError, ValueError):
+        return {}
+
+
+def save_timings(path, timings):
+    """
+    Writes the time every day took, keeping the timings of the days that were not run.
+
+    Args:
+    path (str or Path): The JSON file of the timings.
+    timings (dict): Mapping of day number to seconds.
+    """
+    path = Path(path)
+    merged = load_timings(path)
+    merged.update(timings)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps({str(day): seconds for day, seconds in sorted(merged.items())}, indent=2) + "\n")
+
+
+def longest_first(days, timings):
+    """
+    Orders days so that the ones that took longest in earlier runs start first.
+
+    Days without an earlier timing might take arbitrarily long, so they start before all others.
+
+    Args:
+    days (dict): Mapping of day number to the path of its main.py.
+    timings (dict): Mapping of day number to seconds from earlier runs.
+
+    Returns:
+    dict: The same mapping, ordered by decreasing expected time.
+    """
+    return dict(sorted(days.items(), key=lambda item: -timings.get(item[0], float("inf"))))
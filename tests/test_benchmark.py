@@ -0,0 +1,55 @@
+"""
+Tests of the complexity fit and the measurements of aoc.benchmark.
+"""
+
+import random
+import unittest
+
+from aoc.benchmark import Measurement, fit_exponent, measure, summarize
+from aoc.generators import generate
+from aoc.runner import discover_days
+
+
+class FitExponentTest(unittest.TestCase):
+    def test_power_laws(self):
+        for exponent in (0, 0.5, 1, 1.5, 2, 3):
+            for factor in (1e-6, 1, 250):
+                points = [(scale, factor * scale**exponent) for scale in (0.1, 1, 10, 100)]
+                with self.subTest(exponent=exponent, factor=factor):
+                    self.assertAlmostEqual(fit_exponent(points), exponent)
+
+    def test_noisy_timings(self):
+        # Timings off by up to 10% in either direction still give the exponent to a tenth
+        rng = random.Random(2)
+        points = [(scale, 0.01 * scale**2 * rng.uniform(0.9, 1.1)) for scale in (1, 2, 5, 10, 20, 50, 100)]
+        self.assertAlmostEqual(fit_exponent(points), 2, delta=0.1)
+
+    def test_missing_values(self):
+        points = [(1, 3.0), (10, 30.0), (100, None), (1000, 0)]
+        self.assertAlmostEqual(fit_exponent(points), 1)
+        self.assertIsNone(fit_exponent([(1, 3.0), (1, 4.0), (10, None)]))
+        self.assertIsNone(fit_exponent([]))
+
+    def test_summarize(self):
+        measurements = [
+            Measurement(1, part, scale, 100 * scale, 0.001 * scale**part, 1000 * scale)
+            for part in (1, 2)
+            for scale in (1, 10, 100)
+        ]
+        summary = summarize(measurements)
+        self.assertEqual(sorted(summary), [(1, 1), (1, 2)])
+        for (_, part), (time_exponent, memory_exponent) in summary.items():
+            self.assertAlmostEqual(time_exponent, part)
+            self.assertAlmostEqual(memory_exponent, 1)
+
+
+class MeasureTest(unittest.TestCase):
+    def test_input_size_in_bytes(self):
+        measurement = measure(1, 1, 0.1, 0, discover_days()[1])
+        self.assertEqual(measurement.input_size, len(generate(1, 0.1, 0).encode()))
+        self.assertGreater(measurement.wall_time, 0)
+        self.assertIsNone(measurement.peak_memory)
+
+
+if __name__ == "__main__":
+    unittest.main()
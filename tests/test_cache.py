@@ -0,0 +1,91 @@
+"""
+Tests of the answer cache of aoc.cache and its use by the runner.
+"""
+
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+from aoc.cache import ResultCache, cache_key
+from aoc.runner import load_day, solve_day
+
+DAY = """
+def parse_input(input_data):
+    return input_data.split()
+
+def part1(words):
+    return len(words)
+
+def part2(words):
+    return max(words)
+"""
+
+MISSING = object()
+
+
+class ResultCacheTest(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = Path(directory.name)
+        self.script_path = self.directory / "Day_01" / "main.py"
+        self.script_path.parent.mkdir()
+        self.script_path.write_text(DAY)
+        self.input_path = self.directory / "input.txt"
+        self.input_path.write_text("a b c\n")
+        self.cache = ResultCache(self.directory / "cache")
+
+    def test_hit(self):
+        key = cache_key(self.input_path, load_day(self.script_path), "part1")
+        self.assertIs(self.cache.get(key, MISSING), MISSING)
+        self.assertTrue(self.cache.put(key, 3))
+        self.assertEqual(self.cache.get(key, MISSING), 3)
+
+    def test_miss_after_source_edit(self):
+        key = cache_key(self.input_path, load_day(self.script_path), "part1")
+        self.cache.put(key, 3)
+
+        self.script_path.write_text(DAY.replace("len(words)", "len(words) + 1"))
+        edited_key = cache_key(self.input_path, load_day(self.script_path, reload=True), "part1")
+        self.assertNotEqual(edited_key, key)
+        self.assertIs(self.cache.get(edited_key, MISSING), MISSING)
+
+    def test_miss_after_input_edit(self):
+        module = load_day(self.script_path)
+        key = cache_key(self.input_path, module, "part1")
+        self.input_path.write_text("a b c d\n")
+        self.assertNotEqual(cache_key(self.input_path, module, "part1"), key)
+
+    def test_parts_have_their_own_keys(self):
+        module = load_day(self.script_path)
+        self.assertNotEqual(cache_key(self.input_path, module, "part1"), cache_key(self.input_path, module, "part2"))
+
+    def test_unserializable_answers_are_not_stored(self):
+        self.assertFalse(self.cache.put("tuple", (1, 2)))
+        self.assertFalse(self.cache.put("set", {1, 2}))
+        self.assertIs(self.cache.get("tuple", MISSING), MISSING)
+
+    def test_evicts_least_recently_used(self):
+        for age, key in enumerate(("newest", "middle", "oldest")):
+            self.cache.put(key, "x" * 100)
+            os.utime(self.cache.directory / f"{key}.json", (1000 - age, 1000 - age))
+        # Reading an entry makes it the most recently used one
+        self.cache.get("oldest")
+        entry_size = (self.cache.directory / "newest.json").stat().st_size
+
+        self.cache.max_bytes = 2 * entry_size
+        self.assertEqual(self.cache.evict(), 1)
+        self.assertIs(self.cache.get("middle", MISSING), MISSING)
+        self.assertEqual(self.cache.get("newest"), "x" * 100)
+        self.assertEqual(self.cache.get("oldest"), "x" * 100)
+
+    def test_runner_marks_cached_answers(self):
+        first = solve_day(1, self.script_path, self.input_path, self.cache)
+        second = solve_day(1, self.script_path, self.input_path, self.cache)
+        self.assertEqual([(result.answer, result.cached) for result in first[1:]], [(3, False), ("c", False)])
+        self.assertEqual([(result.answer, result.cached) for result in second], [(3, True), ("c", True)])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,76 @@
+"""
+Tests of the warm daemon of aoc.daemon.
+"""
+
+import os
+import socket
+import tempfile
+import textwrap
+import threading
+import unittest
+from pathlib import Path
+
+from aoc.daemon import DaemonServer, Workspace, send_request, solve_request
+
+DAY = textwrap.dedent(
+    """
+    def parse_input(input_data):
+        return tuple(map(int, input_data.split()))
+
+    def part1(numbers):
+        return sum(numbers)
+
+    def part2(numbers):
+        return max(numbers)
+    """
+)
+
+
+@unittest.skipUnless(hasattr(socket, "AF_UNIX"), "the daemon listens on a Unix socket")
+class DaemonTest(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.script_path = Path(directory.name) / "Day_01" / "main.py"
+        self.script_path.parent.mkdir()
+        self.script_path.write_text(DAY)
+        self.input_path = self.script_path.parent / "input.txt"
+        self.input_path.write_text("1 2 3\n")
+
+        self.socket_path = Path(directory.name) / "daemon.sock"
+        server = DaemonServer(self.socket_path, Workspace({1: self.script_path}))
+        thread = threading.Thread(target=server.serve_forever)
+        thread.start()
+        self.addCleanup(thread.join)
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+
+    def solve(self, input_path=None):
+        response = send_request(solve_request(1, input_path), self.socket_path)
+        return response, [(result["part"], result["answer"], result["cached"]) for result in response["results"]]
+
+    def test_names_the_default_input(self):
+        response, results = self.solve()
+        self.assertEqual(response["input"], str(self.input_path.resolve()))
+        self.assertIn(str(self.script_path.resolve()), response["sources"])
+        self.assertEqual(results, [(0, None, False), (1, 6, False), (2, 3, False)])
+
+    def test_reparses_a_changed_input(self):
+        self.solve()
+        _, results = self.solve()
+        self.assertEqual(results, [(1, 6, True), (2, 3, True)])
+
+        self.input_path.write_text("1 2 3 4\n")
+        os.utime(self.input_path, ns=(0, 0))
+        _, results = self.solve()
+        self.assertEqual(results, [(0, None, False), (1, 10, False), (2, 4, False)])
+
+    def test_names_a_missing_input(self):
+        other_input = self.input_path.with_name("missing.txt")
+        response = send_request(solve_request(1, other_input), self.socket_path)
+        self.assertIn("FileNotFoundError", response["error"])
+        self.assertEqual(response["input"], str(other_input.resolve()))
+
+
+if __name__ == "__main__":
+    unittest.main()
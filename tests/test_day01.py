@@ -0,0 +1,174 @@
+"""
+Tests of the scans of Day 1 against a straightforward reference, sequentially, in parallel and with NumPy.
+"""
+
+import random
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from aoc.optional import numpy_available
+from aoc.y2023 import day01
+
+# Fragments of random lines, with words that overlap like "oneight", "twone" and "eightwo"
+FRAGMENTS = ["one", "two", "three", "eight", "nine", "seven", "on", "tw", "e", "n", "o", "x", "1", "5", "9", "0"]
+
+
+def reference_values(line, words):
+    # The digits at every position of the line, including spelled out ones that overlap others
+    values = []
+    for index, char in enumerate(line):
+        if char.isdigit():
+            values.append(int(char))
+        elif words:
+            values.extend(digit for word, digit in day01.DIGIT_WORDS.items() if line.startswith(word, index))
+    return values
+
+
+def reference_scan(line):
+    digits, values = reference_values(line, False), reference_values(line, True)
+    return (
+        10 * digits[0] + digits[-1] if digits else None,
+        10 * values[0] + values[-1] if values else None,
+    )
+
+
+def reference_sums(lines):
+    values = [reference_scan(line) for line in lines if line]
+    total1 = None if any(value1 is None for value1, _ in values) else sum(value1 for value1, _ in values)
+    return total1, sum(value2 or 0 for _, value2 in values)
+
+
+def random_line(rng, digits=True):
+    fragments = FRAGMENTS if digits else [fragment for fragment in FRAGMENTS if not fragment.isdigit()]
+    return "".join(rng.choice(fragments) for _ in range(rng.randint(1, 8)))
+
+
+def random_document(rng, lines, line_break="\n"):
+    # Lines with digits, mixed with blank lines, and a final line break only sometimes
+    rows = [random_line(rng) if rng.random() > 0.1 else "" for _ in range(lines)]
+    return line_break.join(rows) + rng.choice(["", line_break])
+
+
+class ScanLineTest(unittest.TestCase):
+    def test_overlapping_words(self):
+        cases = {
+            "oneight": (None, 18),
+            "twone": (None, 21),
+            "eightwo": (None, 82),
+            "xtwone3four": (33, 24),
+            "7": (77, 77),
+            "one": (None, 11),
+            "1eightwo": (11, 12),
+            "sevenine2": (22, 72),
+            "abc": (None, None),
+        }
+        for line, values in cases.items():
+            with self.subTest(line=line):
+                self.assertEqual(day01.scan_line(line), values)
+                self.assertEqual(day01.scan_line(line), reference_scan(line))
+
+    def test_random_lines(self):
+        rng = random.Random(16)
+        for _ in range(2000):
+            line = random_line(rng, digits=rng.random() > 0.2)
+            with self.subTest(line=line):
+                self.assertEqual(day01.scan_line(line), reference_scan(line))
+                self.assertEqual(day01.scan_line(line, digits=False), (None, reference_scan(line)[1]))
+
+    def test_automaton(self):
+        # The automaton reaches the value of the longest pattern ending at every position of a text
+        patterns = {"aab": 1, "ab": 2, "b": 3, "bab": 4, "abba": 5}
+        transitions, values = day01.build_automaton(patterns)
+        rng = random.Random(16)
+        for _ in range(200):
+            text = "".join(rng.choice("abc") for _ in range(rng.randint(0, 12)))
+            state, found = 0, []
+            for char in text:
+                state = transitions[state].get(char, 0)
+                found.append(values[state])
+            expected = [
+                max(((len(pattern), value) for pattern, value in patterns.items() if text[: end + 1].endswith(pattern)),
+                    default=(0, None))[1]
+                for end in range(len(text))
+            ]
+            with self.subTest(text=text):
+                self.assertEqual(found, expected)
+
+    def test_sums(self):
+        rng = random.Random(16)
+        for _ in range(100):
+            text = random_document(rng, 20)
+            with self.subTest(text=text):
+                self.assertEqual(day01.parse_input(text), reference_sums(text.splitlines()))
+        self.assertEqual(day01.parse_input("1abc2\nxtwone\n"), (None, 12 + 21))
+        self.assertEqual(day01.parse_input(day01.SAMPLE_INPUT_2), (None, 281))
+
+
+class ParseFileTest(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = Path(directory.name) / "input.txt"
+        # Split even small files, into blocks of a few bytes that end inside lines
+        for name, value in (("PARALLEL_THRESHOLD", 0), ("BLOCK_SIZE", 7)):
+            patcher = mock.patch.object(day01, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def assert_parses(self, text, workers=1):
+        self.path.write_bytes(text.encode())
+        self.assertEqual(day01.parse_file(self.path, workers), day01.parse_input(text.replace("\r\n", "\n")))
+
+    def test_documents(self):
+        rng = random.Random(17)
+        for line_break in ("\n", "\r\n"):
+            for lines in (1, 2, 5, 40):
+                for _ in range(10):
+                    text = random_document(rng, lines, line_break)
+                    with self.subTest(text=text):
+                        self.assert_parses(text)
+
+    def test_chunk_sizes(self):
+        text = random_document(random.Random(17), 200)
+        for block_size in (1, 2, 13, 1 << 20):
+            with self.subTest(block_size=block_size), mock.patch.object(day01, "BLOCK_SIZE", block_size):
+                self.assert_parses(text)
+
+    def test_line_without_digit(self):
+        self.assert_parses("1abc2\n\nxtwone\r\n3\n")
+        self.assertIsNone(day01.parse_file(self.path, 1)[0])
+
+    def test_worker_processes(self):
+        self.assert_parses(random_document(random.Random(17), 100), workers=2)
+
+    def test_without_numpy(self):
+        text = random_document(random.Random(17), 100, "\r\n")
+        with mock.patch.object(day01, "numpy_available", return_value=False):
+            with mock.patch.object(day01, "sum_digit_values", side_effect=AssertionError("NumPy is not installed")):
+                self.assert_parses(text)
+
+
+@unittest.skipUnless(numpy_available(), "NumPy is not installed")
+class SumDigitValuesTest(unittest.TestCase):
+    def test_against_part1(self):
+        rng = random.Random(18)
+        for line_break in ("\n", "\r\n"):
+            for lines in (1, 2, 5, 40):
+                for _ in range(20):
+                    text = random_document(rng, lines, line_break)
+                    with self.subTest(text=text):
+                        total1, _ = day01.sum_calibration_values(text.splitlines())
+                        self.assertEqual(day01.sum_digit_values(text.encode()), total1)
+
+    def test_edge_cases(self):
+        self.assertEqual(day01.sum_digit_values(b""), 0)
+        self.assertEqual(day01.sum_digit_values(b"\n\r\n\n"), 0)
+        self.assertEqual(day01.sum_digit_values(b"7"), 77)
+        self.assertEqual(day01.sum_digit_values(b"a1b2c3\r\n45\n"), 13 + 45)
+        self.assertIsNone(day01.sum_digit_values(b"1\ntwo\n3"))
+
+
+if __name__ == "__main__":
+    unittest.main()
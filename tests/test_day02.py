@@ -0,0 +1,55 @@
+"""
+Tests of the limit index of Day 2, against the parts and a scan of all games.
+"""
+
+import random
+import unittest
+
+from aoc.generators import generate
+from aoc.y2023 import day02
+
+
+def scan_limits(games, red, green, blue):
+    # The sums of the limit index, found by looking at every game
+    id_sum = power_sum = 0
+    for game_id, max_red, max_green, max_blue in zip(*games):
+        if max_red <= red and max_green <= green and max_blue <= blue:
+            id_sum += game_id
+            power_sum += max_red * max_green * max_blue
+    return id_sum, power_sum
+
+
+class LimitIndexTest(unittest.TestCase):
+    def setUp(self):
+        self.games = day02.parse_input(generate(2, scale=1, seed=1))
+        self.index = day02.build_limit_index(self.games)
+
+    def test_sample(self):
+        games = day02.parse_input(day02.SAMPLE_INPUT_1)
+        self.assertEqual(day02.query_limits(day02.build_limit_index(games), 12, 13, 14), (8, 96))
+
+    def test_part1_limits(self):
+        id_sum, _ = day02.query_limits(self.index, *day02.CUBE_LIMITS)
+        self.assertEqual(id_sum, day02.part1(self.games))
+
+    def test_unlimited(self):
+        _, power_sum = day02.query_limits(self.index, 10**9, 10**9, 10**9)
+        self.assertEqual(power_sum, day02.part2(self.games))
+
+    def test_random_limits(self):
+        rng = random.Random(2)
+        # Limits below, between and above the maxima of the games, including ones matching a maximum exactly
+        largest = max(max(column) for column in self.games[1:]) + 2
+        for _ in range(500):
+            limits = [rng.randint(-1, largest) for _ in range(3)]
+            with self.subTest(limits=limits):
+                self.assertEqual(day02.query_limits(self.index, *limits), scan_limits(self.games, *limits))
+
+    def test_too_many_cells(self):
+        games = day02.parse_input("".join(f"Game {n}: {n} red, {n} green, {n} blue\n" for n in range(1, 300)))
+        with self.assertRaises(ValueError):
+            day02.build_limit_index(games)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,73 @@
+"""
+Tests of the banded scan of Day 3 files against the sequential scan.
+"""
+
+import random
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from aoc.inputs import split_file
+from aoc.y2023 import day03
+
+
+def random_schematic(rng, height, width, line_break="\n"):
+    # Rows of numbers and symbols with some empty rows, and a final line break only sometimes
+    rows = [
+        "".join(rng.choice("......0123456789*#") for _ in range(width)) if rng.random() > 0.1 else ""
+        for _ in range(height)
+    ]
+    return line_break.join(rows) + rng.choice(["", line_break])
+
+
+class BandTest(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = Path(directory.name) / "input.txt"
+
+    def assert_bands_match(self, text):
+        # Every split of the file into bands, up to a band per row, sums up like the sequential scan
+        self.path.write_bytes(text.encode())
+        expected = day03.parse_file(self.path, workers=1)
+        for bands in range(1, text.count("\n") + 3):
+            ranges = split_file(self.path, bands)
+            with self.subTest(text=text, bands=len(ranges)):
+                band_results = [day03.scan_file_band(self.path, start, end) for start, end in ranges]
+                self.assertEqual(day03.merge_bands(band_results), expected)
+        return expected
+
+    def test_sample(self):
+        self.assertEqual(self.assert_bands_match(day03.SAMPLE_INPUT_1.lstrip()), (4361, 467835))
+
+    def test_gears_on_band_borders(self):
+        # The gear is in a band of its own, between the bands of both its numbers
+        self.assertEqual(self.assert_bands_match("12.\n.*.\n.34\n"), (46, 12 * 34))
+        # Numbers next to the gear in the rows above and below and in its own row
+        self.assertEqual(self.assert_bands_match("2..\n.*3\n"), (5, 6))
+        self.assertEqual(self.assert_bands_match("7.5\n.*.\n"), (12, 35))
+        # Three numbers make no gear, even if they are in three bands
+        self.assertEqual(self.assert_bands_match("1..\n.*2\n..3"), (6, 0))
+        # Empty rows between a gear and a number break their adjacency
+        self.assertEqual(self.assert_bands_match("1..\n\n.*.\n.2.\n"), (2, 0))
+
+    def test_random_schematics(self):
+        rng = random.Random(23)
+        for line_break in ("\n", "\r\n"):
+            for height, width in ((1, 5), (2, 3), (5, 8), (12, 10)):
+                for _ in range(10):
+                    text = random_schematic(rng, height, width, line_break)
+                    # Empty files are never split
+                    if text:
+                        self.assert_bands_match(text)
+
+    def test_worker_processes(self):
+        self.path.write_bytes(random_schematic(random.Random(23), 60, 20).encode())
+        expected = day03.parse_file(self.path, workers=1)
+        with mock.patch.object(day03, "PARALLEL_THRESHOLD", 0):
+            self.assertEqual(day03.parse_file(self.path, workers=2), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,104 @@
+"""
+Tests of the NumPy engines of Day 4 against the set-based parser and their fallbacks without NumPy.
+"""
+
+import random
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from aoc.optional import numpy_available
+from aoc.y2023 import day04
+
+
+def random_cards(rng, cards, highest=99, final_line_break=True):
+    # Cards laid out like the puzzle input, with small number ranges giving duplicates and many matches
+    lines = []
+    for card_id in range(1, cards + 1):
+        winning = " ".join(f"{rng.randint(1, highest):2}" for _ in range(5))
+        player = " ".join(f"{rng.randint(1, highest):2}" for _ in range(8))
+        lines.append(f"Card {card_id:3}: {winning} | {player}")
+    return "\n".join(lines) + ("\n" if final_line_break else "")
+
+
+@unittest.skipUnless(numpy_available(), "NumPy is not installed")
+class VectorizedTest(unittest.TestCase):
+    def test_against_sets(self):
+        rng = random.Random(25)
+        for cards in (1, 2, 7, 50):
+            for highest in (5, 20, 99):
+                for final_line_break in (True, False):
+                    text = random_cards(rng, cards, highest, final_line_break)
+                    # A single card without a line break has no layout to compare with, and is parsed by sets
+                    expected = day04.parse_input(text) if "\n" in text else None
+                    with self.subTest(text=text):
+                        self.assertEqual(day04.count_matches_vectorized(text.encode()), expected)
+
+    def test_blocks(self):
+        text = random_cards(random.Random(25), 50, 20)
+        for block_size in (1, 3, 49, 50):
+            with self.subTest(block_size=block_size), mock.patch.object(day04, "CARD_BLOCK_SIZE", block_size):
+                self.assertEqual(day04.count_matches_vectorized(text.encode()), day04.parse_input(text))
+
+    def test_duplicate_numbers(self):
+        # Every number counts once, however often it is repeated on either side
+        text = "Card 1:  5  5 12 | 12  5  5  5  7\nCard 2:  1  1  1 |  2  3  1  1  1\n"
+        self.assertEqual(day04.parse_input(text), bytes([2, 1]))
+        self.assertEqual(day04.count_matches_vectorized(text.encode()), bytes([2, 1]))
+
+    def test_other_layouts(self):
+        cases = [
+            "Card 9: 1 | 1\nCard 10: 1 | 1\n",
+            "Card 1:  1 |  1  2\nCard 2:  1  2 |  1\n",
+            "Card 1: 100 | 100\n",
+            "Card 1:  1 |  1",
+        ]
+        for text in cases:
+            with self.subTest(text=text):
+                self.assertIsNone(day04.count_matches_vectorized(text.encode()))
+
+    def test_total_points(self):
+        rng = random.Random(25)
+        card_matches = bytes(rng.randint(0, 10) for _ in range(1000))
+        # Far fewer cards than VECTORIZE_CARDS are summed without NumPy
+        expected = day04.calculate_total_points(card_matches)
+        self.assertEqual(expected, sum(2 ** (matches - 1) for matches in card_matches if matches))
+        with mock.patch.object(day04, "VECTORIZE_CARDS", 0):
+            self.assertEqual(day04.calculate_total_points(card_matches), expected)
+            # Points that overflow 64 bits are summed without NumPy
+            self.assertEqual(day04.calculate_total_points(bytes([70, 3])), 2**69 + 4)
+
+
+class FallbackTest(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = Path(directory.name) / "input.txt"
+
+    def test_parse_file(self):
+        text = random_cards(random.Random(25), 30, 20)
+        self.path.write_text(text)
+        with mock.patch.object(day04, "VECTORIZE_THRESHOLD", 0):
+            self.assertEqual(day04.parse_file(self.path), day04.parse_input(text))
+            with mock.patch.object(day04, "numpy_available", return_value=False):
+                with mock.patch.object(day04, "count_matches_vectorized", side_effect=AssertionError("no NumPy")):
+                    self.assertEqual(day04.parse_file(self.path), day04.parse_input(text))
+
+    def test_parse_file_of_other_layouts(self):
+        text = "".join(f"Card {card_id}: {card_id} 5 | 5 {card_id}\n" for card_id in range(1, 15))
+        self.path.write_text(text)
+        with mock.patch.object(day04, "VECTORIZE_THRESHOLD", 0):
+            self.assertEqual(day04.parse_file(self.path), day04.parse_input(text))
+
+    def test_total_points(self):
+        card_matches = bytes([0, 1, 2, 5, 0, 3])
+        with mock.patch.object(day04, "VECTORIZE_CARDS", 0):
+            with mock.patch.object(day04, "numpy_available", return_value=False):
+                self.assertEqual(day04.calculate_total_points(card_matches), 1 + 2 + 16 + 4)
+        self.assertEqual(day04.part1(day04.parse_input(day04.SAMPLE_INPUT)), 13)
+        self.assertEqual(day04.part2(day04.parse_input(day04.SAMPLE_INPUT)), 30)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,100 @@
+"""
+Tests of the strided views of aoc.grid against a grid of lists.
+"""
+
+import random
+import unittest
+
+from aoc.grid import DOWN, LEFT, RIGHT, UP, Grid
+
+
+def reference_transposed(rows):
+    return [list(column) for column in zip(*rows)]
+
+
+def reference_rotated(rows):
+    # One clockwise quarter turn: the first row is the first column read from bottom to top
+    return [list(column) for column in zip(*rows[::-1])]
+
+
+def as_lists(grid):
+    return [list(row) for row in grid.rows()]
+
+
+def random_grid(rng, height, width):
+    return Grid.from_text("\n".join("".join(rng.choice("#.O") for _ in range(width)) for _ in range(height)))
+
+
+class GridTest(unittest.TestCase):
+    def test_from_text(self):
+        grid = Grid.from_text("#..\n.#.\n\n")
+        self.assertEqual((grid.height, grid.width, len(grid)), (2, 3, 6))
+        self.assertEqual(grid[1, 1], ord("#"))
+        self.assertEqual(grid[4], ord("#"))
+        self.assertEqual(str(grid), "#..\n.#.")
+        with self.assertRaises(ValueError):
+            Grid.from_text("#..\n.#\n")
+
+    def test_out_of_bounds(self):
+        grid = Grid.filled(2, 3)
+        for position in ((2, 0), (0, 3), (-1, 0), (0, -1)):
+            with self.subTest(position=position), self.assertRaises(IndexError):
+                grid[position]  # pylint: disable=pointless-statement
+
+    def test_views_against_reference(self):
+        rng = random.Random(4)
+        for height, width in ((1, 1), (1, 5), (5, 1), (3, 4), (7, 7), (6, 11)):
+            grid = random_grid(rng, height, width)
+            rows = as_lists(grid)
+            with self.subTest(height=height, width=width):
+                self.assertEqual(as_lists(grid.transposed()), reference_transposed(rows))
+                self.assertEqual(as_lists(grid.transposed().transposed()), rows)
+
+                expected = rows
+                for turns in range(1, 5):
+                    expected = reference_rotated(expected)
+                    rotated = grid.rotated(turns)
+                    self.assertEqual(as_lists(rotated), expected)
+                    self.assertEqual((rotated.height, rotated.width), (len(expected), len(expected[0])))
+                    self.assertEqual([list(column) for column in rotated.columns()], reference_transposed(expected))
+                    self.assertEqual([rotated[y, x] for y in range(rotated.height) for x in range(rotated.width)],
+                                     [cell for row in expected for cell in row])
+                    self.assertEqual(as_lists(rotated.copy()), expected)
+                self.assertEqual(as_lists(grid.rotated(-1)), as_lists(grid.rotated(3)))
+
+    def test_combined_views(self):
+        # Views of views compose like the operations on the reference
+        rng = random.Random(5)
+        grid = random_grid(rng, 4, 6)
+        rows = as_lists(grid)
+        view = grid.rotated().transposed().rotated(2)
+        expected = reference_rotated(reference_rotated(reference_transposed(reference_rotated(rows))))
+        self.assertEqual(as_lists(view), expected)
+
+    def test_views_share_cells(self):
+        grid = Grid.from_text("ab\ncd\n")
+        rotated = grid.rotated()
+        rotated[0, 0] = ord("X")
+        self.assertEqual(str(grid), "ab\nXd")
+        self.assertFalse(rotated.is_contiguous)
+        self.assertTrue(rotated.copy().is_contiguous)
+
+        copy = rotated.copy()
+        copy[0, 0] = ord("Y")
+        self.assertEqual(str(grid), "ab\nXd")
+
+    def test_frozen(self):
+        frozen = Grid.from_text("ab\ncd\n").transposed().frozen()
+        self.assertEqual(str(frozen), "ac\nbd")
+        with self.assertRaises(TypeError):
+            frozen[0, 0] = ord("X")
+
+    def test_neighbors(self):
+        grid = Grid.filled(3, 4)
+        self.assertEqual(grid.neighbors(0), [grid.index(0, 1), grid.index(1, 0)])
+        self.assertEqual(grid.neighbors(grid.index(1, 1)), [1, 6, 9, 4])
+        self.assertEqual([grid.neighbor(11, direction) for direction in (UP, RIGHT, DOWN, LEFT)], [7, None, None, 10])
+
+
+if __name__ == "__main__":
+    unittest.main()
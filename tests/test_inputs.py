@@ -0,0 +1,160 @@
+"""
+Tests of the input loading of aoc.inputs, from files, compressed files and streams.
+"""
+
+import gzip
+import io
+import lzma
+import os
+import sys
+import tempfile
+import threading
+import unittest
+from contextlib import contextmanager
+from pathlib import Path
+from unittest import mock
+
+from aoc.inputs import STDIN, default_input, is_splittable, open_input, split_file
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+TEXT = "first line\nsecond line\n\nlast line\n"
+LINES = ["first line", "second line", "", "last line"]
+
+COMPRESSORS = {"gz": gzip.compress, "xz": lzma.compress}
+if zstandard is not None:
+    COMPRESSORS["zst"] = zstandard.ZstdCompressor().compress
+
+
+@contextmanager
+def _pipe(data):
+    # A raw binary stream that can neither seek nor peek, fed by a thread like a pipe from another process
+    read_end, write_end = os.pipe()
+
+    def feed():
+        with open(write_end, "wb") as writer:
+            writer.write(data)
+
+    feeder = threading.Thread(target=feed)
+    feeder.start()
+    with open(read_end, "rb", buffering=0) as reader:
+        yield reader
+    feeder.join()
+
+
+class OpenInputTest(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = Path(directory.name)
+
+    def write(self, name, data):
+        path = self.directory / name
+        path.write_bytes(data)
+        return path
+
+    def assert_loads(self, source, make_source=None):
+        # Opens the input in every mode, creating the source afresh for each mode if it is a stream
+        make_source = make_source or (lambda: source)
+        with open_input(make_source(), "text") as text:
+            self.assertEqual(text, TEXT)
+        with open_input(make_source(), "lines") as lines:
+            self.assertEqual(list(lines), LINES)
+        with open_input(make_source(), "mmap") as data:
+            self.assertEqual(bytes(data), TEXT.encode())
+
+    def test_file(self):
+        self.assert_loads(self.write("input.txt", TEXT.encode()))
+
+    def test_empty_file(self):
+        path = self.write("input.txt", b"")
+        with open_input(path, "mmap") as data:
+            self.assertEqual(data, b"")
+        with open_input(path, "lines") as lines:
+            self.assertEqual(list(lines), [])
+
+    def test_compressed_files(self):
+        for suffix, compress in COMPRESSORS.items():
+            with self.subTest(suffix=suffix):
+                self.assert_loads(self.write(f"input.txt.{suffix}", compress(TEXT.encode())))
+
+    def test_compression_is_recognized_by_content(self):
+        self.assert_loads(self.write("input.txt", gzip.compress(TEXT.encode())))
+
+    def test_multiple_gzip_members(self):
+        path = self.write("input.txt.gz", gzip.compress(b"first line\n") + gzip.compress(TEXT[11:].encode()))
+        with open_input(path, "lines") as lines:
+            self.assertEqual(list(lines), LINES)
+
+    def test_separator(self):
+        path = self.write("input.txt", b"a,b\nc,d\n")
+        with open_input(path, "lines", ",") as records:
+            self.assertEqual(list(records), ["a", "b\nc", "d"])
+
+    def test_unknown_mode(self):
+        with self.assertRaises(ValueError):
+            with open_input(self.write("input.txt", b""), "bytes"):
+                pass
+
+    def test_binary_and_text_streams(self):
+        self.assert_loads(None, lambda: io.BytesIO(TEXT.encode()))
+        self.assert_loads(None, lambda: io.StringIO(TEXT))
+
+    def test_compressed_pipes(self):
+        for suffix, compress in COMPRESSORS.items():
+            with self.subTest(suffix=suffix), _pipe(compress(TEXT.encode())) as pipe:
+                with open_input(pipe, "lines") as lines:
+                    self.assertEqual(list(lines), LINES)
+
+    def test_stdin(self):
+        for data in (TEXT.encode(), gzip.compress(TEXT.encode()), lzma.compress(TEXT.encode())):
+            with self.subTest(data=data[:2]):
+                with mock.patch.object(sys, "stdin", io.TextIOWrapper(io.BytesIO(data))):
+                    with open_input(STDIN, "text") as text:
+                        self.assertEqual(text, TEXT)
+
+    def test_stdin_is_not_splittable(self):
+        self.assertFalse(is_splittable(STDIN, 0))
+
+    def test_default_input(self):
+        script_path = self.directory / "main.py"
+        self.assertEqual(default_input(script_path), self.directory / "input.txt")
+        archive = self.write("input.txt.xz", lzma.compress(TEXT.encode()))
+        self.assertEqual(default_input(script_path), archive)
+        plain = self.write("input.txt", TEXT.encode())
+        self.assertEqual(default_input(script_path), plain)
+
+
+class SplitFileTest(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = Path(directory.name) / "input.txt"
+
+    def test_ranges_cover_whole_lines(self):
+        data = b"".join(b"%d\n" % number * (number % 7) for number in range(200))
+        self.path.write_bytes(data)
+        for chunks in (1, 2, 3, 10, 1000):
+            with self.subTest(chunks=chunks):
+                ranges = split_file(self.path, chunks)
+                self.assertEqual(b"".join(data[start:end] for start, end in ranges), data)
+                self.assertTrue(all(data[end - 1 : end] == b"\n" for _, end in ranges))
+                self.assertLessEqual(len(ranges), chunks)
+
+    def test_last_line_without_line_break(self):
+        self.path.write_bytes(b"a\nbb\nccc")
+        self.assertEqual(split_file(self.path, 3)[-1][1], 8)
+
+    def test_compressed_files_are_not_splittable(self):
+        self.path.write_bytes(gzip.compress(TEXT.encode()))
+        self.assertFalse(is_splittable(self.path, 0))
+        self.path.write_bytes(TEXT.encode())
+        self.assertTrue(is_splittable(self.path, 0))
+        self.assertFalse(is_splittable(self.path, len(TEXT) + 1))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,55 @@
+"""
+Tests of the memory instrumentation of aoc.memory.
+"""
+
+import time
+import unittest
+
+from aoc.memory import trace_solver
+
+CACHE = []
+
+
+def transient_solver(size):
+    # Holds a large buffer long enough to be sampled, then frees it before returning
+    buffer = bytearray(size)
+    time.sleep(0.05)
+    return len(buffer)
+
+
+def caching_solver(size):
+    CACHE.append(bytearray(size))
+    return size
+
+
+def lines(sites):
+    return [site.line for site in sites if site.filename == __file__]
+
+
+class TraceSolverTest(unittest.TestCase):
+    def tearDown(self):
+        CACHE.clear()
+
+    def test_transient_memory(self):
+        answer, peak_memory, retained_memory, top_lines, peak_lines = trace_solver(transient_solver, 10**6)
+        self.assertEqual(answer, 10**6)
+        self.assertGreaterEqual(peak_memory, 10**6)
+        self.assertLess(retained_memory, 10**4)
+        buffer_line = transient_solver.__code__.co_firstlineno + 2
+        self.assertEqual(lines(peak_lines)[:1], [buffer_line])
+        self.assertNotIn(buffer_line, lines(top_lines))
+
+    def test_retained_memory(self):
+        _, peak_memory, retained_memory, top_lines, _ = trace_solver(caching_solver, 10**6)
+        self.assertGreaterEqual(retained_memory, 10**6)
+        self.assertGreaterEqual(peak_memory, retained_memory)
+        self.assertEqual(lines(top_lines)[:1], [caching_solver.__code__.co_firstlineno + 1])
+
+    def test_input_is_not_counted(self):
+        input_data = bytearray(10**6)
+        _, peak_memory, _, _, _ = trace_solver(len, input_data)
+        self.assertLess(peak_memory, 10**4)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,115 @@
+"""
+Tests of the store of benchmark runs and the regression gate of aoc.results.
+"""
+
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from aoc.benchmark import Measurement
+from aoc.results import Regression, compare_runs, load_run, save_run
+
+MACHINE = "0123456789ab"
+
+
+def run(*measurements):
+    # A stored run with measurements given as (day, part, scale, wall_time, peak_memory)
+    return {
+        "measurements": [
+            {"day": day, "part": part, "scale": scale, "input_size": 100, "wall_time": wall_time, "peak_memory": peak}
+            for day, part, scale, wall_time, peak in measurements
+        ]
+    }
+
+
+class CompareRunsTest(unittest.TestCase):
+    def test_threshold(self):
+        baseline = run((1, 1, 1, 1.0, 1000), (1, 2, 1, 1.0, 1000))
+        candidate = run((1, 1, 1, 1.2, 1200), (1, 2, 1, 1.3, 1300))
+        self.assertEqual(compare_runs(baseline, candidate), [
+            Regression(1, 2, 1, "wall_time", 1.0, 1.3),
+            Regression(1, 2, 1, "peak_memory", 1000, 1300),
+        ])
+        self.assertEqual(compare_runs(baseline, candidate, time_threshold=0.5, memory_threshold=0.5), [])
+        self.assertEqual(len(compare_runs(baseline, candidate, time_threshold=0.1, memory_threshold=0.1)), 4)
+
+    def test_improvements_are_not_regressions(self):
+        self.assertEqual(compare_runs(run((1, 1, 1, 2.0, 2000)), run((1, 1, 1, 1.0, 1000))), [])
+
+    def test_min_time(self):
+        baseline = run((1, 1, 1, 0.001, None), (1, 2, 1, 0.001, None))
+        # Both are several times slower, but only the second one above the noise floor
+        candidate = run((1, 1, 1, 0.004, None), (1, 2, 1, 0.01, None))
+        regressions = compare_runs(baseline, candidate, min_time=0.005)
+        # The baseline is raised to the noise floor, so the ratio is not inflated by a tiny baseline time
+        self.assertEqual(regressions, [Regression(1, 2, 1, "wall_time", 0.005, 0.01)])
+        self.assertEqual(regressions[0].ratio, 2)
+        self.assertEqual(compare_runs(baseline, candidate, min_time=0.02), [])
+
+    def test_missing_and_new_parts(self):
+        baseline = run((1, 1, 1, 1.0, 1000), (2, 1, 1, 1.0, 1000), (3, 1, 10, 1.0, 1000))
+        # Day 2 was not measured, day 4 is new and day 3 was measured at another scale
+        candidate = run((1, 1, 1, 1.0, 1000), (3, 1, 1, 9.0, 9000), (4, 1, 1, 9.0, 9000))
+        self.assertEqual(compare_runs(baseline, candidate), [])
+
+    def test_unmeasured_values(self):
+        baseline = run((1, 1, 1, 1.0, None), (1, 2, 1, None, 0))
+        candidate = run((1, 1, 1, 1.0, 9000), (1, 2, 1, 9.0, 9000))
+        self.assertEqual(compare_runs(baseline, candidate), [])
+
+    def test_order(self):
+        baseline = run((2, 1, 1, 1.0, 1000), (1, 2, 10, 1.0, 1000), (1, 2, 1, 1.0, 1000))
+        candidate = run((2, 1, 1, 2.0, 1000), (1, 2, 10, 2.0, 1000), (1, 2, 1, 2.0, 1000))
+        regressions = compare_runs(baseline, candidate)
+        self.assertEqual([(regression.day, regression.part, regression.scale) for regression in regressions],
+                         [(1, 2, 1), (1, 2, 10), (2, 1, 1)])
+
+
+class LoadRunTest(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = Path(directory.name)
+
+    def store(self, name, commit):
+        path = self.directory / MACHINE / f"{name}.json"
+        path.parent.mkdir(exist_ok=True)
+        path.write_text(json.dumps({"commit": commit, "name": name}))
+
+    def load(self, commit):
+        stored = load_run(commit, self.directory, MACHINE)
+        return stored and stored["name"]
+
+    def test_latest_run_of_a_commit(self):
+        self.store("abc123-20240102T000000", "abc123")
+        self.store("abc123-20240103T000000", "abc123")
+        self.store("abc123-20240101T000000", "abc123")
+        self.store("def456-20240104T000000", "def456")
+        self.assertEqual(self.load("abc123"), "abc123-20240103T000000")
+        self.assertEqual(self.load("abc"), "abc123-20240103T000000")
+        self.assertIsNone(self.load("789"))
+
+    def test_dirty_runs(self):
+        self.store("abc123-20240101T000000", "abc123")
+        self.store("abc123-dirty-20240102T000000", "abc123-dirty")
+        # A run of uncommitted changes never stands in for the commit itself
+        self.assertEqual(self.load("abc123"), "abc123-20240101T000000")
+        self.assertEqual(self.load("abc123-dirty"), "abc123-dirty-20240102T000000")
+
+    def test_other_machine(self):
+        self.store("abc123-20240101T000000", "abc123")
+        self.assertIsNone(load_run("abc123", self.directory, "ba9876543210"))
+
+    def test_saved_run_is_loaded(self):
+        measurements = [Measurement(1, 1, 1, 100, 0.5, 1000), Measurement(1, 2, 1, 100, 0.25)]
+        path = save_run(measurements, {"seed": 0}, self.directory, commit="abc123")
+        stored = load_run("abc123", self.directory, path.parent.name)
+        self.assertEqual(stored["commit"], "abc123")
+        self.assertEqual(stored["settings"], {"seed": 0})
+        self.assertEqual([Measurement(**measurement) for measurement in stored["measurements"]], measurements)
+        self.assertEqual(compare_runs(stored, stored), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
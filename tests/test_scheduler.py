@@ -0,0 +1,153 @@
+"""
+Tests of the supervised workers of aoc.scheduler and of the budgets of the runner.
+"""
+
+import faulthandler
+import os
+import sys
+import tempfile
+import textwrap
+import time
+import unittest
+from collections import deque
+from pathlib import Path
+
+from aoc.runner import run_budgeted
+from aoc.scheduler import supervise
+
+MIB = 2**20
+
+# A day whose second part builds a deep recursion holding a MiB in every frame
+RECURSIVE_DAY = textwrap.dedent(
+    """
+    def parse_input(input_data):
+        return int(input_data)
+
+    def part1(depth):
+        return depth
+
+    def part2(depth):
+        def hold(level):
+            block = b"x" * 2**20
+            return len(block) if level == 0 else hold(level - 1) + len(block)
+        return hold(depth)
+    """
+)
+
+
+def _sleep(report, seconds, phases=1):
+    # Task sleeping in every phase
+    for phase in range(phases):
+        report(phase)
+        time.sleep(seconds)
+    return seconds
+
+
+def _fail(report):
+    # Task raising an exception
+    report("start")
+    raise KeyError("missing")
+
+
+def _exit(report, code):
+    # Task whose worker exits without a result
+    report("start")
+    os._exit(code)  # pylint: disable=protected-access
+
+
+def _allocate(report, megabytes):
+    # Task touching one MiB after the other, keeping all of them
+    report("start")
+    blocks = [b"x" * MIB for _ in range(megabytes)]
+    report("allocated")
+    return len(blocks)
+
+
+def _abort(report):
+    # Task dying of SIGABRT, as the interpreter does when it cannot recover from a MemoryError
+    report("start")
+    faulthandler.disable()
+    os.abort()
+
+
+def _events(function, tasks, workers=1, **budgets):
+    return list(supervise(function, deque(tasks), workers=workers, **budgets))
+
+
+def _outcomes(events):
+    # The final event of every task, without the reports
+    return [(event.kind, event.task) for event in events if event.kind != "message"]
+
+
+class SupervisorTest(unittest.TestCase):
+    def test_done(self):
+        events = _events(_sleep, [(0.0,), (0.01,)], workers=2)
+        self.assertEqual(sorted(_outcomes(events)), [("done", (0.0,)), ("done", (0.01,))])
+
+    def test_error(self):
+        events = _events(_fail, [()])
+        self.assertEqual(events[-1].kind, "error")
+        self.assertEqual(events[-1].message, "KeyError: 'missing'")
+
+    def test_timeout(self):
+        events = _events(_sleep, [(5.0,), (0.0,)], time_budget=0.2)
+        self.assertEqual(_outcomes(events), [("timeout", (5.0,)), ("done", (0.0,))])
+        timeout = events[1]
+        self.assertEqual(timeout.message, 0)
+        self.assertGreaterEqual(timeout.elapsed, 0.2)
+        self.assertLess(timeout.elapsed, 2.0)
+
+    def test_every_phase_gets_the_time_budget(self):
+        # Three phases of 0.15 seconds each take longer than the budget together, but none does on its own
+        events = _events(_sleep, [(0.15, 3)], time_budget=0.3)
+        self.assertEqual(_outcomes(events), [("done", (0.15, 3))])
+
+    def test_crash(self):
+        events = _events(_exit, [(3,), (0,)])
+        crashes = [event for event in events if event.kind == "crash"]
+        self.assertEqual(len(crashes), 2)
+        self.assertEqual(crashes[0].message, "worker exited with code 3")
+
+    def test_crash_with_memory_budget(self):
+        # Only deaths by the signals of running out of memory count against the memory budget
+        events = _events(_exit, [(3,)], memory_budget=64 * MIB)
+        self.assertEqual(events[-1].kind, "crash")
+
+
+@unittest.skipUnless(sys.platform == "linux", "the memory budget is only enforced on Linux")
+class MemoryBudgetTest(unittest.TestCase):
+    def test_within_budget(self):
+        events = _events(_allocate, [(4,)], memory_budget=64 * MIB)
+        self.assertEqual([event.kind for event in events], ["message", "message", "done"])
+
+    def test_over_budget(self):
+        events = _events(_allocate, [(256,), (4,)], memory_budget=32 * MIB)
+        kinds = [(event.kind, event.task) for event in events if event.kind != "message"]
+        self.assertEqual(kinds, [("memory", (256,)), ("done", (4,))])
+        self.assertEqual(events[1].message, "start")
+
+    def test_abort_with_memory_budget(self):
+        events = _events(_abort, [()], memory_budget=32 * MIB)
+        self.assertEqual(events[-1].kind, "memory")
+
+    def test_abort_without_memory_budget(self):
+        events = _events(_abort, [()])
+        self.assertEqual(events[-1].kind, "crash")
+        self.assertIn("exited with code", events[-1].message)
+
+    def test_runner_reports_deep_recursion(self):
+        with tempfile.TemporaryDirectory() as directory:
+            script_path = Path(directory) / "Day_01" / "main.py"
+            script_path.parent.mkdir()
+            script_path.write_text(RECURSIVE_DAY)
+            input_path = Path(directory) / "input.txt"
+            input_path.write_text("200\n")
+
+            results = run_budgeted({1: script_path}, workers=1, memory_budget=16 * MIB, input_path=input_path)
+
+        self.assertEqual([result.answer for result in results[:2]], [None, 200])
+        self.assertEqual(results[2].error, "exceeded the memory budget of 16 MiB")
+
+
+if __name__ == "__main__":
+    unittest.main()